@@ -13,15 +13,31 @@ from app.api.handlers import (
     http_exception_handler,
     request_validation_error_handler,
 )
+from app.core.clicks import click_aggregator, click_buffer
 from app.core.database import database
+from app.core.geo import geo_locator
+from app.core.passwords import password_hasher
 from app.core.settings import settings
-from app.redirector import redirector
+from app.core.slugs import slug_filter, slug_pool
+from app.redirector import RedirectMiddleware, redirector
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     await database.create_tables(hard_reset=False)
+    await geo_locator.refresh()
+    geo_locator.start()
+    click_buffer.start()
+    click_aggregator.start()
+    slug_pool.start()
+    slug_filter.start()
     yield
+    await slug_filter.stop()
+    await slug_pool.stop()
+    await click_aggregator.stop()
+    await click_buffer.stop()
+    await geo_locator.stop()
+    password_hasher.shutdown()
     await database.shutdown()
 
 
@@ -32,6 +48,10 @@ app: FastAPI = FastAPI(
     lifespan=lifespan,
     root_path_in_servers=False,
 )
+app.add_middleware(
+    RedirectMiddleware,
+    enabled=settings.redirect.FAST_PATH_ENABLED,
+)
 app.include_router(api)
 app.include_router(redirector)
 app.add_exception_handler(
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, status
 
 from app.api import responses
-from app.api.routes import auth, urls, users
+from app.api.routes import auth, metrics, stats, urls, users
 
 api: APIRouter = APIRouter(
     prefix="/api",
@@ -11,6 +11,8 @@ api: APIRouter = APIRouter(
 )
 api.include_router(users.router, tags=["Users"])
 api.include_router(urls.router, tags=["Urls"])
+api.include_router(stats.router, tags=["Stats"])
 api.include_router(auth.router, tags=["Auth"])
+api.include_router(metrics.router)
 
 __all__ = ["api"]
@@ -1,3 +1,6 @@
+from collections.abc import Iterable, Mapping
+from typing import Any
+
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
@@ -18,27 +21,51 @@ _ERRORS_MAP: dict[str, str] = {
 }
 
 
-def request_validation_error_handler(
-    _request: Request,
-    exc: RequestValidationError,
-) -> JSONResponse:
-    errors: list[schemes.Error] = []
-    for error in exc.errors():
+def validation_errors(
+    errors: Iterable[Mapping[str, Any]],
+    /,
+    *,
+    field_position: int = 1,
+) -> list[schemes.Error]:
+    """Convert validation error details to API errors.
+
+    Args:
+        errors: The validation error details, e.g. ` exc.errors() `.
+        field_position: The position of the field name in the error location.
+            Defaults to ` 1 `, right after the request part.
+
+    Returns:
+        One error per invalid field.
+    """
+    api_errors: list[schemes.Error] = []
+    for error in errors:
+        field: str = (
+            str(error["loc"][field_position])
+            if len(error["loc"]) > field_position
+            else "body"
+        )
         message: str = _ERRORS_MAP.get(
             error["type"],
             f"Invalid value ({error['type']})",
-        ).format(error["loc"][1])
+        ).format(field)
 
-        errors.append(
+        api_errors.append(
             schemes.Error(
                 message=message,
-                type=str(error["loc"][1]),
+                type=field,
             ),
         )
 
+    return api_errors
+
+
+def request_validation_error_handler(
+    _request: Request,
+    exc: RequestValidationError,
+) -> JSONResponse:
     return JSONResponse(
         content=schemes.ErrorResponse(
-            errors=errors,
+            errors=validation_errors(exc.errors()),
             message="Validation error",
             status=status.HTTP_422_UNPROCESSABLE_ENTITY,
         ).model_dump(mode="json"),
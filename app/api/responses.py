@@ -77,6 +77,16 @@ INVALID_TOKEN: dict[str, Any] = response(
     },
 )
 
+INACTIVE_USER: dict[str, Any] = response(
+    description="The authenticated user is not active.",
+    model=schemes.ErrorResponse,
+    example={
+        "errors": [],
+        "message": "Inactive user",
+        "status": status.HTTP_403_FORBIDDEN,
+    },
+)
+
 INTERNAL_SERVER_ERROR: dict[str, Any] = response(
     description="Unexpected error occurred. Please report this issue.",
     model=schemes.ErrorResponse,
@@ -4,12 +4,15 @@ from typing import Annotated
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app import crud
 from app.api import responses, schemes
 from app.core.auth import jwt
+from app.core.cache import UserRecord
 from app.core.database import database
 from app.core.database.models import User
+from app.core.passwords import password_hasher
 from app.core.settings import settings
 
 router: APIRouter = APIRouter(prefix="/auth")
@@ -116,6 +119,7 @@ async def register_user(
         last_name=create_user.last_name,
         email=create_user.email,
         password=create_user.password,
+        commit=False,
     )
     await crud.create_status(
         async_session=async_session,
@@ -203,9 +207,13 @@ async def authenticate_user(
     user: User | None = await crud.get_user_by_email(
         async_session=async_session,
         email=login_user.email,
+        options=(joinedload(User.status),),
     )
 
-    if not user or not user.is_password_valid(login_user.password):
+    if not user or not await password_hasher.verify(
+        login_user.password,
+        user.password,
+    ):
         raise HTTPException(
             detail="The email or password is incorrect",
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -226,6 +234,7 @@ async def authenticate_user(
             email=user.email,
             key=settings.jwt.SECRET,
             current_time=int(time.time()),
+            active=user.status is not None and user.status.active,
         ),
         max_age=settings.jwt.ACCESS_TOKEN_EXPIRES_IN_MINUTES * 60,
         secure=True,
@@ -239,6 +248,7 @@ async def authenticate_user(
             email=user.email,
             key=settings.jwt.SECRET,
             current_time=int(time.time()),
+            active=user.status is not None and user.status.active,
         ),
         max_age=settings.jwt.REFRESH_TOKEN_EXPIRES_IN_DAYS * 24 * 60 * 60,
         secure=True,
@@ -263,12 +273,13 @@ async def authenticate_user(
         ),
         status.HTTP_400_BAD_REQUEST: responses.INVALID_TOKEN,
         status.HTTP_401_UNAUTHORIZED: responses.UNAUTHORIZED,
+        status.HTTP_403_FORBIDDEN: responses.INACTIVE_USER,
         status.HTTP_422_UNPROCESSABLE_ENTITY: responses.INVALID_TOKEN,
     },
 )
 def refresh_user(
     user: Annotated[
-        User,
+        UserRecord,
         Depends(jwt.get_refreshed_user),
     ],
 ) -> JSONResponse:
@@ -287,6 +298,7 @@ def refresh_user(
             email=user.email,
             key=settings.jwt.SECRET,
             current_time=int(time.time()),
+            active=user.active,
         ),
         max_age=settings.jwt.ACCESS_TOKEN_EXPIRES_IN_MINUTES * 60,
         secure=True,
@@ -300,6 +312,7 @@ def refresh_user(
             email=user.email,
             key=settings.jwt.SECRET,
             current_time=int(time.time()),
+            active=user.active,
         ),
         max_age=settings.jwt.REFRESH_TOKEN_EXPIRES_IN_DAYS * 24 * 60 * 60,
         secure=True,
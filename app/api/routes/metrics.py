@@ -0,0 +1,59 @@
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+_bearer: HTTPBearer = HTTPBearer(auto_error=False)
+
+
+def _check_token(
+    credentials: Annotated[
+        HTTPAuthorizationCredentials | None,
+        Depends(_bearer),
+    ],
+) -> None:
+    """Check that the request carries the metrics token.
+
+    The metrics are only served when ` METRICS_TOKEN ` is set, to scrapers
+    sending it as a bearer token.
+
+    Args:
+        credentials: The bearer token of the request, if any.
+
+    Raises:
+        HTTPException: The metrics are disabled or the token is not valid.
+    """
+    if settings.metrics.TOKEN is None:
+        raise HTTPException(
+            detail="Not Found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(),
+        settings.metrics.TOKEN.encode(),
+    ):
+        raise HTTPException(
+            detail="Authentication required",
+            status_code=status.HTTP_401_UNAUTHORIZED,
+        )
+
+
+router: APIRouter = APIRouter(
+    prefix="/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(_check_token)],
+)
+
+
+@router.get("")
+def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        content=metrics.render(),
+        status_code=status.HTTP_200_OK,
+    )
@@ -0,0 +1,439 @@
+import base64
+import binascii
+import datetime
+from typing import TYPE_CHECKING, Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.api import responses, schemes
+from app.core.auth import jwt
+from app.core.clicks import HyperLogLog
+from app.core.database import database
+from app.core.settings import settings
+from app.core.settings.data import Stats
+from app.core.utils.timestamp import utcnow
+from app.crud.click import ClickCursor
+
+if TYPE_CHECKING:
+    from app.core.database.models import Click
+
+_HOUR: datetime.timedelta = datetime.timedelta(hours=1)
+_DAY: datetime.timedelta = datetime.timedelta(days=1)
+
+router: APIRouter = APIRouter(
+    prefix="/url",
+    responses={
+        status.HTTP_400_BAD_REQUEST: responses.INVALID_TOKEN,
+        status.HTTP_401_UNAUTHORIZED: responses.UNAUTHORIZED,
+        status.HTTP_403_FORBIDDEN: responses.INACTIVE_USER,
+        status.HTTP_404_NOT_FOUND: responses.response(
+            description="Url not found or not owned by the user.",
+            model=schemes.ErrorResponse,
+            example={
+                "errors": [],
+                "message": "Url not found",
+                "status": status.HTTP_404_NOT_FOUND,
+            },
+        ),
+    },
+)
+
+
+async def _check_url(
+    *,
+    session: AsyncSession,
+    url_id: int,
+    user_id: int,
+) -> None:
+    """Check that a ` Url ` exists and is owned by a ` User `.
+
+    Args:
+        session: The database session.
+        url_id: The unique identifier of the ` Url `.
+        user_id: The unique identifier of the ` User `.
+
+    Raises:
+        HTTPException: The ` Url ` does not exist or is not owned by the
+            ` User `.
+    """
+    if not await crud.get_url_by_id(
+        async_session=session,
+        url_id=url_id,
+        user_id=user_id,
+    ):
+        raise HTTPException(
+            detail="Url not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+
+def _get_range(
+    *,
+    start: datetime.date | None,
+    end: datetime.date | None,
+    granularity: schemes.Granularity,
+) -> tuple[datetime.date, datetime.date]:
+    """Resolve and validate the range of days of the statistics.
+
+    Args:
+        start: The first day, or ` None ` for the default range before ` end `.
+        end: The last day, or ` None ` for today.
+        granularity: The size of the buckets of the series.
+
+    Raises:
+        HTTPException: The range is empty or too long for the granularity.
+
+    Returns:
+        The first and last days of the range, both included.
+    """
+    end = end or utcnow().date()
+    start = start or end - datetime.timedelta(days=Stats.DEFAULT_DAYS - 1)
+    max_days: int = int(
+        Stats.MAX_HOURLY_DAYS
+        if granularity == schemes.Granularity.HOUR
+        else Stats.MAX_DAYS,
+    )
+
+    if start > end or (end - start).days >= max_days:
+        raise HTTPException(
+            detail=f"Range should span between 1 and {max_days} days",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    return start, end
+
+
+async def _get_series(
+    *,
+    session: AsyncSession,
+    url_id: int,
+    start: datetime.date,
+    end: datetime.date,
+    granularity: schemes.Granularity,
+) -> list[schemes.ClickCount]:
+    """Get the number of ` Click `'s of a ` Url ` per bucket of a range.
+
+    Args:
+        session: The database session.
+        url_id: The unique identifier of the ` Url `.
+        start: The first day, included.
+        end: The last day, included.
+        granularity: The size of the buckets.
+
+    Returns:
+        Every bucket of the range in chronological order, empty ones
+            included.
+    """
+    first: datetime.datetime = datetime.datetime.combine(start, datetime.time())
+    last: datetime.datetime = datetime.datetime.combine(end, datetime.time())
+
+    if granularity == schemes.Granularity.HOUR:
+        hourly: dict[datetime.datetime, int] = await crud.get_hourly_clicks(
+            async_session=session,
+            url_id=url_id,
+            start=first,
+            end=last + _DAY,
+        )
+        return [
+            schemes.ClickCount(
+                bucket=first + _HOUR * hour,
+                clicks=hourly.get(first + _HOUR * hour, 0),
+            )
+            for hour in range((last - first) // _HOUR + 24)
+        ]
+
+    daily: dict[datetime.date, int] = await crud.get_daily_clicks(
+        async_session=session,
+        url_id=url_id,
+        start=start,
+        end=end + _DAY,
+    )
+    return [
+        schemes.ClickCount(
+            bucket=first + _DAY * day,
+            clicks=daily.get(start + _DAY * day, 0),
+        )
+        for day in range((end - start).days + 1)
+    ]
+
+
+async def _get_visitors(
+    *,
+    session: AsyncSession,
+    url_id: int,
+    start: datetime.date,
+    end: datetime.date,
+) -> HyperLogLog:
+    """Merge the visitor sketches of a ` Url ` over a range.
+
+    Args:
+        session: The database session.
+        url_id: The unique identifier of the ` Url `.
+        start: The first day, included.
+        end: The last day, included.
+
+    Returns:
+        The sketch of the IP addresses of the range, from every worker.
+    """
+    visitors: HyperLogLog = HyperLogLog(
+        precision=settings.click.VISITORS_PRECISION,
+    )
+
+    for sketch in await crud.get_visitor_sketches(
+        async_session=session,
+        url_id=url_id,
+        start=start,
+        end=end + _DAY,
+    ):
+        visitors.update(HyperLogLog.from_bytes(sketch))
+
+    return visitors
+
+
+def _encode_cursor(click: "Click", /) -> str:
+    """Encode the position of a ` Click ` as an opaque page cursor.
+
+    Args:
+        click: The last ` Click ` of the page.
+
+    Returns:
+        The URL-safe cursor of the next page.
+    """
+    return base64.urlsafe_b64encode(
+        f"{click.created_at.isoformat()}_{click.id}".encode(),
+    ).decode()
+
+
+def _decode_cursor(cursor: str, /) -> ClickCursor:
+    """Decode an opaque page cursor into the position of a ` Click `.
+
+    Args:
+        cursor: The cursor of the page.
+
+    Raises:
+        HTTPException: The cursor is not valid.
+
+    Returns:
+        The position of the last ` Click ` of the previous page.
+    """
+    try:
+        created_at, _, click_id = (
+            base64.urlsafe_b64decode(cursor).decode().partition("_")
+        )
+        return ClickCursor(
+            created_at=datetime.datetime.fromisoformat(created_at),
+            id=int(click_id),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise HTTPException(
+            detail="Invalid cursor",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ) from error
+
+
+@router.get(
+    "/{url_id}/stats",
+    summary="Get short url statistics",
+    description=(
+        "Gets the number of clicks of a short url over a range of days, per "
+        "hour or day and per country, and an estimate of its unique "
+        "visitors. The counts are read from rollups and sketches, so the "
+        "response time does not grow with the number of clicks."
+    ),
+    responses={
+        status.HTTP_200_OK: responses.response(
+            description="Statistics retrieved successfully.",
+            model=schemes.UrlStats,
+            example={
+                "id": "7335256174294515712",
+                "start": "2026-01-01",
+                "end": "2026-01-02",
+                "granularity": "day",
+                "clicks": 3,
+                "visitors": 2,
+                "visitors_error": 0.01625,
+                "series": [
+                    {"bucket": "2026-01-01T00:00:00", "clicks": 2},
+                    {"bucket": "2026-01-02T00:00:00", "clicks": 1},
+                ],
+                "countries": [
+                    {"country": "ES", "clicks": 2},
+                    {"country": None, "clicks": 1},
+                ],
+            },
+        ),
+        status.HTTP_422_UNPROCESSABLE_ENTITY: (
+            responses.unprocessable_entity_response(
+                example={
+                    "errors": [],
+                    "message": "Range should span between 1 and 366 days",
+                    "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                },
+            )
+        ),
+    },
+)
+async def get_url_stats(  # noqa: PLR0913, PLR0917
+    principal: Annotated[
+        jwt.Principal,
+        Depends(jwt.get_current_principal),
+    ],
+    url_id: Annotated[
+        int,
+        Path(description="The unique identifier of the url.", ge=0),
+    ],
+    session: Annotated[
+        AsyncSession,
+        Depends(database.get_async_session),
+    ],
+    start: Annotated[
+        datetime.date | None,
+        Query(description="The first day, included. Defaults to 30 days."),
+    ] = None,
+    end: Annotated[
+        datetime.date | None,
+        Query(description="The last day, included. Defaults to today."),
+    ] = None,
+    granularity: Annotated[
+        schemes.Granularity,
+        Query(description="The size of the buckets of the series."),
+    ] = schemes.Granularity.DAY,
+) -> JSONResponse:
+    start, end = _get_range(start=start, end=end, granularity=granularity)
+    await _check_url(session=session, url_id=url_id, user_id=principal.id)
+
+    series: list[schemes.ClickCount] = await _get_series(
+        session=session,
+        url_id=url_id,
+        start=start,
+        end=end,
+        granularity=granularity,
+    )
+    countries: dict[str, int] = await crud.get_country_clicks(
+        async_session=session,
+        url_id=url_id,
+        start=start,
+        end=end + _DAY,
+    )
+    visitors: HyperLogLog = await _get_visitors(
+        session=session,
+        url_id=url_id,
+        start=start,
+        end=end,
+    )
+    clicks: int = sum(count.clicks for count in series)
+    unknown: int = clicks - sum(countries.values())
+
+    return JSONResponse(
+        content=schemes.UrlStats(
+            id=str(url_id),
+            start=start,
+            end=end,
+            granularity=granularity,
+            clicks=clicks,
+            visitors=visitors.count(),
+            visitors_error=visitors.error,
+            series=series,
+            countries=[
+                *(
+                    schemes.CountryClicks(country=country, clicks=total)
+                    for country, total in countries.items()
+                ),
+                *(
+                    [schemes.CountryClicks(country=None, clicks=unknown)]
+                    if unknown > 0
+                    else []
+                ),
+            ],
+        ).model_dump(mode="json"),
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@router.get(
+    "/{url_id}/clicks",
+    summary="List short url clicks",
+    description=(
+        "Lists the clicks of a short url, newest first. Pages are selected "
+        "by cursor, so every page is retrieved in the same time."
+    ),
+    responses={
+        status.HTTP_200_OK: responses.response(
+            description="Clicks retrieved successfully.",
+            model=schemes.ClickPage,
+            example={
+                "clicks": [
+                    {
+                        "id": "7335256174294515712",
+                        "country": "ES",
+                        "created_at": "2026-01-01T12:34:56",
+                    },
+                ],
+                "next_cursor": None,
+            },
+        ),
+        status.HTTP_422_UNPROCESSABLE_ENTITY: (
+            responses.unprocessable_entity_response(
+                example={
+                    "errors": [],
+                    "message": "Invalid cursor",
+                    "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                },
+            )
+        ),
+    },
+)
+async def get_url_clicks(
+    principal: Annotated[
+        jwt.Principal,
+        Depends(jwt.get_current_principal),
+    ],
+    url_id: Annotated[
+        int,
+        Path(description="The unique identifier of the url.", ge=0),
+    ],
+    session: Annotated[
+        AsyncSession,
+        Depends(database.get_async_session),
+    ],
+    limit: Annotated[
+        int,
+        Query(
+            description="The maximum number of clicks in the page.",
+            ge=1,
+            le=Stats.MAX_PAGE_SIZE,
+        ),
+    ] = Stats.DEFAULT_PAGE_SIZE,
+    cursor: Annotated[
+        str | None,
+        Query(description="The cursor of the page, from the previous page."),
+    ] = None,
+) -> JSONResponse:
+    before: ClickCursor | None = (
+        None if cursor is None else _decode_cursor(cursor)
+    )
+    await _check_url(session=session, url_id=url_id, user_id=principal.id)
+
+    clicks: list[Click] = await crud.get_url_clicks(
+        async_session=session,
+        url_id=url_id,
+        before=before,
+        limit=limit + 1,
+    )
+
+    return JSONResponse(
+        content=schemes.ClickPage(
+            clicks=[
+                schemes.Click.from_model(click) for click in clicks[:limit]
+            ],
+            next_cursor=(
+                _encode_cursor(clicks[limit - 1])
+                if len(clicks) > limit
+                else None
+            ),
+        ).model_dump(mode="json"),
+        status_code=status.HTTP_200_OK,
+    )
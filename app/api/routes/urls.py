@@ -1,104 +1,295 @@
-import base64
-import secrets
-import string
-from typing import Annotated
+from collections.abc import AsyncGenerator, AsyncIterator, Collection, Sequence
+from typing import TYPE_CHECKING, Annotated
 
-from fastapi import APIRouter, Body, Depends, status
-from fastapi.responses import JSONResponse
+import anyio
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Receive
 
 from app import crud
 from app.api import responses, schemes
-from app.api.exceptions import HTTPError
-from app.core import utils
+from app.api.handlers import validation_errors
 from app.core.auth import jwt
+from app.core.cache import invalidate_url
 from app.core.database import database
-from app.core.database.models import Url, User
-from app.core.settings.data import Slug
+from app.core.logger import logger
+from app.core.settings import settings
+from app.core.slugs import slug_filter, slug_generator, slug_pool
+from app.core.utils import JsonArrayParser
+from app.crud.url import NewUrl
+
+if TYPE_CHECKING:
+    from app.core.database.models import Url
+
+type _BulkItem = schemes.CreateUrl | ValidationError
+type _BulkChunk = list[tuple[int, _BulkItem]]
+
+_NDJSON_MEDIA_TYPE: str = "application/x-ndjson"
+_MAX_GENERATED_SLUG_ATTEMPTS: int = 3
 
 router: APIRouter = APIRouter(
     prefix="/url",
     responses={
         status.HTTP_400_BAD_REQUEST: responses.INVALID_TOKEN,
         status.HTTP_401_UNAUTHORIZED: responses.UNAUTHORIZED,
+        status.HTTP_403_FORBIDDEN: responses.INACTIVE_USER,
     },
 )
 
 
-def _base10_to_urlsafe_base64(number: int, /) -> str:
-    """Convert a base 10 number to a URL safe base 64 string.
+async def _create_url_with_generated_slug(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    create_url: schemes.CreateUrl,
+) -> "Url":
+    """Create a ` Url ` with a slug from the ` slug_pool `.
+
+    The ` slug_generator ` is used when the pool is disabled or empty.
+    Generated slugs never collide with each other, but may collide with a
+    custom slug, in which case another slug is generated.
 
     Args:
-        number (int): The base 10 number to convert.
+        session: The database session.
+        user_id: The unique identifier of the ` User `.
+        create_url: The requested ` Url `.
+
+    Raises:
+        ValueError: Failed to generate a unique slug in a reasonable time.
 
     Returns:
-        The URL safe base 64 string.
+        The flushed, not yet committed ` Url `.
     """
-    byte_representation: bytes = number.to_bytes(
-        (number.bit_length() + 7) // 8,
-        byteorder="big",
-    )
-
-    base64_encoded: bytes = base64.b64encode(byte_representation)
+    for _ in range(_MAX_GENERATED_SLUG_ATTEMPTS):
+        try:
+            return await crud.create_url(
+                async_session=session,
+                user_id=user_id,
+                source=str(create_url.source),
+                slug=slug_pool.pop() or slug_generator(),
+                redirect_status=create_url.redirect_status,
+                cache_max_age=create_url.cache_max_age,
+                commit=False,
+            )
+        except IntegrityError:
+            await session.rollback()
 
-    return (
-        base64_encoded.decode("utf-8")
-        .replace("+", "-")
-        .replace("/", "_")
-        .rstrip("=")
+    error_message: str = (
+        "Failed to generate a unique slug in a reasonable time."
     )
+    raise ValueError(error_message)
 
 
-async def _generate_unique_slug(
+async def _create_url_with_custom_slug(
     *,
     session: AsyncSession,
-    max_url_length: int,
-    random_number: int | None = None,
-    current_time: int,
-) -> str:
-    """Generate a random unique slug.
+    user_id: int,
+    create_url: schemes.CreateUrl,
+    slug: str,
+) -> "Url | None":
+    """Create a ` Url ` with a slug chosen by the ` User `.
 
-    Args:
-        current_time (int): The current time in seconds since the epoch.
-        session (AsyncSession): The database session.
-        max_url_length (int): The maximum length of the slug.
-        random_number (int | None, optional): A random number to allow for
-                                              more then one slug per second.
-                                              The bigger the number, the longer
-                                              the slug. If None, a random
-                                              number will be generated
-                                              automatically. Defaults to None.
+    The database is only queried for slugs the ` slug_filter ` cannot rule
+    out. A slug taken concurrently is caught by the unique constraint.
 
-    Raises:
-        ValueError: Failed to generate a unique slug in a reasonable time.
+    Args:
+        session: The database session.
+        user_id: The unique identifier of the ` User `.
+        create_url: The requested ` Url `.
+        slug: The custom slug.
 
     Returns:
-        str: A random unique slug.
+        The flushed, not yet committed ` Url `, or ` None ` if the slug is
+            already in use.
     """
-    if random_number is None:
-        random_number = secrets.randbelow(101)
+    if slug_filter.might_exist(slug) and await crud.get_url_by_slug(
+        async_session=session,
+        slug=slug,
+    ):
+        return None
 
-    slug: str = _base10_to_urlsafe_base64(
-        int(f"{current_time}{random_number}"),
-    )
-    while len(slug) < max_url_length:
-        existing_url: Url | None = await crud.get_url_by_slug(
+    try:
+        return await crud.create_url(
             async_session=session,
+            user_id=user_id,
+            source=str(create_url.source),
             slug=slug,
+            redirect_status=create_url.redirect_status,
+            cache_max_age=create_url.cache_max_age,
+            commit=False,
         )
+    except IntegrityError:
+        await session.rollback()
+        return None
 
-        if existing_url is None:
-            return slug
 
-        slug += secrets.choice(string.ascii_letters)
+def _generate_slug(*reserved: Collection[str]) -> str:
+    """Generate a slug that is not in any of the reserved collections.
 
-    error_message: str = (
-        "Failed to generate a unique slug in a reasonable time."
-    )
+    Args:
+        reserved: The slugs that are already taken or claimed.
 
-    raise ValueError(
-        error_message,
+    Returns:
+        The slug from the ` slug_generator `.
+    """
+    slug: str = slug_generator()
+
+    while any(slug in slugs for slugs in reserved):
+        slug = slug_generator()
+
+    return slug
+
+
+def _check_item_size(size: int, /) -> None:
+    """Check that an item of a bulk request body is not too large.
+
+    It is checked as the body is received, to bound the memory held by an
+    item. An element of a JSON array received within a single chunk of the
+    body is only bounded by the size of the chunk.
+
+    Args:
+        size: The size of the item, or of its part received so far.
+
+    Raises:
+        HTTPException: The item is larger than ` BULK_MAX_ITEM_SIZE `.
+    """
+    if size > settings.bulk.MAX_ITEM_SIZE:
+        raise HTTPException(
+            detail="Item too large",
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
+
+async def _iter_ndjson_lines(request: Request, /) -> AsyncGenerator[bytes]:
+    """Split an NDJSON request body into lines as it is received.
+
+    Args:
+        request: The request.
+
+    Raises:
+        HTTPException: A line is too large.
+
+    Yields:
+        The non-blank lines of the body.
+    """
+    buffer: bytearray = bytearray()
+
+    async for chunk in request.stream():
+        *lines, remainder = chunk.split(b"\n")
+
+        for line in lines:
+            buffer += line
+            _check_item_size(len(buffer))
+            if buffer.strip():
+                yield bytes(buffer)
+            buffer = bytearray()
+
+        buffer += remainder
+        _check_item_size(len(buffer))
+
+    if buffer.strip():
+        yield bytes(buffer)
+
+
+async def _iter_json_array(request: Request, /) -> AsyncGenerator[object]:
+    """Parse a JSON array request body element by element as it is received.
+
+    Args:
+        request: The request.
+
+    Raises:
+        HTTPException: The body is not a JSON array or an element is too
+            large.
+
+    Yields:
+        The elements of the array.
+    """
+    parser: JsonArrayParser = JsonArrayParser()
+
+    try:
+        async for chunk in request.stream():
+            for item in parser.feed(chunk):
+                yield item
+
+            _check_item_size(parser.pending)
+
+        for item in parser.feed(b"", final=True):
+            yield item
+    except ValueError as error:
+        raise HTTPException(
+            detail="Request should be a valid JSON array",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ) from error
+
+
+def _validate_bulk_item(item: object, /) -> _BulkItem:
+    try:
+        if isinstance(item, bytes):
+            return schemes.CreateUrl.model_validate_json(item)
+
+        return schemes.CreateUrl.model_validate(item)
+    except ValidationError as error:
+        return error
+
+
+async def _read_bulk_chunks(request: Request, /) -> AsyncGenerator[_BulkChunk]:
+    """Read and validate the items of a bulk request body chunk by chunk.
+
+    An NDJSON body is parsed line by line and any other body as a JSON
+    array, both as they are received, and a chunk is yielded as soon as it
+    is complete. Invalid items are kept as their validation error.
+
+    Args:
+        request: The request.
+
+    Raises:
+        HTTPException: The body is not valid or has too many or too large
+            items.
+
+    Yields:
+        The request positions and validated items of every chunk.
+    """
+    raw_items: AsyncGenerator[object] = (
+        _iter_ndjson_lines(request)
+        if request.headers.get("content-type", "").startswith(
+            _NDJSON_MEDIA_TYPE,
+        )
+        else _iter_json_array(request)
     )
+    chunk: _BulkChunk = []
+    index: int = 0
+
+    async for raw_item in raw_items:
+        if index >= settings.bulk.MAX_ITEMS:
+            raise HTTPException(
+                detail="Too many items",
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        chunk.append((index, _validate_bulk_item(raw_item)))
+        index += 1
+
+        if len(chunk) == settings.bulk.CHUNK_SIZE:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+class _BulkResponse(StreamingResponse):
+    """` StreamingResponse ` streamed while the request body is still read.
+
+    The default response consumes the request messages to detect client
+    disconnects, which would steal the body from the bulk items reader. A
+    disconnect is detected by the reader instead.
+    """
+
+    async def listen_for_disconnect(self, receive: Receive) -> None:  # noqa: ARG002
+        await anyio.sleep_forever()
 
 
 @router.post(
@@ -125,12 +316,14 @@ async def _generate_unique_slug(
                 "status": status.HTTP_409_CONFLICT,
             },
         ),
-        status.HTTP_422_UNPROCESSABLE_ENTITY: responses.validation_response(
-            example={
-                "errors": [],
-                "message": "Validation error",
-                "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
-            },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: (
+            responses.unprocessable_entity_response(
+                example={
+                    "errors": [],
+                    "message": "Validation error",
+                    "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                },
+            )
         ),
         status.HTTP_503_SERVICE_UNAVAILABLE: responses.response(
             description=(
@@ -148,9 +341,9 @@ async def _generate_unique_slug(
     },
 )
 async def create_url(
-    user: Annotated[
-        User,
-        Depends(jwt.get_current_user),
+    principal: Annotated[
+        jwt.Principal,
+        Depends(jwt.get_current_principal),
     ],
     create_url: Annotated[
         schemes.CreateUrl,
@@ -161,10 +354,27 @@ async def create_url(
         Depends(database.get_async_session),
     ],
 ) -> JSONResponse:
-    if create_url.slug is not None and await crud.get_url_by_slug(
-        async_session=session,
-        slug=create_url.slug,
-    ):
+    if create_url.slug is None:
+        try:
+            url: Url | None = await _create_url_with_generated_slug(
+                session=session,
+                user_id=principal.id,
+                create_url=create_url,
+            )
+        except ValueError as error:
+            raise HTTPException(
+                detail="Failed to generate a unique slug in a reasonable time",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            ) from error
+    else:
+        url = await _create_url_with_custom_slug(
+            session=session,
+            user_id=principal.id,
+            create_url=create_url,
+            slug=create_url.slug,
+        )
+
+    if url is None:
         return JSONResponse(
             content={
                 "message": "Slug is already in use",
@@ -173,34 +383,13 @@ async def create_url(
             status_code=status.HTTP_409_CONFLICT,
         )
 
-    if create_url.slug is None:
-        try:
-            create_url.slug = await _generate_unique_slug(
-                session=session,
-                max_url_length=Slug.MAX_LENGTH,
-                current_time=utils.now(),
-            )
-        except ValueError as error:
-            raise HTTPError(
-                errors=[],
-                message="Failed to generate a unique slug in a reasonable time",
-                status=status.HTTP_503_SERVICE_UNAVAILABLE,
-            ) from error
-
-    url: Url = await crud.create_url(
+    await crud.create_tags(
         async_session=session,
-        user_id=user.id,
-        slug=create_url.slug,
-        address=str(create_url.address),
+        url_id=url.id,
+        names={tag.name for tag in create_url.tags},
     )
-
-    tag_names: set[str] = {tag.name for tag in create_url.tags}
-    for tag_name in tag_names:
-        await crud.create_tag(
-            async_session=session,
-            url_id=url.id,
-            name=tag_name,
-        )
+    slug_filter.add(url.slug)
+    invalidate_url(url.slug)
 
     return JSONResponse(
         content=schemes.SuccessResponse(
@@ -209,3 +398,360 @@ async def create_url(
         ).model_dump(mode="json"),
         status_code=status.HTTP_201_CREATED,
     )
+
+
+async def _create_url_chunk(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    items: Sequence[tuple[int, _BulkItem]],
+    used_slugs: set[str],
+) -> list[schemes.BulkUrlResult]:
+    """Create the valid ` Url `'s of a chunk of bulk items in a transaction.
+
+    Args:
+        session: The database session.
+        user_id: The unique identifier of the ` User `.
+        items: The request positions and validated items of the chunk.
+        used_slugs: The slugs taken by the previous chunks of the request,
+            updated with the slugs of this chunk.
+
+    Returns:
+        The result of every item of the chunk, in the order of ` items `.
+    """
+    results: dict[int, schemes.BulkUrlResult] = {}
+    valid_items: list[tuple[int, schemes.CreateUrl]] = []
+
+    for index, item in items:
+        if isinstance(item, ValidationError):
+            results[index] = schemes.BulkUrlResult(
+                index=index,
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                message="Validation error",
+                errors=validation_errors(item.errors(), field_position=0),
+            )
+        else:
+            valid_items.append((index, item))
+
+    custom_slugs: set[str] = {
+        item.slug for _, item in valid_items if item.slug is not None
+    }
+    taken: set[str] = used_slugs | await crud.get_existing_slugs(
+        async_session=session,
+        slugs=custom_slugs,
+    )
+    new_urls: list[NewUrl] = []
+    for index, item in valid_items:
+        slug: str = (
+            item.slug
+            if item.slug is not None
+            else _generate_slug(taken, custom_slugs)
+        )
+
+        if slug in taken:
+            results[index] = schemes.BulkUrlResult(
+                index=index,
+                status=status.HTTP_409_CONFLICT,
+                message="Slug is already in use",
+                slug=slug,
+            )
+            continue
+
+        taken.add(slug)
+        new_urls.append(
+            NewUrl(
+                user_id=user_id,
+                source=str(item.source),
+                slug=slug,
+                tags={tag.name for tag in item.tags},
+                redirect_status=item.redirect_status,
+                cache_max_age=item.cache_max_age,
+            ),
+        )
+        results[index] = schemes.BulkUrlResult(
+            index=index,
+            status=status.HTTP_201_CREATED,
+            message="Url created successfully",
+            slug=slug,
+        )
+
+    await crud.create_urls(async_session=session, urls=new_urls)
+    used_slugs.update(url.slug for url in new_urls)
+    slug_filter.add(*(url.slug for url in new_urls))
+
+    return [results[index] for index, _ in items]
+
+
+def _failed_results(
+    items: Sequence[tuple[int, _BulkItem]],
+    /,
+    *,
+    status_code: int,
+    message: str,
+) -> list[schemes.BulkUrlResult]:
+    """Build the results of bulk items that could not be created.
+
+    Args:
+        items: The request positions and validated items.
+        status_code: The status of the valid items.
+        message: The message of the valid items.
+
+    Returns:
+        The result of every item, in the order of ` items `.
+    """
+    return [
+        schemes.BulkUrlResult(
+            index=index,
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            message="Validation error",
+            errors=validation_errors(item.errors(), field_position=0),
+        )
+        if isinstance(item, ValidationError)
+        else schemes.BulkUrlResult(
+            index=index,
+            status=status_code,
+            message=message,
+            slug=item.slug,
+        )
+        for index, item in items
+    ]
+
+
+async def _create_url_chunk_with_retry(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    items: Sequence[tuple[int, _BulkItem]],
+    used_slugs: set[str],
+) -> list[schemes.BulkUrlResult]:
+    """Create a chunk of bulk items, retrying conflicts with other requests.
+
+    A chunk that conflicts with a concurrent request is retried once, with
+    the slugs taken meanwhile read again. If it conflicts again, its items
+    are created one by one, so only the conflicting ones fail with a 409.
+
+    Args:
+        session: The database session.
+        user_id: The unique identifier of the ` User `.
+        items: The request positions and validated items of the chunk.
+        used_slugs: The slugs taken by the previous chunks of the request,
+            updated with the slugs of this chunk.
+
+    Returns:
+        The result of every item of the chunk, in the order of ` items `.
+    """
+    for _ in range(2):
+        try:
+            return await _create_url_chunk(
+                session=session,
+                user_id=user_id,
+                items=items,
+                used_slugs=used_slugs,
+            )
+        except IntegrityError:
+            await session.rollback()
+
+    if len(items) == 1:
+        return _failed_results(
+            items,
+            status_code=status.HTTP_409_CONFLICT,
+            message="Slug is already in use",
+        )
+
+    return [
+        result
+        for item in items
+        for result in await _create_url_chunk_with_retry(
+            session=session,
+            user_id=user_id,
+            items=[item],
+            used_slugs=used_slugs,
+        )
+    ]
+
+
+async def _create_urls_in_bulk(
+    *,
+    user_id: int,
+    chunks: AsyncIterator[_BulkChunk],
+) -> AsyncGenerator[str]:
+    """Create the ` Url `'s of a bulk request chunk by chunk.
+
+    Every chunk is written in its own transaction and its results are
+    streamed as soon as it is committed, while the next chunk is read. Once
+    the response has started, errors are reported as result lines: a chunk
+    that fails unexpectedly gets a 500 for each of its items, and a body
+    that turns out to be invalid or too large ends the response with a
+    line for the position where reading stopped.
+
+    Args:
+        user_id: The unique identifier of the ` User `.
+        chunks: The validated items of the request, chunk by chunk.
+
+    Yields:
+        The NDJSON lines of the results of each chunk.
+    """
+    used_slugs: set[str] = set()
+    next_index: int = 0
+
+    async with database.create_async_session() as session:
+        try:
+            async for chunk in chunks:
+                next_index = chunk[-1][0] + 1
+                yield _dump_results(
+                    await _create_url_chunk_safely(
+                        session=session,
+                        user_id=user_id,
+                        items=chunk,
+                        used_slugs=used_slugs,
+                    ),
+                )
+        except HTTPException as error:
+            yield _dump_results(
+                [
+                    schemes.BulkUrlResult(
+                        index=next_index,
+                        status=error.status_code,
+                        message=error.detail,
+                    ),
+                ],
+            )
+
+
+async def _create_url_chunk_safely(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    items: Sequence[tuple[int, _BulkItem]],
+    used_slugs: set[str],
+) -> list[schemes.BulkUrlResult]:
+    """Create a chunk of bulk items, turning unexpected errors into results.
+
+    Args:
+        session: The database session.
+        user_id: The unique identifier of the ` User `.
+        items: The request positions and validated items of the chunk.
+        used_slugs: The slugs taken by the previous chunks of the request,
+            updated with the slugs of this chunk.
+
+    Returns:
+        The result of every item of the chunk, in the order of ` items `.
+    """
+    try:
+        return await _create_url_chunk_with_retry(
+            session=session,
+            user_id=user_id,
+            items=items,
+            used_slugs=used_slugs,
+        )
+    except Exception:  # noqa: BLE001
+        logger.exception(f"Failed to create {len(items)} urls in bulk.")
+        await session.rollback()
+
+    return _failed_results(
+        items,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        message="Internal server error",
+    )
+
+
+def _dump_results(results: Sequence[schemes.BulkUrlResult], /) -> str:
+    return "".join(
+        f"{result.model_dump_json(exclude_none=True)}\n" for result in results
+    )
+
+
+async def _prepend(
+    chunk: _BulkChunk | None,
+    chunks: AsyncIterator[_BulkChunk],
+    /,
+) -> AsyncGenerator[_BulkChunk]:
+    """Put back the chunk read before the response started.
+
+    The first chunk is read by the route, so a body that is invalid from
+    the start is still rejected with an error status.
+
+    Args:
+        chunk: The first chunk, or ` None ` if the body has no items.
+        chunks: The remaining chunks.
+
+    Yields:
+        Every chunk of the request.
+    """
+    if chunk is not None:
+        yield chunk
+
+    async for next_chunk in chunks:
+        yield next_chunk
+
+
+@router.post(
+    "/bulk",
+    summary="Create short urls in bulk",
+    description=(
+        "Creates many short urls at once from a JSON array or an NDJSON "
+        "stream of urls. The result of every url is streamed back as NDJSON "
+        "in the order of the request."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "One result per url, as NDJSON.",
+            "content": {
+                _NDJSON_MEDIA_TYPE: {
+                    "schema": schemes.BulkUrlResult.model_json_schema(),
+                },
+            },
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: responses.response(
+            description="The request has too many urls or a too large url.",
+            model=schemes.ErrorResponse,
+            example={
+                "errors": [],
+                "message": "Too many items",
+                "status": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            },
+        ),
+        status.HTTP_422_UNPROCESSABLE_ENTITY: (
+            responses.unprocessable_entity_response(
+                example={
+                    "errors": [],
+                    "message": "Request should be a valid JSON array",
+                    "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                },
+            )
+        ),
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                media_type: {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/CreateUrl"},
+                    },
+                }
+                for media_type in ("application/json", _NDJSON_MEDIA_TYPE)
+            },
+        },
+    },
+)
+async def create_urls_in_bulk(
+    principal: Annotated[
+        jwt.Principal,
+        Depends(jwt.get_current_principal),
+    ],
+    request: Request,
+) -> StreamingResponse:
+    chunks: AsyncGenerator[_BulkChunk] = _read_bulk_chunks(request)
+    first_chunk: _BulkChunk | None = await anext(chunks, None)
+
+    return _BulkResponse(
+        _create_urls_in_bulk(
+            user_id=principal.id,
+            chunks=_prepend(first_chunk, chunks),
+        ),
+        media_type=_NDJSON_MEDIA_TYPE,
+    )
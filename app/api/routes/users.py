@@ -5,13 +5,14 @@ from fastapi.responses import JSONResponse
 
 from app.api import responses, schemes
 from app.core.auth import jwt
-from app.core.database.models import User
+from app.core.cache import UserRecord
 
 router: APIRouter = APIRouter(
     prefix="/users",
     responses={
         status.HTTP_400_BAD_REQUEST: responses.INVALID_TOKEN,
         status.HTTP_401_UNAUTHORIZED: responses.UNAUTHORIZED,
+        status.HTTP_403_FORBIDDEN: responses.INACTIVE_USER,
     },
 )
 
@@ -35,7 +36,7 @@ router: APIRouter = APIRouter(
 )
 def get_users_me(
     user: Annotated[
-        User,
+        UserRecord,
         Depends(jwt.get_current_user),
     ],
 ) -> JSONResponse:
@@ -5,18 +5,33 @@ from .response import (
     ErrorResponse,
     SuccessResponse,
 )
+from .stats import (
+    Click,
+    ClickCount,
+    ClickPage,
+    CountryClicks,
+    Granularity,
+    UrlStats,
+)
 from .tag import Tag
-from .url import CreateUrl, Url
+from .url import BulkUrlResult, CreateUrl, Url
 from .user import CreateUser, LoginUser, User
 
 __all__ = [
+    "BulkUrlResult",
+    "Click",
+    "ClickCount",
+    "ClickPage",
+    "CountryClicks",
     "CreateUrl",
     "CreateUser",
     "Error",
     "ErrorResponse",
+    "Granularity",
     "LoginUser",
     "SuccessResponse",
     "Tag",
     "Url",
+    "UrlStats",
     "User",
 ]
@@ -0,0 +1,183 @@
+import datetime
+from enum import StrEnum
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from app.core.database import models
+from app.core.settings.data import Country
+
+from .fields import Id
+
+
+class Granularity(StrEnum):
+    """Size of the buckets of a ` Click ` series."""
+
+    HOUR = "hour"
+    DAY = "day"
+
+
+class ClickCount(BaseModel):
+    bucket: Annotated[
+        datetime.datetime,
+        Field(
+            description="The start of the hour or day, in UTC.",
+            examples=["2026-01-01T00:00:00"],
+        ),
+    ]
+    clicks: Annotated[
+        int,
+        Field(
+            description="The number of clicks in the hour or day.",
+            examples=[42],
+            ge=0,
+        ),
+    ]
+
+
+class CountryClicks(BaseModel):
+    country: Annotated[
+        str | None,
+        Field(
+            description=(
+                "The two-letter country code of the clicks, or null for "
+                "clicks whose origin is unknown."
+            ),
+            examples=["ES"],
+            max_length=Country.MAX_LENGTH,
+        ),
+    ]
+    clicks: Annotated[
+        int,
+        Field(
+            description="The number of clicks from the country.",
+            examples=[42],
+            ge=0,
+        ),
+    ]
+
+
+class UrlStats(BaseModel):
+    id: Id
+    start: Annotated[
+        datetime.date,
+        Field(
+            description="The first day of the range, included.",
+            examples=["2026-01-01"],
+        ),
+    ]
+    end: Annotated[
+        datetime.date,
+        Field(
+            description="The last day of the range, included.",
+            examples=["2026-01-30"],
+        ),
+    ]
+    granularity: Annotated[
+        Granularity,
+        Field(
+            description="The size of the buckets of the series.",
+            examples=[Granularity.DAY],
+        ),
+    ]
+    clicks: Annotated[
+        int,
+        Field(
+            description=(
+                "The number of clicks in the range. Recent clicks are "
+                "counted with a delay of a few seconds."
+            ),
+            examples=[123],
+            ge=0,
+        ),
+    ]
+    visitors: Annotated[
+        int,
+        Field(
+            description=(
+                "The estimated number of distinct IP addresses that clicked "
+                "in the range."
+            ),
+            examples=[87],
+            ge=0,
+        ),
+    ]
+    visitors_error: Annotated[
+        float,
+        Field(
+            description=(
+                "The relative standard error of the visitors estimate, about "
+                "two thirds of the estimates are within this fraction of the "
+                "exact count."
+            ),
+            examples=[0.01625],
+            ge=0,
+        ),
+    ]
+    series: Annotated[
+        list[ClickCount],
+        Field(
+            description=(
+                "The number of clicks per bucket of the range, in "
+                "chronological order, including empty buckets."
+            ),
+        ),
+    ]
+    countries: Annotated[
+        list[CountryClicks],
+        Field(
+            description=(
+                "The number of clicks per country, from the most to the "
+                "least clicked."
+            ),
+        ),
+    ]
+
+
+class Click(BaseModel):
+    id: Id
+    country: Annotated[
+        str | None,
+        Field(
+            description=(
+                "The two-letter country code of the origin of the click, or "
+                "null if unknown."
+            ),
+            examples=["ES"],
+            max_length=Country.MAX_LENGTH,
+        ),
+    ]
+    created_at: Annotated[
+        datetime.datetime,
+        Field(
+            description="The time of the click, in UTC.",
+            examples=["2026-01-01T12:34:56"],
+        ),
+    ]
+
+    @classmethod
+    def from_model(cls: type["Click"], model: models.Click) -> "Click":
+        return cls(
+            id=str(model.id),
+            country=model.country,
+            created_at=model.created_at,
+        )
+
+
+class ClickPage(BaseModel):
+    clicks: Annotated[
+        list[Click],
+        Field(
+            description="The clicks of the page, newest first.",
+        ),
+    ]
+    next_cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "The opaque cursor of the next page, or null if this is the "
+                "last page."
+            ),
+            examples=["MjAyNi0wMS0wMVQxMjozNDo1Nl83MzM1MjU2MTc0Mjk0NTE1NzEy"],
+        ),
+    ] = None
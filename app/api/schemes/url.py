@@ -9,9 +9,16 @@ from pydantic import (
 )
 
 from app.core.database import models
-from app.core.settings.data import Slug, Source, User
+from app.core.settings.data import (
+    Redirect,
+    RedirectStatus,
+    Slug,
+    Source,
+    User,
+)
 
 from .fields import Id
+from .response import Error
 from .tag import Tag
 
 _Slug = Annotated[
@@ -56,6 +63,31 @@ class CreateUrl(BaseModel):
             examples=["https://example.com/i-am-a-very-long-url"],
         ),
     ]
+    redirect_status: Annotated[
+        RedirectStatus,
+        Field(
+            description=(
+                "The HTTP status of the redirect. Permanent redirects (301, "
+                "308) may be cached by browsers, temporary ones (302, 307) "
+                "are followed through the short URL on every click."
+            ),
+            examples=[RedirectStatus.TEMPORARY_REDIRECT],
+        ),
+    ] = RedirectStatus.TEMPORARY_REDIRECT
+    cache_max_age: Annotated[
+        int | None,
+        Field(
+            description=(
+                "The number of seconds browsers and shared caches may reuse "
+                "the redirect without reaching the short URL. Clicks served "
+                "by a cache are not counted. No caching policy is sent if "
+                "omitted."
+            ),
+            examples=[3600],
+            ge=0,
+            le=Redirect.MAX_CACHE_MAX_AGE,
+        ),
+    ] = None
 
 
 class Url(CreateUrl):
@@ -79,5 +111,41 @@ class Url(CreateUrl):
             total_clicks=model.total_clicks,
             slug=model.slug,
             source=HttpUrl(url=model.source),
+            redirect_status=RedirectStatus(model.redirect_status),
+            cache_max_age=model.cache_max_age,
             tags=[Tag.from_model(tag) for tag in model.tags],
         )
+
+
+class BulkUrlResult(BaseModel):
+    index: Annotated[
+        int,
+        Field(
+            description="The position of the item in the request.",
+            examples=[0],
+            ge=0,
+        ),
+    ]
+    status: Annotated[
+        int,
+        Field(
+            description="The HTTP status code of the item outcome.",
+            examples=[201],
+            ge=100,
+            le=599,
+        ),
+    ]
+    message: Annotated[
+        str,
+        Field(
+            description="A message explaining the item outcome.",
+            examples=["Url created successfully"],
+        ),
+    ]
+    slug: _Slug | None = None
+    errors: Annotated[
+        list[Error],
+        Field(
+            description="The validation errors of the item, if any.",
+        ),
+    ] = []
@@ -2,6 +2,7 @@ from typing import Annotated, Literal
 
 from pydantic import BaseModel, EmailStr, Field, StringConstraints
 
+from app.core.cache import UserRecord
 from app.core.database import models
 from app.core.settings.data import Email, FirstName, LastName, Password
 
@@ -54,7 +55,10 @@ class User(_BaseUserWithName):
     id: Id
 
     @classmethod
-    def from_model(cls: type["User"], user: models.User) -> "User":
+    def from_model(
+        cls: type["User"],
+        user: models.User | UserRecord,
+    ) -> "User":
         return cls(
             id=str(user.id),
             first_name=user.first_name,
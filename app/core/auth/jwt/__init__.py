@@ -1,10 +1,17 @@
 """JWT authentication."""
 
-from .dependencies import get_current_user, get_refreshed_user
+from .dependencies import (
+    get_current_principal,
+    get_current_user,
+    get_refreshed_user,
+)
 from .jwt import generate_token, get_token_payload
+from .principal import Principal
 
 __all__ = [
+    "Principal",
     "generate_token",
+    "get_current_principal",
     "get_current_user",
     "get_refreshed_user",
     "get_token_payload",
@@ -3,13 +3,20 @@ from typing import Annotated, Any
 from fastapi import Cookie, Depends, HTTPException, status
 from fastapi.security import APIKeyCookie
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app import crud
+from app.core.cache import (
+    UserRecord,
+    cache_user_record,
+    get_user_record,
+)
 from app.core.database import database
 from app.core.database.models import User
 from app.core.settings import settings
 
 from .jwt import get_token_payload
+from .principal import Principal
 
 api_key_cookie: APIKeyCookie = APIKeyCookie(
     name="access_token",
@@ -18,26 +25,25 @@ api_key_cookie: APIKeyCookie = APIKeyCookie(
 )
 
 
-async def get_current_user(
-    async_session: Annotated[
-        AsyncSession,
-        Depends(database.get_async_session),
-    ],
+async def get_current_principal(
     access_token: Annotated[
         str | None,
         Depends(api_key_cookie),
     ],
-) -> User:
-    """Get the current user from the access token.
+) -> Principal:
+    """Get the current principal from the access token.
+
+    The principal is built from the verified token claims without querying
+    the database, use it on routes that only need the ` User ` id. Inactive
+    users are rejected.
 
     This is a ` FastAPI ` dependency.
 
     Args:
-        async_session: The async database session.
         access_token: The access token from the cookie.
 
     Returns:
-        The current user.
+        The current principal.
     """
     if access_token is None:
         raise HTTPException(
@@ -50,16 +56,86 @@ async def get_current_user(
         token=access_token,
         key=settings.jwt.SECRET,
     )
+    principal: Principal | None = (
+        Principal.from_token_payload(token_payload) if token_payload else None
+    )
 
-    if token_payload is None:
+    if principal is None:
         raise HTTPException(
             detail="Invalid token",
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
+    if not principal.active:
+        raise HTTPException(
+            detail="Inactive user",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+
+    return principal
+
+
+async def _resolve_user(
+    *,
+    async_session: AsyncSession,
+    user_id: int,
+) -> UserRecord | None:
+    record: UserRecord | None = await get_user_record(user_id)
+
+    if record is not None:
+        return record
+
     user: User | None = await crud.get_user_by_id(
         async_session=async_session,
-        user_id=int(token_payload.get("sub", -1)),
+        user_id=user_id,
+        options=(joinedload(User.status),),
+    )
+
+    if user is None:
+        return None
+
+    record = UserRecord(
+        id=user.id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        active=user.status is not None and user.status.active,
+    )
+    await cache_user_record(record)
+
+    return record
+
+
+async def get_current_user(
+    async_session: Annotated[
+        AsyncSession,
+        Depends(database.get_async_session),
+    ],
+    access_token: Annotated[
+        str | None,
+        Depends(api_key_cookie),
+    ],
+) -> UserRecord:
+    """Get the current user from the access token.
+
+    Unlike ` get_current_principal ` this resolves the ` User ` record, which
+    is read from the ` user_cache ` or, on a miss, from the database, so a
+    ` User ` deactivated after the token was issued is rejected.
+
+    This is a ` FastAPI ` dependency.
+
+    Args:
+        async_session: The async database session.
+        access_token: The access token from the cookie.
+
+    Returns:
+        The current user.
+    """
+    principal: Principal = await get_current_principal(access_token)
+
+    user: UserRecord | None = await _resolve_user(
+        async_session=async_session,
+        user_id=principal.id,
     )
 
     if not user:
@@ -68,6 +144,12 @@ async def get_current_user(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
+    if not user.active:
+        raise HTTPException(
+            detail="Inactive user",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+
     return user
 
 
@@ -82,9 +164,12 @@ async def get_refreshed_user(
             description="Refresh token",
         ),
     ] = None,
-) -> User:
+) -> UserRecord:
     """Get the current user from the refresh token.
 
+    The ` User ` record is read from the ` user_cache ` or, on a miss, from
+    the database. Inactive users are rejected.
+
     This is a ` FastAPI ` dependency.
 
     Args:
@@ -112,9 +197,15 @@ async def get_refreshed_user(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    user: User | None = await crud.get_user_by_id(
-        async_session=async_session,
-        user_id=int(token_payload.get("sub", -1)),
+    principal: Principal | None = Principal.from_token_payload(token_payload)
+
+    user: UserRecord | None = (
+        await _resolve_user(
+            async_session=async_session,
+            user_id=principal.id,
+        )
+        if principal
+        else None
     )
 
     if not user:
@@ -123,4 +214,10 @@ async def get_refreshed_user(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
+    if not user.active:
+        raise HTTPException(
+            detail="Inactive user",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+
     return user
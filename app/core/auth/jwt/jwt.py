@@ -1,13 +1,17 @@
+import hashlib
+import time
 from typing import Any, Literal, TypedDict
 
 import jwt as pyjwt
 
+from app.core.cache import token_cache
 from app.core.settings import settings
 
 
 class _UserData(TypedDict):
     sub: str
     email: str
+    active: bool
 
 
 class _TokenPayload(_UserData):
@@ -33,6 +37,7 @@ def _encode_token(
     token_payload: _TokenPayload = {
         "sub": payload["sub"],
         "email": payload["email"],
+        "active": payload["active"],
         "exp": expire,
         "iat": current_time,
     }
@@ -48,7 +53,7 @@ def _encode_token(
     )
 
 
-def generate_token(
+def generate_token(  # noqa: PLR0913
     token_type: Literal["access", "refresh"],
     /,
     *,
@@ -56,6 +61,7 @@ def generate_token(
     email: str,
     key: str,
     current_time: int,
+    active: bool = True,
 ) -> str:
     """Generate a JWT token.
 
@@ -65,6 +71,7 @@ def generate_token(
         email: The ` User ` email.
         key: The key to encode the JWT token with.
         current_time: The current time in seconds.
+        active: Whether the ` User ` is active. Defaults to ` True `.
 
     Returns:
         The encoded JWT token.
@@ -74,6 +81,7 @@ def generate_token(
         payload={
             "sub": str(user_id),
             "email": email,
+            "active": active,
         },
         key=key,
         algorithm=settings.jwt.ALGORITHM,
@@ -90,6 +98,10 @@ def get_token_payload(
 ) -> dict[str, Any] | None:
     """Get payload from a JWT token.
 
+    Verified payloads are cached by the digest of the token until the token
+    expires, so repeated requests with the same token skip decoding and
+    signature verification. Invalid tokens are never cached.
+
     Arguments:
         token_type: The type of JWT token.
         token: The JWT token.
@@ -99,6 +111,15 @@ def get_token_payload(
         The payload of the JWT token if the token type matches and signature
             is valid, otherwise ` None `.
     """
+    cache_key: tuple[str, str, bytes] = (
+        token_type,
+        key,
+        hashlib.sha256(token.encode()).digest(),
+    )
+    cached_payload: dict[str, Any] | None = token_cache.get(cache_key)
+    if cached_payload is not None:
+        return dict(cached_payload)
+
     try:
         if pyjwt.get_unverified_header(token).get("typ", None) != token_type:
             return None
@@ -122,4 +143,13 @@ def get_token_payload(
     except pyjwt.InvalidTokenError:
         return None
 
+    token_cache.set(
+        cache_key,
+        dict(token_payload),
+        expires_at=min(
+            token_payload["exp"],
+            time.time() + settings.cache.TOKEN_TTL_SECONDS,
+        ),
+    )
+
     return token_payload
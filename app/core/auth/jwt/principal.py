@@ -0,0 +1,44 @@
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+
+class Principal(NamedTuple):
+    """Identity of an authenticated ` User ` taken from verified JWT claims.
+
+    Unlike the ` User ` model it is built without querying the database.
+    """
+
+    id: int
+    email: str
+    active: bool
+
+    @classmethod
+    def from_token_payload(
+        cls,
+        token_payload: Mapping[str, Any],
+        /,
+    ) -> "Principal | None":
+        """Build a ` Principal ` from a verified token payload.
+
+        Tokens issued without the ` active ` claim are treated as active.
+
+        Args:
+            token_payload: The payload of a verified JWT token.
+
+        Returns:
+            The ` Principal ` if the claims are well-formed, otherwise
+                ` None `.
+        """
+        subject: Any = token_payload.get("sub")
+        email: Any = token_payload.get("email")
+        active: Any = token_payload.get("active", True)
+
+        if (
+            not isinstance(subject, str)
+            or not subject.isdigit()
+            or not isinstance(email, str)
+            or not isinstance(active, bool)
+        ):
+            return None
+
+        return cls(id=int(subject), email=email, active=active)
@@ -0,0 +1,37 @@
+"""In-process caches."""
+
+from .cache import Cache
+from .flight import SingleFlight
+from .shared import SharedCache
+from .token import token_cache
+from .url import (
+    UrlRecord,
+    invalidate_url,
+    missing_url_cache,
+    url_cache,
+    url_lookups,
+)
+from .user import (
+    UserRecord,
+    cache_user_record,
+    get_user_record,
+    invalidate_user,
+    user_cache,
+)
+
+__all__ = [
+    "Cache",
+    "SharedCache",
+    "SingleFlight",
+    "UrlRecord",
+    "UserRecord",
+    "cache_user_record",
+    "get_user_record",
+    "invalidate_url",
+    "invalidate_user",
+    "missing_url_cache",
+    "token_cache",
+    "url_cache",
+    "url_lookups",
+    "user_cache",
+]
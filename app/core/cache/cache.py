@@ -0,0 +1,123 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class Cache[KT, VT]:
+    """Bounded in-memory cache with LRU eviction and per-entry expiration.
+
+    Examples:
+        >>> cache: Cache[str, int] = Cache(max_size=2, ttl=60)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: The maximum number of entries. The least recently used
+                entry is evicted when the limit is exceeded.
+            ttl: The default number of seconds an entry stays valid.
+            clock: The time source used for expiration. Defaults to
+                ` time.monotonic `.
+        """
+        self._entries: OrderedDict[KT, tuple[float, VT]] = OrderedDict()
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._clock: Callable[[], float] = clock
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: KT, /) -> VT | None:
+        """Get a value from the cache.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The cached value if present and not expired, otherwise ` None `.
+        """
+        entry: tuple[float, VT] | None = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(
+        self,
+        key: KT,
+        value: VT,
+        /,
+        *,
+        expires_at: float | None = None,
+    ) -> None:
+        """Put a value into the cache.
+
+        Args:
+            key: The key of the entry.
+            value: The value to cache.
+            expires_at: The moment, in ` clock ` units, after which the entry
+                is no longer valid. Defaults to ` ttl ` seconds from now.
+        """
+        if expires_at is None:
+            expires_at = self._clock() + self._ttl
+
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: KT, /) -> None:
+        """Remove an entry from the cache if it is present.
+
+        Args:
+            key: The key of the entry.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get the cache counters.
+
+        Returns:
+            The hit, miss, eviction and expiration counters along with the
+                current number of entries.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+
+class SingleFlight[KT, VT]:
+    """Coalescing of concurrent calls for the same key.
+
+    The first caller of a key runs the call, every caller arriving while it
+    is in flight waits for and shares its result instead of running the
+    same call again. A call whose key is forgotten keeps running for its
+    callers, but its result is no longer shared or stored.
+
+    Examples:
+        >>> flight: SingleFlight[str, int] = SingleFlight()
+        >>> async def load() -> int:
+        ...     return 1
+        >>> asyncio.run(flight.do("a", load))
+        1
+    """
+
+    def __init__(self) -> None:
+        """Initialize without calls in flight."""
+        self._calls: dict[KT, asyncio.Future[VT]] = {}
+
+        self.calls: int = 0
+        self.coalesced: int = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: KT,
+        function: Callable[[], Awaitable[VT]],
+        /,
+        *,
+        store: Callable[[VT], None] | None = None,
+    ) -> VT:
+        """Run a call, or wait for the call of the same key in flight.
+
+        If the call in flight fails, its callers get the same exception. If
+        it is cancelled, its callers run the call again.
+
+        Args:
+            key: The key of the call.
+            function: The function running the call.
+            store: The function called with the result of the call, e.g. to
+                cache it, unless the key was forgotten meanwhile. Defaults to
+                ` None `.
+
+        Returns:
+            The result of the call.
+        """
+        future: asyncio.Future[VT] | None = self._calls.get(key)
+
+        if future is None:
+            return await self._run(key, function, store=store)
+
+        self.coalesced += 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+
+        return await self.do(key, function, store=store)
+
+    def forget(self, key: KT, /) -> None:
+        """Forget the call of a key in flight, if any.
+
+        Callers arriving afterwards run a new call and the result of the
+        forgotten call is not stored.
+
+        Args:
+            key: The key of the call.
+        """
+        self._calls.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Get the coalescing counters.
+
+        Returns:
+            The number of calls run, calls coalesced into a call in flight
+                and calls currently in flight.
+        """
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
+
+    async def _run(
+        self,
+        key: KT,
+        function: Callable[[], Awaitable[VT]],
+        /,
+        *,
+        store: Callable[[VT], None] | None,
+    ) -> VT:
+        future: asyncio.Future[VT] = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.calls += 1
+
+        try:
+            result: VT = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()
+            raise
+        finally:
+            current: bool = self._calls.get(key) is future
+            if current:
+                del self._calls[key]
+
+        future.set_result(result)
+        if current and store is not None:
+            store(result)
+
+        return result
@@ -0,0 +1,224 @@
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+class SharedCache[VT]:
+    """Bounded cache with per-entry expiration kept in a local SQLite file.
+
+    Every process that opens the same file shares the entries, so a value
+    cached or invalidated by one worker is seen by the others. It is a local
+    stand-in for an external store and exposes the same interface as
+    ` Cache `. The size limit is checked every few writes of each process,
+    evicting the entries closest to their expiration first, so it may be
+    briefly exceeded. The counters are per process.
+
+    Calls may wait up to a second on the file lock of another process, so
+    async code should run them in a worker thread. The connection is shared
+    by the threads under a lock.
+
+    Examples:
+        >>> cache: SharedCache[str] = SharedCache(
+        ...     path=Path(":memory:"),
+        ...     max_size=2,
+        ...     ttl=60,
+        ...     encode=str,
+        ...     decode=str,
+        ... )
+        >>> cache.set(1, "a")
+        >>> cache.get(1)
+        'a'
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        path: Path,
+        max_size: int,
+        ttl: float,
+        encode: Callable[[VT], str],
+        decode: Callable[[str], VT],
+        clock: Callable[[], float] = time.time,
+        eviction_interval: int = 64,
+    ) -> None:
+        """Initialize the cache.
+
+        The file is opened on first use, so processes forked afterwards each
+        get their own connection.
+
+        Args:
+            path: The path of the SQLite file shared by the processes.
+            max_size: The maximum number of entries.
+            ttl: The default number of seconds an entry stays valid.
+            encode: The function serializing a value to text.
+            decode: The function deserializing a value from text.
+            clock: The time source used for expiration, it must be shared by
+                the processes. Defaults to ` time.time `.
+            eviction_interval: The number of writes of this process between
+                checks of the size limit. Defaults to ` 64 `.
+        """
+        self._path: Path = path
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._encode: Callable[[VT], str] = encode
+        self._decode: Callable[[str], VT] = decode
+        self._clock: Callable[[], float] = clock
+        self._eviction_interval: int = eviction_interval
+        self._writes: int = 0
+        self._size: int = 0
+        self._connection: sqlite3.Connection | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            row: tuple[int] = (
+                self._connect()
+                .execute(
+                    "SELECT COUNT(*) FROM entries",
+                )
+                .fetchone()
+            )
+
+        return row[0]
+
+    def get(self, key: int | str, /) -> VT | None:
+        """Get a value from the cache.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The cached value if present and not expired, otherwise ` None `.
+        """
+        with self._lock:
+            connection: sqlite3.Connection = self._connect()
+            row: tuple[float, str] | None = connection.execute(
+                "SELECT expires_at, value FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = row
+            if expires_at <= self._clock():
+                connection.execute(
+                    "DELETE FROM entries WHERE key = ? AND expires_at = ?",
+                    (key, expires_at),
+                )
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return self._decode(value)
+
+    def set(
+        self,
+        key: int | str,
+        value: VT,
+        /,
+        *,
+        expires_at: float | None = None,
+    ) -> None:
+        """Put a value into the cache.
+
+        Args:
+            key: The key of the entry.
+            value: The value to cache.
+            expires_at: The moment, in ` clock ` units, after which the entry
+                is no longer valid. Defaults to ` ttl ` seconds from now.
+        """
+        if expires_at is None:
+            expires_at = self._clock() + self._ttl
+
+        with self._lock:
+            connection: sqlite3.Connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                (key, expires_at, self._encode(value)),
+            )
+
+            self._writes += 1
+            if self._writes >= self._eviction_interval:
+                self._writes = 0
+                self._evict(connection)
+
+    def delete(self, key: int | str, /) -> None:
+        """Remove an entry from the cache if it is present.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM entries WHERE key = ?",
+                (key,),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+
+    def stats(self) -> dict[str, int]:
+        """Get the cache counters.
+
+        Returns:
+            The hit, miss, eviction and expiration counters of this process
+                along with the number of shared entries left by its last
+                check of the size limit.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": self._size,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection: sqlite3.Connection = sqlite3.connect(
+                self._path,
+                timeout=1.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key PRIMARY KEY, "
+                "expires_at REAL NOT NULL, value TEXT NOT NULL)",
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_expires_at "
+                "ON entries (expires_at)",
+            )
+            self._connection = connection
+
+        return self._connection
+
+    def _evict(self, connection: sqlite3.Connection, /) -> None:
+        row: tuple[int] = connection.execute(
+            "SELECT COUNT(*) FROM entries",
+        ).fetchone()
+        overflow: int = row[0] - self._max_size
+
+        if overflow > 0:
+            self.evictions += connection.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY expires_at LIMIT ?)",
+                (overflow,),
+            ).rowcount
+
+        self._size = row[0] - max(overflow, 0)
@@ -0,0 +1,20 @@
+import time
+from typing import Any
+
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+from .cache import Cache
+
+token_cache: Cache[tuple[str, str, bytes], dict[str, Any]] = Cache(
+    max_size=settings.cache.TOKEN_MAX_SIZE,
+    ttl=settings.cache.TOKEN_TTL_SECONDS,
+    clock=time.time,
+)
+"""Cache of verified JWT token digests to their decoded payload.
+
+Entries are keyed by the token type, the key the token was verified with and
+the SHA-256 digest of the token, and expire together with the token itself.
+"""
+
+metrics.register("token_cache", token_cache.stats)
@@ -0,0 +1,51 @@
+from typing import NamedTuple
+
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+from .cache import Cache
+from .flight import SingleFlight
+
+
+class UrlRecord(NamedTuple):
+    """Compact ` Url ` data required to serve a redirect."""
+
+    id: int
+    source: str
+    redirect_status: int
+    cache_max_age: int | None
+
+
+url_cache: Cache[str, UrlRecord] = Cache(
+    max_size=settings.cache.URL_MAX_SIZE,
+    ttl=settings.cache.URL_TTL_SECONDS,
+)
+"""Cache of slugs to their ` UrlRecord `."""
+
+missing_url_cache: Cache[str, bool] = Cache(
+    max_size=settings.cache.URL_MISSING_MAX_SIZE,
+    ttl=settings.cache.URL_MISSING_TTL_SECONDS,
+)
+"""Short-lived cache of slugs that do not belong to any ` Url `."""
+
+url_lookups: SingleFlight[str, UrlRecord | None] = SingleFlight()
+"""Coalescing of concurrent database lookups of the same slug."""
+
+
+def invalidate_url(slug: str, /) -> None:
+    """Drop everything cached about a slug.
+
+    The lookup of the slug in flight, if any, is forgotten, so a stale miss
+    read before the ` Url ` was committed is not cached.
+
+    Args:
+        slug: The slug of the created, updated or deleted ` Url `.
+    """
+    url_cache.delete(slug)
+    missing_url_cache.delete(slug)
+    url_lookups.forget(slug)
+
+
+metrics.register("url_cache", url_cache.stats)
+metrics.register("missing_url_cache", missing_url_cache.stats)
+metrics.register("url_lookups", url_lookups.stats)
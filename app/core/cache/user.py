@@ -0,0 +1,107 @@
+import asyncio
+import json
+from typing import NamedTuple
+
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+from .cache import Cache
+from .shared import SharedCache
+
+
+class UserRecord(NamedTuple):
+    """Compact ` User ` data required to serve an authenticated request."""
+
+    id: int
+    email: str
+    first_name: str
+    last_name: str | None
+    active: bool
+
+
+def _encode_user_record(record: UserRecord, /) -> str:
+    return json.dumps(list(record))
+
+
+def _decode_user_record(value: str, /) -> UserRecord:
+    return UserRecord(*json.loads(value))
+
+
+user_cache: Cache[int, UserRecord] | SharedCache[UserRecord] = (
+    SharedCache(
+        path=settings.cache.USER_SHARED_PATH,
+        max_size=settings.cache.USER_MAX_SIZE,
+        ttl=settings.cache.USER_TTL_SECONDS,
+        encode=_encode_user_record,
+        decode=_decode_user_record,
+    )
+    if settings.cache.USER_SHARED_PATH is not None
+    else Cache(
+        max_size=settings.cache.USER_MAX_SIZE,
+        ttl=settings.cache.USER_TTL_SECONDS,
+    )
+)
+"""Cache of ` User ` ids to their ` UserRecord `.
+
+The cache is shared by the workers through a local file when
+` CACHE_USER_SHARED_PATH ` is set, otherwise it is kept in-process.
+"""
+
+
+async def get_user_record(user_id: int, /) -> UserRecord | None:
+    """Get the cached ` UserRecord ` of a ` User `.
+
+    The shared cache is read in a worker thread, so a file locked by another
+    worker does not block the event loop.
+
+    Args:
+        user_id: The unique identifier of the ` User `.
+
+    Returns:
+        The cached record if present and not expired, otherwise ` None `.
+    """
+    if isinstance(user_cache, SharedCache):
+        return await asyncio.to_thread(user_cache.get, user_id)
+
+    return user_cache.get(user_id)
+
+
+async def cache_user_record(record: UserRecord, /) -> None:
+    """Cache the ` UserRecord ` of a ` User `.
+
+    Args:
+        record: The record to cache under the id of the ` User `.
+    """
+    if isinstance(user_cache, SharedCache):
+        await asyncio.to_thread(user_cache.set, record.id, record)
+    else:
+        user_cache.set(record.id, record)
+
+
+async def invalidate_user(user_id: int, /) -> None:
+    """Drop the cached ` UserRecord ` of a ` User `.
+
+    It must be called after the change to the ` User ` is committed,
+    otherwise another worker may cache the previous record again.
+
+    Args:
+        user_id: The unique identifier of the updated ` User `.
+    """
+    if isinstance(user_cache, SharedCache):
+        await asyncio.to_thread(user_cache.delete, user_id)
+    else:
+        user_cache.delete(user_id)
+
+
+def _collect_user_cache_stats() -> dict[str, int | float]:
+    stats: dict[str, int] = user_cache.stats()
+    lookups: int = stats["hits"] + stats["misses"]
+
+    return {
+        **stats,
+        "hit_ratio": stats["hits"] / lookups if lookups else 0.0,
+        "database_calls_saved": stats["hits"],
+    }
+
+
+metrics.register("user_cache", _collect_user_cache_stats)
@@ -0,0 +1,18 @@
+"""Click ingestion."""
+
+from .buffer import ClickBuffer, ClickEvent, OverflowPolicy
+from .hyperloglog import HyperLogLog
+from .ingestion import add_visitors, click_buffer, flush_clicks
+from .rollup import ClickAggregator, click_aggregator
+
+__all__ = [
+    "ClickAggregator",
+    "ClickBuffer",
+    "ClickEvent",
+    "HyperLogLog",
+    "OverflowPolicy",
+    "add_visitors",
+    "click_aggregator",
+    "click_buffer",
+    "flush_clicks",
+]
@@ -0,0 +1,166 @@
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from enum import StrEnum
+from typing import NamedTuple
+
+from app.core.logger import logger
+
+
+class ClickEvent(NamedTuple):
+    """A ` Click ` waiting to be written to the database."""
+
+    url_id: int
+    ip: str | None
+    created_at: datetime
+
+
+class OverflowPolicy(StrEnum):
+    """What to do with a new event when the buffer is full."""
+
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+
+type Flush = Callable[[list[ClickEvent]], Awaitable[None]]
+
+
+class ClickBuffer:
+    """Write-behind buffer for ` Click ` events.
+
+    Events are queued in memory and written by a background task in batches,
+    either when ` batch_size ` events are pending or every ` flush_interval `
+    seconds, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        *,
+        flush: Flush,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow_policy: OverflowPolicy,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            flush: The coroutine function that persists a batch of events.
+            max_size: The maximum number of pending events.
+            batch_size: The maximum number of events passed to ` flush ` at
+                once.
+            flush_interval: The maximum number of seconds an event waits
+                before being flushed.
+            overflow_policy: What to do with a new event when the buffer is
+                full.
+        """
+        self._flush: Flush = flush
+        self._events: deque[ClickEvent] = deque()
+        self._max_size: int = max_size
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval
+        self._overflow_policy: OverflowPolicy = overflow_policy
+        self._batch_ready: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping: bool = False
+
+        self.enqueued: int = 0
+        self.dropped: int = 0
+        self.flushed: int = 0
+        self.failed: int = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def put(self, event: ClickEvent, /) -> bool:
+        """Queue an event without waiting.
+
+        Args:
+            event: The event to queue.
+
+        Returns:
+            ` True ` if the event was queued, ` False ` if it was dropped
+                because the buffer is full.
+        """
+        if len(self._events) >= self._max_size:
+            self.dropped += 1
+
+            if self._overflow_policy == OverflowPolicy.DROP_NEWEST:
+                return False
+
+            self._events.popleft()
+
+        self._events.append(event)
+        self.enqueued += 1
+
+        if len(self._events) >= self._batch_size:
+            self._batch_ready.set()
+
+        return True
+
+    def start(self) -> None:
+        """Start the background flusher.
+
+        This method must be called from a running event loop.
+        """
+        if self._task is None:
+            self._batch_ready = asyncio.Event()
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and flush all pending events.
+
+        This method must be called when the application is shutting down.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._batch_ready.set()
+            await self._task
+            self._task = None
+
+        await self.drain()
+
+    async def drain(self) -> None:
+        """Flush all pending events in batches."""
+        while self._events:
+            batch: list[ClickEvent] = [
+                self._events.popleft()
+                for _ in range(min(self._batch_size, len(self._events)))
+            ]
+
+            try:
+                await self._flush(batch)
+            except Exception:  # noqa: BLE001
+                self.failed += len(batch)
+                logger.exception(f"Failed to flush {len(batch)} clicks.")
+            else:
+                self.flushed += len(batch)
+
+    def stats(self) -> dict[str, int]:
+        """Get the buffer counters.
+
+        Returns:
+            The number of enqueued, dropped, flushed and failed events along
+                with the current number of pending events.
+        """
+        return {
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "flushed": self.flushed,
+            "failed": self.failed,
+            "pending": len(self._events),
+        }
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._batch_ready.wait(),
+                    timeout=self._flush_interval,
+                )
+
+            self._batch_ready.clear()
+            await self.drain()
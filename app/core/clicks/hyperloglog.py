@@ -0,0 +1,218 @@
+import hashlib
+import math
+import zlib
+
+_HASH_BITS: int = 64
+_MIN_PRECISION: int = 4
+_MAX_PRECISION: int = 18
+
+
+class HyperLogLog:
+    """Probabilistic counter of distinct strings in constant memory.
+
+    Every item is hashed into one of ` 2 ** precision ` registers, which
+    keeps the longest run of leading zeros seen in the rest of the hash.
+    Sketches are merged by keeping the maximum of every register, so the
+    count of a union is estimated from the sketches of its parts. The
+    relative standard error of the estimate is about
+    ` 1.04 / sqrt(2 ** precision) `.
+
+    Examples:
+        >>> hyperloglog: HyperLogLog = HyperLogLog(precision=12)
+        >>> for item in ("a", "b", "a"):
+        ...     hyperloglog.add(item)
+        >>> hyperloglog.count()
+        2
+    """
+
+    def __init__(self, *, precision: int) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            precision: The number of hash bits selecting the register,
+                between ` 4 ` and ` 18 `.
+
+        Raises:
+            ValueError: The precision is out of range.
+        """
+        if not _MIN_PRECISION <= precision <= _MAX_PRECISION:
+            error_message: str = (
+                f"Precision should be between {_MIN_PRECISION} and "
+                f"{_MAX_PRECISION}."
+            )
+            raise ValueError(error_message)
+
+        self._precision: int = precision
+        self._registers: bytearray = bytearray(1 << precision)
+
+    @classmethod
+    def from_bytes(cls: type["HyperLogLog"], data: bytes, /) -> "HyperLogLog":
+        """Load a sketch serialized with ` to_bytes `.
+
+        Args:
+            data: The serialized sketch.
+
+        Raises:
+            ValueError: The data is not a valid sketch.
+
+        Returns:
+            The sketch.
+        """
+        try:
+            registers: bytes = zlib.decompress(data)
+        except zlib.error as error:
+            error_message: str = "Data is not a valid sketch."
+            raise ValueError(error_message) from error
+
+        hyperloglog: HyperLogLog = cls(
+            precision=registers[0] if registers else 0,
+        )
+        if len(registers) - 1 != len(hyperloglog._registers):
+            error_message = "Data is not a valid sketch."
+            raise ValueError(error_message)
+
+        hyperloglog._registers[:] = registers[1:]
+
+        return hyperloglog
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch.
+
+        The registers of sketches of few items are mostly empty, so they
+        compress to a small fraction of their size.
+
+        Returns:
+            The compressed precision and registers.
+        """
+        return zlib.compress(bytes((self._precision,)) + self._registers)
+
+    @property
+    def precision(self) -> int:
+        """The number of hash bits selecting the register."""
+        return self._precision
+
+    @property
+    def registers(self) -> memoryview:
+        """A read-only view of the registers."""
+        return memoryview(self._registers).toreadonly()
+
+    @property
+    def error(self) -> float:
+        """The relative standard error of the estimate."""
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def add(self, item: str, /) -> None:
+        """Add an item to the sketch.
+
+        Args:
+            item: The item to add.
+        """
+        value: int = int.from_bytes(
+            hashlib.blake2b(item.encode(), digest_size=8).digest(),
+        )
+        bits: int = _HASH_BITS - self._precision
+        index: int = value >> bits
+        rank: int = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+
+        self._registers[index] = max(self._registers[index], rank)
+
+    def update(self, other: "HyperLogLog", /) -> None:
+        """Merge another sketch into this one.
+
+        Sketches of different precisions are merged at the lower precision
+        of both, so sketches written with different settings stay
+        mergeable.
+
+        Args:
+            other: The sketch to merge.
+        """
+        if other.precision < self._precision:
+            registers: bytearray = self._registers
+            precision: int = self._precision
+            self._precision = other.precision
+            self._registers = bytearray(1 << other.precision)
+            self._fold(registers, precision=precision)
+
+        if other.precision == self._precision:
+            self._registers[:] = map(max, self._registers, other.registers)
+        else:
+            self._fold(other.registers, precision=other.precision)
+
+    def count(self) -> int:
+        """Estimate the number of distinct items added.
+
+        The estimate is computed from the histogram of the registers with
+        the improved estimator of Ertl, which needs no bias correction
+        tables and is accurate from empty to full sketches.
+
+        Returns:
+            The estimated number of distinct items.
+        """
+        size: int = len(self._registers)
+        bits: int = _HASH_BITS - self._precision
+        estimate: float = size * _tau(
+            1 - self._registers.count(bits + 1) / size,
+        )
+
+        for rank in range(bits, 0, -1):
+            estimate = (estimate + self._registers.count(rank)) / 2
+
+        estimate += size * _sigma(self._registers.count(0) / size)
+
+        return round(size**2 / (2 * math.log(2) * estimate))
+
+    def _fold(
+        self,
+        registers: bytearray | memoryview,
+        /,
+        *,
+        precision: int,
+    ) -> None:
+        shift: int = precision - self._precision
+
+        for index, rank in enumerate(registers):
+            if not rank:
+                continue
+
+            dropped: int = index & ((1 << shift) - 1)
+            folded: int = (
+                shift - dropped.bit_length() + 1 if dropped else shift + rank
+            )
+            self._registers[index >> shift] = max(
+                self._registers[index >> shift],
+                folded,
+            )
+
+
+def _sigma(ratio: float, /) -> float:
+    if ratio == 1:
+        return math.inf
+
+    weight: float = 1.0
+    result: float = ratio
+    previous: float = -1.0
+
+    while result != previous:
+        previous = result
+        ratio *= ratio
+        result += ratio * weight
+        weight *= 2
+
+    return result
+
+
+def _tau(ratio: float, /) -> float:
+    if ratio in {0, 1}:
+        return 0.0
+
+    weight: float = 1.0
+    result: float = 1 - ratio
+    previous: float = -1.0
+
+    while result != previous:
+        previous = result
+        ratio = math.sqrt(ratio)
+        weight /= 2
+        result -= (1 - ratio) ** 2 * weight
+
+    return result / 3
@@ -0,0 +1,105 @@
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database import database
+from app.core.geo import geo_locator
+from app.core.metrics import metrics
+from app.core.settings import settings
+from app.core.settings.data import IP
+
+from .buffer import ClickBuffer, ClickEvent, OverflowPolicy
+from .hyperloglog import HyperLogLog
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from app.crud.click import ClickRow
+
+
+async def add_visitors(
+    *,
+    async_session: AsyncSession,
+    clicks: list["ClickRow"],
+) -> None:
+    """Add the IP addresses of ` Click `'s to the visitor sketches.
+
+    The ` HyperLogLog ` sketches of this worker are read, merged with the
+    ones of the batch and written back in the current transaction. Every
+    worker owns its rows, so concurrent workers never overwrite each other.
+
+    Args:
+        async_session: The async database session.
+        clicks: The ` Click ` rows of the batch.
+    """
+    sketches: dict[tuple[int, date], HyperLogLog] = {}
+
+    for click in clicks:
+        if click["ip"] is not None:
+            sketches.setdefault(
+                (click["url_id"], click["created_at"].date()),
+                HyperLogLog(precision=settings.click.VISITORS_PRECISION),
+            ).add(click["ip"])
+
+    stored: dict[
+        tuple[int, date],
+        bytes,
+    ] = await crud.get_worker_visitor_sketches(
+        async_session=async_session,
+        worker=settings.database.MACHINE_ID,
+        keys=sketches.keys(),
+    )
+    for key, sketch in stored.items():
+        sketches[key].update(HyperLogLog.from_bytes(sketch))
+
+    await crud.save_visitor_sketches(
+        async_session=async_session,
+        worker=settings.database.MACHINE_ID,
+        sketches={key: sketch.to_bytes() for key, sketch in sketches.items()},
+        commit=False,
+    )
+
+
+async def flush_clicks(events: list[ClickEvent], /) -> None:
+    """Resolve the origin of ` ClickEvent `'s and write them to the database.
+
+    Countries are resolved in memory through the ` geo_locator `, each
+    distinct IP address in the batch only once. The visitor sketches are
+    updated in the same transaction as the ` Click `'s.
+
+    Args:
+        events: The events to write.
+    """
+    countries: dict[str, str | None] = geo_locator.lookup_many(
+        event.ip for event in events if event.ip
+    )
+
+    async with database.create_async_session() as async_session:
+        clicks: list[ClickRow] = [
+            {
+                "url_id": event.url_id,
+                "ip": (
+                    event.ip
+                    if event.ip and IP.validate_length(event.ip)
+                    else None
+                ),
+                "country": countries.get(event.ip) if event.ip else None,
+                "created_at": event.created_at,
+            }
+            for event in events
+        ]
+        await add_visitors(async_session=async_session, clicks=clicks)
+        await crud.create_clicks(async_session=async_session, clicks=clicks)
+
+
+click_buffer: ClickBuffer = ClickBuffer(
+    flush=flush_clicks,
+    max_size=settings.click.BUFFER_MAX_SIZE,
+    batch_size=settings.click.BATCH_SIZE,
+    flush_interval=settings.click.FLUSH_INTERVAL_SECONDS,
+    overflow_policy=OverflowPolicy(settings.click.OVERFLOW_POLICY),
+)
+"""The write-behind buffer for ` Click `'s."""
+
+metrics.register("click_buffer", click_buffer.stats)
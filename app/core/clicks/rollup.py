@@ -0,0 +1,128 @@
+import asyncio
+import contextlib
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database import database
+from app.core.database.id_generator import IdGenerator
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+
+class ClickAggregator:
+    """Background aggregator of ` Click `'s into the rollup tables.
+
+    ` Click `'s are read in id order after a high-water mark stored in the
+    database and added to the hourly, daily and per-country daily counts of
+    their ` Url `. ` Click `'s younger than the settle delay are left for
+    the next run, so ones committed late by another process are not
+    skipped. Statistics read from the rollups lag behind the raw
+    ` Click `'s by up to the settle delay plus the interval.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float,
+        batch_size: int,
+        settle_delay: float,
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            interval: The number of seconds between runs.
+            batch_size: The maximum number of ` Click `'s rolled up in a
+                transaction.
+            settle_delay: The number of seconds a ` Click ` id must be old
+                before it is rolled up. It must exceed the time between the
+                generation of an id and the commit of its ` Click `.
+        """
+        self._interval: float = interval
+        self._batch_size: int = batch_size
+        self._settle_delay: float = settle_delay
+        self._task: asyncio.Task[None] | None = None
+
+        self.runs: int = 0
+        self.aggregated: int = 0
+        self.run_seconds: float = 0.0
+
+    async def aggregate(self, *, async_session: AsyncSession) -> int:
+        """Roll up every settled ` Click ` after the high-water mark.
+
+        Args:
+            async_session: The async database session.
+
+        Returns:
+            The number of ` Click `'s rolled up.
+        """
+        started_at: float = time.perf_counter()
+        before_id: int = IdGenerator.first_id(time.time() - self._settle_delay)
+        total: int = 0
+
+        while (
+            count := await crud.rollup_clicks(
+                async_session=async_session,
+                before_id=before_id,
+                limit=self._batch_size,
+            )
+        ) == self._batch_size:
+            total += count
+
+        total += count
+        self.runs += 1
+        self.aggregated += total
+        self.run_seconds = time.perf_counter() - started_at
+
+        return total
+
+    def start(self) -> None:
+        """Start the aggregator in background.
+
+        This method must be called from a running event loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the aggregator."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def stats(self) -> dict[str, int | float]:
+        """Get the aggregator counters.
+
+        Returns:
+            The number of completed runs, ` Click `'s rolled up and the
+                duration of the last run in seconds.
+        """
+        return {
+            "runs": self.runs,
+            "aggregated": self.aggregated,
+            "run_seconds": self.run_seconds,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with database.create_async_session() as async_session:
+                    await self.aggregate(async_session=async_session)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to roll up clicks.")
+
+            await asyncio.sleep(self._interval)
+
+
+click_aggregator: ClickAggregator = ClickAggregator(
+    interval=settings.click.ROLLUP_INTERVAL_SECONDS,
+    batch_size=settings.click.ROLLUP_BATCH_SIZE,
+    settle_delay=settings.click.ROLLUP_SETTLE_SECONDS,
+)
+"""The aggregator of ` Click `'s into the rollup tables."""
+
+metrics.register("click_aggregator", click_aggregator.stats)
@@ -48,6 +48,14 @@ class Database:
         finally:
             await async_session.close()
 
+    def create_async_session(self) -> AsyncSession:
+        """Create a new async session outside of a request.
+
+        The caller is responsible for closing the session, e.g. by using it
+        as an async context manager.
+        """
+        return self._async_sessionmaker()
+
     async def shutdown(self) -> None:
         """Shutdown the database connections.
 
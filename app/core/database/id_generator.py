@@ -2,6 +2,8 @@ from snowflake import SnowflakeGenerator
 
 from app.core.settings import settings
 
+_TIMESTAMP_SHIFT: int = 22
+
 
 class IdGenerator:
     """Generator for unique identifiers using the Snowflake ID.
@@ -34,6 +36,21 @@ class IdGenerator:
         """
         return int(next(self._snowflake_generator))
 
+    @staticmethod
+    def first_id(timestamp: float, /) -> int:
+        """Get the smallest identifier that can be generated at a moment.
+
+        Identifiers generated before the moment are smaller than it, on any
+        machine whose clock is correct.
+
+        Args:
+            timestamp: The moment, as a POSIX timestamp in seconds.
+
+        Returns:
+            The smallest identifier of the moment.
+        """
+        return int(timestamp * 1000) << _TIMESTAMP_SHIFT
+
 
 id_generator: IdGenerator = IdGenerator(
     machine_id=settings.database.MACHINE_ID,
@@ -2,10 +2,31 @@
 
 from .click import Click
 from .model import Model
-from .network import Network
+from .network import Network, network_staging
+from .rollup import (
+    daily_clicks,
+    daily_country_clicks,
+    daily_visitors,
+    hourly_clicks,
+    rollup_cursors,
+)
 from .status import Status
 from .tag import Tag
 from .url import Url
 from .user import User
 
-__all__ = ["Click", "Model", "Network", "Status", "Tag", "Url", "User"]
+__all__ = [
+    "Click",
+    "Model",
+    "Network",
+    "Status",
+    "Tag",
+    "Url",
+    "User",
+    "daily_clicks",
+    "daily_country_clicks",
+    "daily_visitors",
+    "hourly_clicks",
+    "network_staging",
+    "rollup_cursors",
+]
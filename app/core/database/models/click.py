@@ -1,4 +1,6 @@
-from sqlalchemy import ForeignKey, String
+from typing import Any
+
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +14,10 @@ from .url import Url
 class Click(Model, TableNameMixin, IdMixin, CreatedAtMixin):
     """Click event on a shortened URL."""
 
+    __table_args__: tuple[Any, ...] = (
+        Index("ix_Clicks_url_id_created_at_id", "url_id", "created_at", "id"),
+    )
+
     _url_id: Mapped[int] = mapped_column(
         "url_id",
         ForeignKey(Url.id),
@@ -31,7 +37,7 @@ class Click(Model, TableNameMixin, IdMixin, CreatedAtMixin):
     url: Mapped["Url"] = relationship(
         "Url",
         back_populates="clicks",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __init__(
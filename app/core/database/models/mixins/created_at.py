@@ -1,20 +1,23 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.core.utils import utcnow
+
 
 class CreatedAtMixin:
     """Mixin for models that require a created_at timestamp column.
 
-    Automatically sets the creation time of a record.
+    Automatically sets the creation time of a record. The time is generated
+    by the application, so it is known without reading the record back.
     """
 
     _created_at: Mapped[datetime] = mapped_column(
         "created_at",
         DateTime(),
-        default=func.now(),
+        default=utcnow,
         nullable=False,
         sort_order=1,
     )
@@ -1,22 +1,26 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.core.utils import utcnow
+
 
 class UpdatedAtMixin:
     """Mixin for models that require an updated_at timestamp column.
 
-    Automatically tracks the last modification time of the record.
+    Automatically tracks the last modification time of the record. The time
+    is generated by the application, so it is known without reading the
+    record back.
     """
 
     _updated_at: Mapped[datetime] = mapped_column(
         "updated_at",
         DateTime(),
-        default=func.now(),
+        default=utcnow,
         nullable=False,
-        onupdate=func.now(),
+        onupdate=utcnow,
         sort_order=0,
     )
 
@@ -1,6 +1,7 @@
-from ipaddress import IPv4Network
+from ipaddress import IPv4Network, IPv6Network, ip_network
+from typing import Any
 
-from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy import Column, Index, Integer, SmallInteger, String, Table
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -8,11 +9,17 @@ from app.core.settings.data import Country
 
 from .mixins import CreatedAtMixin, TableNameMixin
 from .model import Model
+from .types import IPAddressInteger
 
 
 class Network(Model, TableNameMixin, CreatedAtMixin):
     """Model for network to country mapping."""
 
+    __table_args__: tuple[Any, ...] = (
+        Index("ix_Networks_version_start_address", "version", "start_address"),
+        {"sqlite_autoincrement": True},
+    )
+
     _id: Mapped[int] = mapped_column(
         "id",
         Integer(),
@@ -20,14 +27,19 @@ class Network(Model, TableNameMixin, CreatedAtMixin):
         primary_key=True,
         autoincrement=True,
     )
+    _version: Mapped[int] = mapped_column(
+        "version",
+        SmallInteger(),
+        nullable=False,
+    )
     _start_address: Mapped[int] = mapped_column(
         "start_address",
-        BigInteger(),
+        IPAddressInteger(),
         nullable=False,
     )
     _end_address: Mapped[int] = mapped_column(
         "end_address",
-        BigInteger(),
+        IPAddressInteger(),
         nullable=False,
     )
     _country: Mapped[str] = mapped_column(
@@ -40,18 +52,19 @@ class Network(Model, TableNameMixin, CreatedAtMixin):
         """Initialize a ` Network ` model instance.
 
         Args:
-            address: The ` Network ` address.
+            address: The IPv4 or IPv6 ` Network ` address.
             mask: The ` Network ` mask.
             country: The ISO 3166-1 country code.
 
         Raises:
             ValueError: If the input values are invalid.
         """
-        network: IPv4Network = IPv4Network(f"{address}/{mask}")
+        network: IPv4Network | IPv6Network = ip_network(f"{address}/{mask}")
 
         if not Country.validate_length(country) or not country.isalpha():
             raise ValueError
 
+        self._version = network.version
         self._start_address = int(network.network_address)
         self._end_address = int(network.broadcast_address)
         self._country = country
@@ -61,6 +74,11 @@ class Network(Model, TableNameMixin, CreatedAtMixin):
         """The auto-incremented identifier."""
         return self._id
 
+    @hybrid_property
+    def version(self) -> int:
+        """The IP version of the ` Network `, either ` 4 ` or ` 6 `."""
+        return self._version
+
     @hybrid_property
     def start_address(self) -> int:
         """The start address of the ` Network `."""
@@ -81,3 +99,20 @@ class Network(Model, TableNameMixin, CreatedAtMixin):
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} {self.country}>"
+
+
+network_staging: Table = Table(
+    "NetworksStaging",
+    Model.metadata,
+    Column("version", SmallInteger(), nullable=False),
+    Column("start_address", IPAddressInteger(), nullable=False),
+    Column("end_address", IPAddressInteger(), nullable=False),
+    Column("country", String(length=Country.MAX_LENGTH), nullable=False),
+    Index(
+        "ix_NetworksStaging_version_start_address",
+        "version",
+        "start_address",
+    ),
+)
+"""Staging table for ` Network ` ranges of an import that replaces the
+current ones."""
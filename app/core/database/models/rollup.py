@@ -0,0 +1,68 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    Table,
+)
+
+from app.core.settings.data import Country
+
+from .model import Model
+from .url import Url
+
+hourly_clicks: Table = Table(
+    "HourlyClicks",
+    Model.metadata,
+    Column("url_id", BigInteger(), ForeignKey(Url.id), primary_key=True),
+    Column("bucket", DateTime(), primary_key=True),
+    Column("clicks", Integer(), nullable=False),
+)
+"""Number of ` Click `'s per ` Url ` and hour, the bucket is the start of
+the hour in UTC."""
+
+daily_clicks: Table = Table(
+    "DailyClicks",
+    Model.metadata,
+    Column("url_id", BigInteger(), ForeignKey(Url.id), primary_key=True),
+    Column("bucket", Date(), primary_key=True),
+    Column("clicks", Integer(), nullable=False),
+)
+"""Number of ` Click `'s per ` Url ` and day in UTC."""
+
+daily_country_clicks: Table = Table(
+    "DailyCountryClicks",
+    Model.metadata,
+    Column("url_id", BigInteger(), ForeignKey(Url.id), primary_key=True),
+    Column("bucket", Date(), primary_key=True),
+    Column("country", String(length=Country.MAX_LENGTH), primary_key=True),
+    Column("clicks", Integer(), nullable=False),
+)
+"""Number of ` Click `'s per ` Url `, day in UTC and country. ` Click `'s
+of unknown origin are only counted in ` daily_clicks `."""
+
+daily_visitors: Table = Table(
+    "DailyVisitors",
+    Model.metadata,
+    Column("url_id", BigInteger(), ForeignKey(Url.id), primary_key=True),
+    Column("bucket", Date(), primary_key=True),
+    Column("worker", SmallInteger(), primary_key=True),
+    Column("sketch", LargeBinary(), nullable=False),
+)
+"""HyperLogLog sketch of the IP addresses of the ` Click `'s per ` Url `,
+day in UTC and machine id of the worker that ingested them. Every worker
+only writes its own rows, the sketches are merged when read."""
+
+rollup_cursors: Table = Table(
+    "RollupCursors",
+    Model.metadata,
+    Column("name", String(length=32), primary_key=True),
+    Column("last_id", BigInteger(), nullable=False),
+)
+"""High-water marks of the rollups, the id of the last ` Click ` included
+in each of them."""
@@ -0,0 +1,37 @@
+from sqlalchemy import LargeBinary
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+IP_ADDRESS_SIZE: int = 16
+"""The number of bytes needed to store any IPv4 or IPv6 address."""
+
+
+class IPAddressInteger(TypeDecorator[int]):
+    """128-bit unsigned integer column for IPv4 and IPv6 addresses.
+
+    Values are stored as fixed-width big-endian bytes, so the database orders
+    and compares them exactly like the integers they represent.
+    """
+
+    impl = LargeBinary(length=IP_ADDRESS_SIZE)
+    cache_ok = True
+
+    def process_bind_param(
+        self,
+        value: int | None,
+        dialect: Dialect,  # noqa: ARG002
+    ) -> bytes | None:
+        if value is None:
+            return None
+
+        return value.to_bytes(IP_ADDRESS_SIZE, "big")
+
+    def process_result_value(
+        self,
+        value: bytes | None,
+        dialect: Dialect,  # noqa: ARG002
+    ) -> int | None:
+        if value is None:
+            return None
+
+        return int.from_bytes(value, "big")
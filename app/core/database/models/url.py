@@ -4,7 +4,12 @@ from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.settings.data import Slug, Source
+from app.core.settings.data import (
+    Redirect,
+    RedirectStatus,
+    Slug,
+    Source,
+)
 
 from .mixins import CreatedAtMixin, IdMixin, TableNameMixin, UpdatedAtMixin
 from .model import Model
@@ -40,20 +45,31 @@ class Url(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
         Integer(),
         nullable=False,
     )
+    _redirect_status: Mapped[int] = mapped_column(
+        "redirect_status",
+        Integer(),
+        nullable=False,
+        default=RedirectStatus.TEMPORARY_REDIRECT,
+    )
+    _cache_max_age: Mapped[int | None] = mapped_column(
+        "cache_max_age",
+        Integer(),
+        nullable=True,
+    )
 
     tags: Mapped[list["Tag"]] = relationship(
         "Tag",
-        lazy="selectin",
+        lazy="raise",
     )
     author: Mapped["User"] = relationship(
         "User",
         back_populates="urls",
-        lazy="selectin",
+        lazy="raise",
     )
     clicks: Mapped[list["Click"]] = relationship(
         "Click",
         back_populates="url",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __init__(
@@ -62,6 +78,8 @@ class Url(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
         user_id: int,
         source: str,
         slug: str,
+        redirect_status: int = RedirectStatus.TEMPORARY_REDIRECT,
+        cache_max_age: int | None = None,
     ) -> None:
         """Initialize a ` Url ` model instance.
 
@@ -69,11 +87,20 @@ class Url(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
             user_id: The unique identifier of the ` User `.
             source: The original URL address.
             slug: The unique slug that identifies the shortened URL.
+            redirect_status: The HTTP status of the redirect. Defaults to
+                ` 307 `.
+            cache_max_age: The number of seconds clients and shared caches
+                may reuse the redirect. Defaults to None.
+
+        Raises:
+            ValueError: If the input values are invalid.
         """
         self._user_id = user_id
         self.source = source
         self.slug = slug
         self.total_clicks = 0
+        self.redirect_status = redirect_status
+        self.cache_max_age = cache_max_age
 
     @hybrid_property
     def user_id(self) -> int:
@@ -116,5 +143,29 @@ class Url(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
 
         self._total_clicks = value
 
+    @hybrid_property
+    def redirect_status(self) -> int:
+        """The HTTP status of the redirect."""
+        return self._redirect_status
+
+    @redirect_status.inplace.setter
+    def _redirect_status_setter(self, value: int) -> None:
+        if value not in RedirectStatus:
+            raise ValueError
+
+        self._redirect_status = value
+
+    @hybrid_property
+    def cache_max_age(self) -> int | None:
+        """The number of seconds caches may reuse the redirect."""
+        return self._cache_max_age
+
+    @cache_max_age.inplace.setter
+    def _cache_max_age_setter(self, value: int | None) -> None:
+        if value is not None and not 0 <= value <= Redirect.MAX_CACHE_MAX_AGE:
+            raise ValueError
+
+        self._cache_max_age = value
+
     def __repr__(self) -> str:
         return f"<{type(self).__name__} /{self.slug} -> {self.source}>"
@@ -1,10 +1,10 @@
 from typing import TYPE_CHECKING
 
-import bcrypt
 from sqlalchemy import String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.passwords.hashing import check_password, hash_password
 from app.core.settings import settings
 from app.core.settings.data import Email, FirstName, LastName, Password, Phone
 
@@ -47,12 +47,12 @@ class User(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
 
     status: Mapped["Status"] = relationship(
         "Status",
-        lazy="selectin",
+        lazy="raise",
     )
     urls: Mapped[list["Url"]] = relationship(
         "Url",
         back_populates="author",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __init__(
@@ -62,6 +62,7 @@ class User(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
         last_name: str | None = None,
         email: str,
         password: str,
+        is_password_hashed: bool = False,
     ) -> None:
         """Initialize a ` User ` model instance.
 
@@ -70,12 +71,24 @@ class User(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
             last_name: The ` User `'s last name. Defaults to None.
             email: The ` User `'s email address.
             password: The ` User `'s password.
+            is_password_hashed: Whether the password is already hashed, e.g.
+                by the ` password_hasher `. Defaults to ` False `.
+
+        Raises:
+            ValueError: If the input values are invalid.
         """
         self.first_name = first_name
         self.last_name = last_name
         self.email = email
         self.phone = None
-        self.password = password
+
+        if not is_password_hashed:
+            self.password = password
+        elif len(password) > Password.HASHED_LENGTH:
+            error_message: str = "Hashed password is too long."
+            raise ValueError(error_message)
+        else:
+            self._password = password
 
     @hybrid_property
     def first_name(self) -> str:
@@ -137,7 +150,7 @@ class User(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
         if not Password.validate_length(value):
             raise ValueError
 
-        self._password = self._hash_password(
+        self._password = hash_password(
             value,
             rounds=settings.database.SALT_ROUNDS,
         )
@@ -150,32 +163,15 @@ class User(Model, TableNameMixin, IdMixin, UpdatedAtMixin, CreatedAtMixin):
     def is_password_valid(self, password: str, /) -> bool:
         """Check if the password is valid for the ` User `.
 
+        This call blocks, use the ` password_hasher ` from async code.
+
         Args:
             password: The password to check.
 
         Returns:
             ` True ` if the password is valid, ` False ` otherwise.
         """
-        return bcrypt.checkpw(
-            password=password.encode("utf-8"),
-            hashed_password=self.password.encode("utf-8"),
-        )
-
-    @staticmethod
-    def _hash_password(password: str, *, rounds: int) -> str:
-        """Hash the password using bcrypt library.
-
-        Args:
-            password: The password to hash.
-            rounds: The number of rounds to hash the password.
-
-        Returns:
-            The hashed password.
-        """
-        return bcrypt.hashpw(
-            password.encode(encoding="utf-8"),
-            bcrypt.gensalt(rounds=rounds, prefix=b"2b"),
-        ).decode(encoding="utf-8")
+        return check_password(password, self.password)
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} {self.display_name}>"
@@ -0,0 +1,14 @@
+"""IP address geolocation."""
+
+from .file import MappedNetworkIndex, write_geo_file
+from .index import NetworkIndex, merge_network_ranges
+from .locator import GeoLocator, geo_locator
+
+__all__ = [
+    "GeoLocator",
+    "MappedNetworkIndex",
+    "NetworkIndex",
+    "geo_locator",
+    "merge_network_ranges",
+    "write_geo_file",
+]
@@ -0,0 +1,247 @@
+"""Compact binary geo database file.
+
+The file starts with a fixed-size little-endian header followed by the
+payload, made of fixed-width columns of sorted, merged, non-overlapping
+address ranges:
+
+- ` magic ` (4 bytes), ` version ` (u16), ` country_count ` (u16),
+  ` ipv4_count ` (u32), ` ipv6_count ` (u32) and the CRC-32 ` checksum `
+  (u32) of the payload.
+- ` ipv4_count ` start addresses, end addresses (u32) and country indexes
+  (u16).
+- ` ipv6_count ` start addresses, end addresses (16 bytes, big-endian) and
+  country indexes (u16).
+- ` country_count ` two-letter ASCII country codes.
+"""
+
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Literal
+
+from app.core.database.models.types import IP_ADDRESS_SIZE
+from app.crud.network import NetworkRange
+
+from .index import NetworkColumns, NetworkIndex, merge_network_ranges
+
+GEO_FILE_MAGIC: bytes = b"UGEO"
+"""The first bytes of every geo database file."""
+
+GEO_FILE_VERSION: int = 2
+"""The version of the geo database file format."""
+
+_HEADER: struct.Struct = struct.Struct("<4sHHIII")
+_IPV4_VERSION: int = 4
+_IPV6_VERSION: int = 6
+_IPV4_ADDRESS_SIZE: int = 4
+_COUNTRY_INDEX_SIZE: int = 2
+_COUNTRY_LENGTH: int = 2
+
+
+def write_geo_file(
+    path: Path,
+    network_ranges: Iterable[NetworkRange],
+    /,
+) -> int:
+    """Compile address ranges into a geo database file.
+
+    The file is written next to the destination and renamed over it, so
+    processes that have the previous file mapped keep reading a consistent
+    copy.
+
+    Args:
+        path: The destination file path.
+        network_ranges: The ranges to compile, in any order.
+
+    Returns:
+        The number of ranges written after merging.
+    """
+    merged: list[NetworkRange] = merge_network_ranges(network_ranges)
+
+    countries: list[str] = sorted({r.country for r in merged})
+    country_indexes: dict[str, int] = {
+        country: index for index, country in enumerate(countries)
+    }
+
+    ipv4_ranges: list[NetworkRange] = [
+        r for r in merged if r.version == _IPV4_VERSION
+    ]
+    ipv6_ranges: list[NetworkRange] = [
+        r for r in merged if r.version == _IPV6_VERSION
+    ]
+
+    payload: bytes = b"".join(
+        (
+            _encode_ipv4_addresses([r.start_address for r in ipv4_ranges]),
+            _encode_ipv4_addresses([r.end_address for r in ipv4_ranges]),
+            _encode_country_indexes(
+                [country_indexes[r.country] for r in ipv4_ranges],
+            ),
+            *(r.start_address.to_bytes(IP_ADDRESS_SIZE) for r in ipv6_ranges),
+            *(r.end_address.to_bytes(IP_ADDRESS_SIZE) for r in ipv6_ranges),
+            _encode_country_indexes(
+                [country_indexes[r.country] for r in ipv6_ranges],
+            ),
+            "".join(countries).encode("ascii"),
+        ),
+    )
+    header: bytes = _HEADER.pack(
+        GEO_FILE_MAGIC,
+        GEO_FILE_VERSION,
+        len(countries),
+        len(ipv4_ranges),
+        len(ipv6_ranges),
+        zlib.crc32(payload),
+    )
+
+    temporary_path: Path = path.with_name(f"{path.name}.tmp")
+    temporary_path.write_bytes(header + payload)
+    temporary_path.replace(path)
+
+    return len(merged)
+
+
+class MappedNetworkIndex(NetworkIndex):
+    """` NetworkIndex ` backed by a memory-mapped geo database file.
+
+    The columns are read straight from the mapping, so every process that
+    opens the same file shares one copy of it through the page cache.
+    """
+
+    def __init__(self, path: Path, /) -> None:
+        """Map and validate a geo database file.
+
+        Args:
+            path: The geo database file path.
+
+        Raises:
+            ValueError: If the file is not a valid geo database file of the
+                supported version or its checksum does not match.
+        """
+        with path.open("rb") as file:
+            if path.stat().st_size < _HEADER.size:
+                error_message: str = f"{path} is not a geo database file."
+                raise ValueError(error_message)
+
+            self._mmap: mmap.mmap = mmap.mmap(
+                file.fileno(),
+                0,
+                access=mmap.ACCESS_READ,
+            )
+
+        magic, version, country_count, ipv4_count, ipv6_count, checksum = (
+            _HEADER.unpack_from(self._mmap)
+        )
+        if magic != GEO_FILE_MAGIC or version != GEO_FILE_VERSION:
+            error_message = f"{path} has an unsupported format or version."
+            raise ValueError(error_message)
+
+        view: memoryview = memoryview(self._mmap)[_HEADER.size :]
+        ipv4_size: int = ipv4_count * (
+            _IPV4_ADDRESS_SIZE * 2 + _COUNTRY_INDEX_SIZE
+        )
+        ipv6_size: int = ipv6_count * (
+            IP_ADDRESS_SIZE * 2 + _COUNTRY_INDEX_SIZE
+        )
+        if (
+            len(view) != ipv4_size + ipv6_size + country_count * _COUNTRY_LENGTH
+            or zlib.crc32(view) != checksum
+        ):
+            error_message = f"{path} is corrupted."
+            raise ValueError(error_message)
+
+        self._ipv4 = NetworkColumns(
+            start_addresses=_column(view, 0, ipv4_count, "I"),
+            end_addresses=_column(view, 1, ipv4_count, "I"),
+            country_indexes=_column(
+                view[ipv4_count * _IPV4_ADDRESS_SIZE * 2 :],
+                0,
+                ipv4_count,
+                "H",
+            ),
+        )
+        view = view[ipv4_size:]
+        self._ipv6 = NetworkColumns(
+            start_addresses=BigEndianColumn(view, 0, ipv6_count),
+            end_addresses=BigEndianColumn(view, 1, ipv6_count),
+            country_indexes=_column(
+                view[ipv6_count * IP_ADDRESS_SIZE * 2 :],
+                0,
+                ipv6_count,
+                "H",
+            ),
+        )
+        countries: str = bytes(view[ipv6_size:]).decode("ascii")
+        self._countries = [
+            countries[offset : offset + _COUNTRY_LENGTH]
+            for offset in range(0, len(countries), _COUNTRY_LENGTH)
+        ]
+
+
+class BigEndianColumn:
+    """Column of 128-bit big-endian addresses read from a buffer on demand."""
+
+    def __init__(self, view: memoryview, position: int, length: int) -> None:
+        """Wrap the column at the given position of a buffer.
+
+        Args:
+            view: The buffer holding consecutive columns of equal length.
+            position: The position of the column among the columns.
+            length: The number of addresses in the column.
+        """
+        offset: int = position * length * IP_ADDRESS_SIZE
+        self._view: memoryview = view[
+            offset : offset + length * IP_ADDRESS_SIZE
+        ]
+        self._length: int = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int, /) -> int:
+        if not 0 <= index < self._length:
+            raise IndexError
+
+        offset: int = index * IP_ADDRESS_SIZE
+        return int.from_bytes(self._view[offset : offset + IP_ADDRESS_SIZE])
+
+
+def _encode_ipv4_addresses(addresses: list[int], /) -> bytes:
+    column: array[int] = array("I", addresses)
+    if sys.byteorder != "little":
+        column.byteswap()
+
+    return column.tobytes()
+
+
+def _encode_country_indexes(country_indexes: list[int], /) -> bytes:
+    column: array[int] = array("H", country_indexes)
+    if sys.byteorder != "little":
+        column.byteswap()
+
+    return column.tobytes()
+
+
+def _column(
+    view: memoryview,
+    position: int,
+    length: int,
+    typecode: Literal["I", "H"],
+    /,
+) -> Sequence[int]:
+    size: int = array(typecode).itemsize
+    offset: int = position * length * size
+    view = view[offset : offset + length * size]
+
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+
+    column: array[int] = array(typecode)
+    column.frombytes(view)
+    column.byteswap()
+
+    return column
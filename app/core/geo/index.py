@@ -0,0 +1,190 @@
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from ipaddress import IPv4Address, IPv6Address, ip_address
+from typing import NamedTuple, Protocol
+
+from app.crud.network import NetworkRange
+
+
+def merge_network_ranges(
+    network_ranges: Iterable[NetworkRange],
+    /,
+) -> list[NetworkRange]:
+    """Merge address ranges into sorted, non-overlapping ranges.
+
+    Overlapping or adjacent ranges of the same IP version and country are
+    joined into one. Where ranges of different countries overlap, the range
+    that starts first wins the shared addresses.
+
+    Args:
+        network_ranges: The ranges to merge, in any order.
+
+    Returns:
+        The merged ranges ordered by their IP version and start address.
+    """
+    merged: list[NetworkRange] = []
+
+    for network_range in sorted(
+        network_ranges,
+        key=lambda r: (r.version, r.start_address, r.end_address),
+    ):
+        start_address: int = network_range.start_address
+
+        if (
+            merged
+            and merged[-1].version == network_range.version
+            and start_address <= merged[-1].end_address + 1
+        ):
+            previous: NetworkRange = merged[-1]
+
+            if previous.country == network_range.country:
+                merged[-1] = NetworkRange(
+                    start_address=previous.start_address,
+                    end_address=max(
+                        previous.end_address,
+                        network_range.end_address,
+                    ),
+                    country=previous.country,
+                    version=previous.version,
+                )
+                continue
+
+            start_address = max(start_address, previous.end_address + 1)
+
+        if start_address <= network_range.end_address:
+            merged.append(
+                NetworkRange(
+                    start_address=start_address,
+                    end_address=network_range.end_address,
+                    country=network_range.country,
+                    version=network_range.version,
+                ),
+            )
+
+    return merged
+
+
+class AddressColumn(Protocol):
+    """Read-only column of sorted integers that supports a binary search."""
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int, /) -> int: ...
+
+
+class NetworkColumns(NamedTuple):
+    """Sorted, non-overlapping address ranges of one IP version."""
+
+    start_addresses: AddressColumn
+    end_addresses: AddressColumn
+    country_indexes: AddressColumn
+
+    def find(self, address: int, /) -> int | None:
+        """Find the range an address belongs to with a binary search.
+
+        Args:
+            address: The integer value of the address.
+
+        Returns:
+            The country index of the range if found, otherwise ` None `.
+        """
+        position: int = bisect_right(self.start_addresses, address) - 1
+
+        if position < 0 or self.end_addresses[position] < address:
+            return None
+
+        return self.country_indexes[position]
+
+
+class NetworkIndex:
+    """Immutable in-memory index of IPv4 and IPv6 ` Network ` ranges.
+
+    Ranges of each IP version are stored in their own sorted columns and
+    looked up with a binary search. IPv4 columns are array-backed, IPv6
+    columns hold 128-bit Python integers. Ranges are merged with
+    ` merge_network_ranges ` first, so nested or overlapping ranges resolve
+    like they do in the geo database file.
+    """
+
+    def __init__(self, network_ranges: Iterable[NetworkRange], /) -> None:
+        """Build the index.
+
+        Args:
+            network_ranges: The ranges to index, in any order.
+        """
+        columns: dict[int, tuple[list[int], list[int], array[int]]] = {
+            4: ([], [], array("H")),
+            6: ([], [], array("H")),
+        }
+        countries: dict[str, int] = {}
+
+        for network_range in merge_network_ranges(network_ranges):
+            start_addresses, end_addresses, country_indexes = columns[
+                network_range.version
+            ]
+            start_addresses.append(network_range.start_address)
+            end_addresses.append(network_range.end_address)
+            country_indexes.append(
+                countries.setdefault(network_range.country, len(countries)),
+            )
+
+        ipv4_start_addresses, ipv4_end_addresses, ipv4_country_indexes = (
+            columns[4]
+        )
+        self._ipv4: NetworkColumns = NetworkColumns(
+            start_addresses=array("L", ipv4_start_addresses),
+            end_addresses=array("L", ipv4_end_addresses),
+            country_indexes=ipv4_country_indexes,
+        )
+        self._ipv6: NetworkColumns = NetworkColumns(*columns[6])
+        self._countries: Sequence[str] = list(countries)
+
+    def __len__(self) -> int:
+        return len(self._ipv4.start_addresses) + len(
+            self._ipv6.start_addresses,
+        )
+
+    def lookup(self, ip: str, /) -> str | None:
+        """Find the country of an IP address.
+
+        IPv4-mapped IPv6 addresses are looked up as IPv4 addresses.
+
+        Args:
+            ip: The IPv4 or IPv6 address.
+
+        Returns:
+            The ISO 3166-1 country code if the address belongs to an indexed
+                range, otherwise ` None `.
+        """
+        try:
+            address: IPv4Address | IPv6Address = ip_address(ip)
+        except ValueError:
+            return None
+
+        if isinstance(address, IPv6Address) and address.ipv4_mapped:
+            address = address.ipv4_mapped
+
+        columns: NetworkColumns = (
+            self._ipv4 if isinstance(address, IPv4Address) else self._ipv6
+        )
+        country_index: int | None = columns.find(int(address))
+
+        if country_index is None:
+            return None
+
+        return self._countries[country_index]
+
+    def lookup_many(self, ips: Iterable[str], /) -> dict[str, str | None]:
+        """Find the countries of many IP addresses at once.
+
+        Every distinct address is resolved only once.
+
+        Args:
+            ips: The IP addresses.
+
+        Returns:
+            The mapping of every distinct IP address to its country code, or
+                ` None ` if it does not belong to an indexed range.
+        """
+        return {ip: self.lookup(ip) for ip in set(ips)}
@@ -0,0 +1,196 @@
+import asyncio
+import contextlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database import database
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+from .file import MappedNetworkIndex
+from .index import NetworkIndex
+
+if TYPE_CHECKING:
+    import os
+
+    from app.crud.network import NetworkRange
+
+
+class GeoLocator:
+    """Resolves IP addresses to countries through a ` NetworkIndex `.
+
+    The index is loaded from the ` Network ` table, or memory-mapped from a
+    geo database file compiled by ` www ` if a path is given, and replaced as
+    a whole whenever its source changes. Lookups never observe a partially
+    built index.
+    """
+
+    def __init__(
+        self,
+        *,
+        reload_interval: float,
+        path: Path | None = None,
+    ) -> None:
+        """Initialize the locator with an empty index.
+
+        Args:
+            reload_interval: The number of seconds between checks for changes
+                of the index source.
+            path: The geo database file path. Defaults to ` None `, in which
+                case the ` Network ` table is used.
+        """
+        self._index: NetworkIndex = NetworkIndex([])
+        self._fingerprint: tuple[int, ...] | None = None
+        self._reload_interval: float = reload_interval
+        self._path: Path | None = path
+        self._task: asyncio.Task[None] | None = None
+
+        self.reloads: int = 0
+
+    @property
+    def index(self) -> NetworkIndex:
+        """The current ` NetworkIndex `."""
+        return self._index
+
+    def lookup(self, ip: str, /) -> str | None:
+        """Find the country of an IP address.
+
+        Args:
+            ip: The IP address.
+
+        Returns:
+            The ISO 3166-1 country code if known, otherwise ` None `.
+        """
+        return self._index.lookup(ip)
+
+    def lookup_many(self, ips: Iterable[str], /) -> dict[str, str | None]:
+        """Find the countries of many IP addresses at once.
+
+        Args:
+            ips: The IP addresses.
+
+        Returns:
+            The mapping of every distinct IP address to its country code.
+        """
+        return self._index.lookup_many(ips)
+
+    async def refresh(self) -> bool:
+        """Rebuild the index if its source has changed.
+
+        Returns:
+            ` True ` if the index was rebuilt, ` False ` otherwise.
+        """
+        if self._path is not None:
+            return await self.reload_file(self._path)
+
+        async with database.create_async_session() as async_session:
+            return await self.reload(async_session=async_session)
+
+    async def reload(self, *, async_session: AsyncSession) -> bool:
+        """Rebuild the index if the ` Network ` table has changed.
+
+        The new index is built off the event loop and swapped in atomically.
+
+        Args:
+            async_session: The async database session.
+
+        Returns:
+            ` True ` if the index was rebuilt, ` False ` otherwise.
+        """
+        fingerprint: tuple[int, int] = await crud.get_networks_fingerprint(
+            async_session=async_session,
+        )
+
+        if fingerprint == self._fingerprint:
+            return False
+
+        network_ranges: list[NetworkRange] = await crud.get_network_ranges(
+            async_session=async_session,
+        )
+        self._index = await asyncio.to_thread(NetworkIndex, network_ranges)
+        self._fingerprint = fingerprint
+        self.reloads += 1
+
+        logger.info(f"Loaded {len(self._index)} networks into the geo index.")
+
+        return True
+
+    async def reload_file(self, path: Path, /) -> bool:
+        """Map a geo database file if it has been replaced.
+
+        Args:
+            path: The geo database file path.
+
+        Returns:
+            ` True ` if the index was replaced, ` False ` otherwise.
+
+        Raises:
+            ValueError: If the file is corrupted or of an unsupported version.
+        """
+        stat: os.stat_result = await asyncio.to_thread(path.stat)
+        fingerprint: tuple[int, ...] = (
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+
+        if fingerprint == self._fingerprint:
+            return False
+
+        self._index = await asyncio.to_thread(MappedNetworkIndex, path)
+        self._fingerprint = fingerprint
+        self.reloads += 1
+
+        logger.info(f"Mapped {len(self._index)} networks from {path}.")
+
+        return True
+
+    def start(self) -> None:
+        """Start checking the ` Network ` table for changes in background.
+
+        This method must be called from a running event loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop checking the ` Network ` table for changes."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def stats(self) -> dict[str, int]:
+        """Get the locator counters.
+
+        Returns:
+            The number of indexed networks and completed reloads.
+        """
+        return {
+            "networks": len(self._index),
+            "reloads": self.reloads,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._reload_interval)
+
+            try:
+                await self.refresh()
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to reload the geo index.")
+
+
+geo_locator: GeoLocator = GeoLocator(
+    reload_interval=settings.geo.RELOAD_INTERVAL_SECONDS,
+    path=settings.geo.DATABASE_PATH,
+)
+"""The IP address to country resolver."""
+
+metrics.register("geo", geo_locator.stats)
@@ -0,0 +1,57 @@
+from collections.abc import Callable, Mapping
+
+from app.core.settings import settings
+
+type Collector = Callable[[], Mapping[str, int | float]]
+
+
+class Metrics:
+    """Registry of in-process counters.
+
+    Components register a collector under a unique name. The collected values
+    are rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, *, namespace: str) -> None:
+        """Initialize the registry.
+
+        Args:
+            namespace: The prefix for every metric name.
+        """
+        self._namespace: str = namespace
+        self._collectors: dict[str, Collector] = {}
+
+    def register(self, name: str, collector: Collector, /) -> None:
+        """Register a collector.
+
+        Args:
+            name: The name of the component, e.g. ` url_cache `.
+            collector: A callable returning the current counter values.
+        """
+        self._collectors[name] = collector
+
+    def collect(self) -> dict[str, int | float]:
+        """Collect values from every registered collector.
+
+        Returns:
+            The mapping of fully qualified metric names to their values.
+        """
+        return {
+            f"{self._namespace}_{name}_{key}": value
+            for name, collector in self._collectors.items()
+            for key, value in collector().items()
+        }
+
+    def render(self) -> str:
+        """Render the collected values in the Prometheus text format.
+
+        Returns:
+            One ` name value ` line per metric.
+        """
+        return "".join(
+            f"{name} {value}\n" for name, value in self.collect().items()
+        )
+
+
+metrics: Metrics = Metrics(namespace=settings.app.NAME)
+"""The application metrics registry."""
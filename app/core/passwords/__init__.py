@@ -0,0 +1,11 @@
+"""Password hashing."""
+
+from .hasher import PasswordHasher, password_hasher
+from .hashing import check_password, hash_password
+
+__all__ = [
+    "PasswordHasher",
+    "check_password",
+    "hash_password",
+    "password_hasher",
+]
@@ -0,0 +1,114 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+from .hashing import check_password, hash_password
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop on a bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so the pool runs up to
+    ` max_concurrency ` hashes in parallel while the event loop keeps serving
+    other requests. Further calls wait for a free slot without occupying a
+    thread.
+    """
+
+    def __init__(self, *, max_concurrency: int) -> None:
+        """Initialize the hasher.
+
+        Args:
+            max_concurrency: The maximum number of passwords hashed or checked
+                at once.
+        """
+        self._max_concurrency: int = max_concurrency
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor: ThreadPoolExecutor | None = None
+
+        self.waiting: int = 0
+        self.running: int = 0
+        self.completed: int = 0
+
+    async def hash(self, password: str, /, *, rounds: int) -> str:
+        """Hash the password.
+
+        Args:
+            password: The password to hash.
+            rounds: The number of rounds to hash the password.
+
+        Returns:
+            The hashed password.
+        """
+        return await self._run(lambda: hash_password(password, rounds=rounds))
+
+    async def verify(self, password: str, hashed_password: str, /) -> bool:
+        """Check the password against a bcrypt hash.
+
+        Args:
+            password: The password to check.
+            hashed_password: The bcrypt hash to check the password against.
+
+        Returns:
+            ` True ` if the password matches the hash, ` False ` otherwise.
+        """
+        return await self._run(
+            lambda: check_password(password, hashed_password),
+        )
+
+    def shutdown(self) -> None:
+        """Shutdown the thread pool.
+
+        Pending hashes are completed before the threads exit. The pool is
+        created again on the next call.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, int]:
+        """Get the hasher counters.
+
+        Returns:
+            The number of calls waiting for a free slot, the number of calls
+                in progress and the number of completed calls.
+        """
+        return {
+            "waiting": self.waiting,
+            "running": self.running,
+            "completed": self.completed,
+        }
+
+    async def _run[T](self, function: Callable[[], T], /) -> T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency,
+                thread_name_prefix="password-hasher",
+            )
+
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                function,
+            )
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+
+password_hasher: PasswordHasher = PasswordHasher(
+    max_concurrency=settings.password.MAX_CONCURRENCY,
+)
+"""The password hasher used by request handlers."""
+
+metrics.register("password_hasher", password_hasher.stats)
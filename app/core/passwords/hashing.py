@@ -0,0 +1,39 @@
+import bcrypt
+
+
+def hash_password(password: str, /, *, rounds: int) -> str:
+    """Hash the password using bcrypt library.
+
+    This call blocks for as long as the hashing takes, use the
+    ` password_hasher ` from async code.
+
+    Args:
+        password: The password to hash.
+        rounds: The number of rounds to hash the password.
+
+    Returns:
+        The hashed password.
+    """
+    return bcrypt.hashpw(
+        password.encode(encoding="utf-8"),
+        bcrypt.gensalt(rounds=rounds, prefix=b"2b"),
+    ).decode(encoding="utf-8")
+
+
+def check_password(password: str, hashed_password: str, /) -> bool:
+    """Check the password against a bcrypt hash.
+
+    This call blocks for as long as the hashing takes, use the
+    ` password_hasher ` from async code.
+
+    Args:
+        password: The password to check.
+        hashed_password: The bcrypt hash to check the password against.
+
+    Returns:
+        ` True ` if the password matches the hash, ` False ` otherwise.
+    """
+    return bcrypt.checkpw(
+        password=password.encode("utf-8"),
+        hashed_password=hashed_password.encode("utf-8"),
+    )
@@ -10,10 +10,13 @@ from .ip import IP
 from .last_name import LastName
 from .mail import Email
 from .name import Name
+from .page import Page
 from .password import Password
 from .phone import Phone
+from .redirect import Redirect, RedirectStatus
 from .slug import Slug
 from .source import Source
+from .stats import Stats
 from .user import User
 
 __all__ = [
@@ -29,7 +32,10 @@ __all__ = [
     "Page",
     "Password",
     "Phone",
+    "Redirect",
+    "RedirectStatus",
     "Slug",
     "Source",
+    "Stats",
     "User",
 ]
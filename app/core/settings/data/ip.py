@@ -4,5 +4,5 @@ from .data import Data
 class IP(Data):
     """` Click ` IP address length constraints."""
 
-    MIN_LENGTH: int = len("1.1.1.1")
-    MAX_LENGTH: int = len("255.255.255.255")
+    MIN_LENGTH: int = len("::")
+    MAX_LENGTH: int = len("ffff:ffff:ffff:ffff:ffff:ffff:255.255.255.255")
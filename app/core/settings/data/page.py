@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class Page(StrEnum):
+    """Frontend pages the redirector can send the client to."""
+
+    NOT_FOUND = "404"
@@ -0,0 +1,16 @@
+from enum import Enum, IntEnum
+
+
+class RedirectStatus(IntEnum):
+    """HTTP statuses a ` Url ` can redirect with."""
+
+    MOVED_PERMANENTLY = 301
+    FOUND = 302
+    TEMPORARY_REDIRECT = 307
+    PERMANENT_REDIRECT = 308
+
+
+class Redirect(int, Enum):
+    """` Url ` redirect policy constraints."""
+
+    MAX_CACHE_MAX_AGE = 31536000
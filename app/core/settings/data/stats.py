@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class Stats(int, Enum):
+    """` Url ` statistics constraints."""
+
+    DEFAULT_DAYS = 30
+    MAX_DAYS = 366
+    MAX_HOURLY_DAYS = 31
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 500
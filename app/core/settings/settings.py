@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Annotated, Literal
 
 from pydantic import Field
@@ -44,10 +45,110 @@ class DevelopmentSettings(BaseSettings):
     )
 
 
+class CacheSettings(BaseSettings):
+    URL_MAX_SIZE: Annotated[int, Field(gt=0)] = 65536
+    URL_TTL_SECONDS: Annotated[int, Field(gt=0)] = 300
+    URL_MISSING_MAX_SIZE: Annotated[int, Field(gt=0)] = 65536
+    URL_MISSING_TTL_SECONDS: Annotated[float, Field(gt=0)] = 5.0
+    TOKEN_MAX_SIZE: Annotated[int, Field(gt=0)] = 65536
+    TOKEN_TTL_SECONDS: Annotated[int, Field(gt=0)] = 3600
+    USER_MAX_SIZE: Annotated[int, Field(gt=0)] = 65536
+    USER_TTL_SECONDS: Annotated[int, Field(gt=0)] = 60
+    USER_SHARED_PATH: Path | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_",
+    )
+
+
+class ClickSettings(BaseSettings):
+    BUFFER_MAX_SIZE: Annotated[int, Field(gt=0)] = 100000
+    BATCH_SIZE: Annotated[int, Field(gt=0)] = 500
+    FLUSH_INTERVAL_SECONDS: Annotated[float, Field(gt=0)] = 1.0
+    OVERFLOW_POLICY: Literal["drop_newest", "drop_oldest"] = "drop_newest"
+    ROLLUP_INTERVAL_SECONDS: Annotated[float, Field(gt=0)] = 5.0
+    ROLLUP_BATCH_SIZE: Annotated[int, Field(gt=0)] = 10000
+    ROLLUP_SETTLE_SECONDS: Annotated[float, Field(ge=0)] = 10.0
+    VISITORS_PRECISION: Annotated[int, Field(ge=4, le=18)] = 12
+
+    model_config = SettingsConfigDict(
+        env_prefix="CLICK_",
+    )
+
+
+class GeoSettings(BaseSettings):
+    RELOAD_INTERVAL_SECONDS: Annotated[float, Field(gt=0)] = 60.0
+    DATABASE_PATH: Path | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="GEO_",
+    )
+
+
+class PasswordSettings(BaseSettings):
+    MAX_CONCURRENCY: Annotated[int, Field(gt=0)] = 2
+
+    model_config = SettingsConfigDict(
+        env_prefix="PASSWORD_",
+    )
+
+
+class SlugSettings(BaseSettings):
+    MIN_LENGTH: Annotated[int, Field(gt=0, le=64)] = 1
+    OBFUSCATION_KEY: Annotated[int, Field(ge=0, lt=1 << 64)] | None = None
+    POOL_LENGTH: Annotated[int, Field(gt=0, le=64)] | None = None
+    POOL_SIZE: Annotated[int, Field(gt=0)] = 10000
+    POOL_LOW_WATER_MARK: Annotated[int, Field(ge=0)] = 2500
+    FILTER_ENABLED: bool = True
+    FILTER_CAPACITY: Annotated[int, Field(gt=0)] = 1000000
+    FILTER_FALSE_POSITIVE_RATE: Annotated[float, Field(gt=0, lt=1)] = 0.01
+    FILTER_SYNC_INTERVAL_SECONDS: Annotated[float, Field(gt=0)] = 1.0
+    FILTER_CATCH_UP_INTERVAL_SECONDS: Annotated[float, Field(ge=0)] = 0.1
+
+    model_config = SettingsConfigDict(
+        env_prefix="SLUG_",
+    )
+
+
+class RedirectSettings(BaseSettings):
+    FAST_PATH_ENABLED: bool = True
+    HEADERS_CACHE_SIZE: Annotated[int, Field(gt=0)] = 4096
+
+    model_config = SettingsConfigDict(
+        env_prefix="REDIRECT_",
+    )
+
+
+class BulkSettings(BaseSettings):
+    MAX_ITEMS: Annotated[int, Field(gt=0)] = 100000
+    MAX_ITEM_SIZE: Annotated[int, Field(gt=0)] = 65536
+    CHUNK_SIZE: Annotated[int, Field(gt=0)] = 500
+
+    model_config = SettingsConfigDict(
+        env_prefix="BULK_",
+    )
+
+
+class MetricsSettings(BaseSettings):
+    TOKEN: Annotated[str, Field(min_length=16)] | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="METRICS_",
+    )
+
+
 class Settings(BaseSettings):
     app: AppSettings = AppSettings()
     database: DatabaseSettings = DatabaseSettings()
     jwt: JWTSettings = JWTSettings()
+    cache: CacheSettings = CacheSettings()
+    click: ClickSettings = ClickSettings()
+    geo: GeoSettings = GeoSettings()
+    password: PasswordSettings = PasswordSettings()
+    slug: SlugSettings = SlugSettings()
+    redirect: RedirectSettings = RedirectSettings()
+    bulk: BulkSettings = BulkSettings()
+    metrics: MetricsSettings = MetricsSettings()
     development: DevelopmentSettings = DevelopmentSettings()
 
     model_config = SettingsConfigDict(
@@ -0,0 +1,16 @@
+"""Slug generation."""
+
+from .bloom import BloomFilter
+from .filter import SlugFilter, slug_filter
+from .generator import SlugGenerator, slug_generator
+from .pool import SlugPool, slug_pool
+
+__all__ = [
+    "BloomFilter",
+    "SlugFilter",
+    "SlugGenerator",
+    "SlugPool",
+    "slug_filter",
+    "slug_generator",
+    "slug_pool",
+]
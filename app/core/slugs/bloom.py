@@ -0,0 +1,105 @@
+import hashlib
+import math
+from collections.abc import Iterator
+
+
+class BloomFilter:
+    """Probabilistic set of strings without false negatives.
+
+    The number of bits and hash functions is derived from the expected
+    number of items and the target false-positive rate. Positions are
+    computed by double hashing a single BLAKE2b digest.
+
+    Examples:
+        >>> bloom_filter: BloomFilter = BloomFilter(
+        ...     capacity=1000,
+        ...     false_positive_rate=0.01,
+        ... )
+        >>> bloom_filter.add("a")
+        >>> "a" in bloom_filter
+        True
+    """
+
+    def __init__(self, *, capacity: int, false_positive_rate: float) -> None:
+        """Initialize an empty filter.
+
+        Args:
+            capacity: The expected number of items.
+            false_positive_rate: The target false-positive rate at capacity,
+                between ` 0 ` and ` 1 `.
+        """
+        self._size: int = max(
+            8,
+            math.ceil(
+                -capacity * math.log(false_positive_rate) / math.log(2) ** 2,
+            ),
+        )
+        self._hashes: int = max(
+            1,
+            round(self._size / max(capacity, 1) * math.log(2)),
+        )
+        self._bits: bytearray = bytearray((self._size + 7) // 8)
+
+        self.capacity: int = capacity
+        self.count: int = 0
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def add(self, item: str, /) -> None:
+        """Add an item to the filter.
+
+        Items that already appear to be present are not counted again.
+
+        Args:
+            item: The item to add.
+        """
+        present: bool = True
+
+        for position in self._positions(item):
+            mask: int = 1 << (position & 7)
+            if not self._bits[position >> 3] & mask:
+                self._bits[position >> 3] |= mask
+                present = False
+
+        if not present:
+            self.count += 1
+
+    @property
+    def memory(self) -> int:
+        """The number of bytes used by the bits of the filter."""
+        return len(self._bits)
+
+    @property
+    def hashes(self) -> int:
+        """The number of hash functions."""
+        return self._hashes
+
+    def estimated_false_positive_rate(self) -> float:
+        """Estimate the current false-positive rate from the added items.
+
+        Returns:
+            The probability that an item never added is reported as present.
+        """
+        return (
+            1 - math.exp(-self._hashes * self.count / self._size)
+        ) ** self._hashes
+
+    def _positions(self, item: str, /) -> Iterator[int]:
+        digest: bytes = hashlib.blake2b(
+            item.encode(),
+            digest_size=16,
+        ).digest()
+        first: int = int.from_bytes(digest[:8])
+        second: int = int.from_bytes(digest[8:]) | 1
+
+        return (
+            (first + index * second) % self._size
+            for index in range(self._hashes)
+        )
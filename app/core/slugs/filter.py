@@ -0,0 +1,261 @@
+import asyncio
+import contextlib
+import math
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database import database
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+from .bloom import BloomFilter
+
+_BATCH_SIZE: int = 10000
+_SNOWFLAKE_TIMESTAMP_SHIFT: int = 22
+
+
+class SlugFilter:
+    """` BloomFilter ` over the slugs of every ` Url `.
+
+    A slug the filter does not contain definitely does not exist, so lookups
+    of unknown slugs are answered without a query. Slugs created by this
+    process are added right away, slugs created by other processes are read
+    by a periodic incremental sync. Until the first sync every slug may
+    exist.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        enabled: bool,
+        capacity: int,
+        false_positive_rate: float,
+        sync_interval: float,
+        catch_up_interval: float = 0.1,
+        sync_overlap: float = 5.0,
+    ) -> None:
+        """Initialize an empty filter.
+
+        Args:
+            enabled: Whether the filter is consulted at all.
+            capacity: The expected number of slugs. The filter is rebuilt
+                with twice the capacity when it is exceeded.
+            false_positive_rate: The target false-positive rate at capacity.
+            sync_interval: The number of seconds between incremental syncs.
+            catch_up_interval: The minimum number of seconds between reads of
+                the newest slugs by ` might_exist_now `. Defaults to ` 0.1 `.
+            sync_overlap: The number of seconds of ids read again by every
+                sync, covering ` Url `'s inserted late by other machines.
+                Defaults to ` 5.0 `.
+        """
+        self._enabled: bool = enabled
+        self._false_positive_rate: float = false_positive_rate
+        self._sync_interval: float = sync_interval
+        self._catch_up_interval: float = catch_up_interval
+        self._sync_overlap: int = (
+            int(sync_overlap * 1000) << _SNOWFLAKE_TIMESTAMP_SHIFT
+        )
+        self._filter: BloomFilter = BloomFilter(
+            capacity=capacity,
+            false_positive_rate=false_positive_rate,
+        )
+        self._last_id: int = 0
+        self._ready: bool = False
+        self._task: asyncio.Task[None] | None = None
+        self._catch_up_task: asyncio.Task[None] | None = None
+        self._caught_up_at: float = -math.inf
+
+        self.syncs: int = 0
+        self.catch_ups: int = 0
+        self.rejected: int = 0
+
+    def might_exist(self, slug: str, /) -> bool:
+        """Check whether a slug may belong to a ` Url `.
+
+        Args:
+            slug: The slug to check.
+
+        Returns:
+            ` False ` if the slug definitely does not exist, otherwise
+                ` True `.
+        """
+        if not self._ready or slug in self._filter:
+            return True
+
+        self.rejected += 1
+
+        return False
+
+    async def might_exist_now(self, slug: str, /) -> bool:
+        """Check whether a slug may belong to a ` Url ` created until now.
+
+        Unlike ` might_exist `, a slug missing from the filter is only
+        rejected after reading the slugs created by other processes since
+        the previous sync. Concurrent checks share that read and it runs at
+        most once every ` catch_up_interval ` seconds, so scans of unknown
+        slugs cost at most one small query per interval, and only slugs
+        created elsewhere within the interval may still be reported missing.
+
+        Args:
+            slug: The slug to check.
+
+        Returns:
+            ` False ` if the slug definitely does not exist, otherwise
+                ` True `. If the newest slugs cannot be read, ` True `.
+        """
+        if not self._ready or slug in self._filter:
+            return True
+
+        try:
+            await self._catch_up()
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to catch up the slug filter.")
+            return True
+
+        return self.might_exist(slug)
+
+    def add(self, *slugs: str) -> None:
+        """Add the slugs of new ` Url `'s.
+
+        Args:
+            *slugs: The slugs to add.
+        """
+        for slug in slugs:
+            self._filter.add(slug)
+
+    async def sync(self, *, async_session: AsyncSession) -> int:
+        """Add the slugs of the ` Url `'s created since the previous sync.
+
+        The first sync reads every slug. If the filter is over capacity
+        afterwards, it is rebuilt with twice the capacity on the next sync.
+
+        Args:
+            async_session: The async database session.
+
+        Returns:
+            The number of slugs read.
+        """
+        if not self._enabled:
+            return 0
+
+        if self._filter.count > self._filter.capacity:
+            self._filter = BloomFilter(
+                capacity=self._filter.capacity * 2,
+                false_positive_rate=self._false_positive_rate,
+            )
+            self._last_id = 0
+            self._ready = False
+
+        total: int = await self._read(
+            async_session=async_session,
+            after_id=max(self._last_id - self._sync_overlap, 0),
+        )
+        self._ready = True
+        self.syncs += 1
+
+        return total
+
+    def start(self) -> None:
+        """Start syncing the filter in background.
+
+        The filter is built right away. This method must be called from a
+        running event loop.
+        """
+        if self._enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop syncing the filter."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def stats(self) -> dict[str, int | float]:
+        """Get the filter counters.
+
+        Returns:
+            The number of slugs, capacity, memory in bytes, hash functions,
+                configured and estimated false-positive rates, completed
+                syncs, reads of the newest slugs and lookups rejected
+                without a query.
+        """
+        return {
+            "slugs": self._filter.count,
+            "capacity": self._filter.capacity,
+            "memory_bytes": self._filter.memory,
+            "hashes": self._filter.hashes,
+            "false_positive_rate": self._false_positive_rate,
+            "estimated_false_positive_rate": (
+                self._filter.estimated_false_positive_rate()
+            ),
+            "syncs": self.syncs,
+            "catch_ups": self.catch_ups,
+            "rejected": self.rejected,
+        }
+
+    async def _read(self, *, async_session: AsyncSession, after_id: int) -> int:
+        total: int = 0
+
+        while batch := await crud.get_url_slugs(
+            async_session=async_session,
+            after_id=after_id,
+            limit=_BATCH_SIZE,
+        ):
+            for _, slug in batch:
+                self._filter.add(slug)
+
+            after_id = batch[-1][0]
+            total += len(batch)
+
+        self._last_id = max(self._last_id, after_id)
+
+        return total
+
+    async def _catch_up(self) -> None:
+        if self._catch_up_task is None:
+            if time.monotonic() - self._caught_up_at < self._catch_up_interval:
+                return
+
+            self._caught_up_at = time.monotonic()
+            self._catch_up_task = asyncio.create_task(self._read_newest())
+
+        await asyncio.shield(self._catch_up_task)
+
+    async def _read_newest(self) -> None:
+        # Late inserts are left to the overlap of the next sync.
+        try:
+            async with database.create_async_session() as async_session:
+                await self._read(
+                    async_session=async_session,
+                    after_id=self._last_id,
+                )
+            self.catch_ups += 1
+        finally:
+            self._catch_up_task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with database.create_async_session() as async_session:
+                    await self.sync(async_session=async_session)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to sync the slug filter.")
+
+            await asyncio.sleep(self._sync_interval)
+
+
+slug_filter: SlugFilter = SlugFilter(
+    enabled=settings.slug.FILTER_ENABLED,
+    capacity=settings.slug.FILTER_CAPACITY,
+    false_positive_rate=settings.slug.FILTER_FALSE_POSITIVE_RATE,
+    sync_interval=settings.slug.FILTER_SYNC_INTERVAL_SECONDS,
+    catch_up_interval=settings.slug.FILTER_CATCH_UP_INTERVAL_SECONDS,
+)
+"""The filter of existing slugs."""
+
+metrics.register("slug_filter", slug_filter.stats)
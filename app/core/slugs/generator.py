@@ -0,0 +1,67 @@
+from collections.abc import Callable
+
+from app.core.database.id_generator import id_generator
+from app.core.settings import settings
+from app.core.utils import base10_to_urlsafe_base64
+
+_MODULUS: int = 1 << 64
+_MULTIPLIER: int = 0x9E3779B97F4A7C15
+
+
+class SlugGenerator:
+    """Generator for slugs that are unique by construction.
+
+    Every slug encodes a unique Snowflake ID, so generating one requires no
+    database lookup. The ID can be obfuscated with a keyed bijection of
+    64-bit integers, so consecutive slugs do not look sequential, and offset
+    so the slug has a minimum length. Both steps are injective, so distinct
+    IDs always give distinct slugs.
+
+    Examples:
+        >>> slug_generator: SlugGenerator = SlugGenerator(
+        ...     ids=itertools.count().__next__,
+        ...     min_length=4,
+        ... )
+        >>> slug_generator()
+        'AQAA'
+    """
+
+    def __init__(
+        self,
+        *,
+        ids: Callable[[], int] = id_generator,
+        min_length: int,
+        obfuscation_key: int | None = None,
+    ) -> None:
+        """Initialize the generator.
+
+        Args:
+            ids: The source of unique non-negative 64-bit integers. Defaults
+                to the ` id_generator `.
+            min_length: The minimum length of the slugs.
+            obfuscation_key: The key of the obfuscation, an integer below
+                ` 2 ** 64 `. Defaults to ` None `, for no obfuscation.
+        """
+        self._ids: Callable[[], int] = ids
+        self._obfuscation_key: int | None = obfuscation_key
+        self._offset: int = 256 ** (3 * (min_length - 1) // 4)
+
+    def __call__(self) -> str:
+        """Generate a unique slug.
+
+        Returns:
+            The URL-safe slug.
+        """
+        number: int = self._ids()
+
+        if self._obfuscation_key is not None:
+            number = (number ^ self._obfuscation_key) * _MULTIPLIER % _MODULUS
+
+        return base10_to_urlsafe_base64(number + self._offset)
+
+
+slug_generator: SlugGenerator = SlugGenerator(
+    min_length=settings.slug.MIN_LENGTH,
+    obfuscation_key=settings.slug.OBFUSCATION_KEY,
+)
+"""The slug generator."""
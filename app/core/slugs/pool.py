@@ -0,0 +1,171 @@
+import asyncio
+import contextlib
+import secrets
+import time
+from collections import deque
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database import database
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.core.settings import settings
+
+_BATCH_SIZE: int = 500
+
+
+class SlugPool:
+    """Pool of short random slugs reserved ahead of the requests.
+
+    A background task generates random slugs of a fixed length in batches,
+    drops the ones already used by a ` Url ` and keeps the rest, so taking a
+    slug is O(1) and needs no uniqueness query. The pool is refilled when it
+    drops below its low-water mark. Slugs are reserved per process, a slug
+    taken meanwhile by another process is rejected by the unique constraint
+    of the ` Url ` slug.
+    """
+
+    def __init__(
+        self,
+        *,
+        length: int | None,
+        size: int,
+        low_water_mark: int,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            length: The length of the slugs. ` None ` disables the pool.
+            size: The number of slugs the pool is refilled to.
+            low_water_mark: The number of slugs below which the pool is
+                refilled.
+        """
+        self._length: int | None = length
+        self._size: int = size
+        self._low_water_mark: int = low_water_mark
+        self._slugs: deque[str] = deque()
+        self._pooled: set[str] = set()
+        self._refill_requested: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+        self.refills: int = 0
+        self.refill_seconds: float = 0.0
+        self.exhausted: int = 0
+
+    def __len__(self) -> int:
+        return len(self._slugs)
+
+    def pop(self) -> str | None:
+        """Take a reserved slug from the pool.
+
+        Returns:
+            The slug, or ` None ` if the pool is disabled or empty.
+        """
+        if self._length is None:
+            return None
+
+        if len(self._slugs) <= self._low_water_mark:
+            self._refill_requested.set()
+
+        if not self._slugs:
+            self.exhausted += 1
+            return None
+
+        slug: str = self._slugs.popleft()
+        self._pooled.discard(slug)
+
+        return slug
+
+    async def refill(self, *, async_session: AsyncSession) -> int:
+        """Fill the pool up to its size with new random slugs.
+
+        Candidates are checked against the ` Url ` slugs in batches. The
+        refill stops early when a whole batch is already taken.
+
+        Args:
+            async_session: The async database session.
+
+        Returns:
+            The number of slugs added to the pool.
+        """
+        if self._length is None:
+            return 0
+
+        started_at: float = time.perf_counter()
+        added: int = 0
+
+        while len(self._slugs) < self._size:
+            candidates: set[str] = {
+                secrets.token_urlsafe(self._length)[: self._length]
+                for _ in range(min(self._size - len(self._slugs), _BATCH_SIZE))
+            } - self._pooled
+            candidates -= await crud.get_existing_slugs(
+                async_session=async_session,
+                slugs=candidates,
+            )
+
+            if not candidates:
+                break
+
+            self._slugs.extend(candidates)
+            self._pooled.update(candidates)
+            added += len(candidates)
+
+        self.refills += 1
+        self.refill_seconds = time.perf_counter() - started_at
+
+        return added
+
+    def start(self) -> None:
+        """Start refilling the pool in background.
+
+        The pool is filled right away. This method must be called from a
+        running event loop.
+        """
+        if self._length is not None and self._task is None:
+            self._refill_requested.set()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop refilling the pool."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def stats(self) -> dict[str, int | float]:
+        """Get the pool counters.
+
+        Returns:
+            The number of pooled slugs, completed refills, pops from an empty
+                pool and the duration of the last refill in seconds.
+        """
+        return {
+            "size": len(self._slugs),
+            "refills": self.refills,
+            "exhausted": self.exhausted,
+            "refill_seconds": self.refill_seconds,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await self._refill_requested.wait()
+            self._refill_requested.clear()
+
+            try:
+                async with database.create_async_session() as async_session:
+                    await self.refill(async_session=async_session)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to refill the slug pool.")
+
+
+slug_pool: SlugPool = SlugPool(
+    length=settings.slug.POOL_LENGTH,
+    size=settings.slug.POOL_SIZE,
+    low_water_mark=settings.slug.POOL_LOW_WATER_MARK,
+)
+"""The pool of reserved short slugs."""
+
+metrics.register("slug_pool", slug_pool.stats)
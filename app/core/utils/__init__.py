@@ -1,6 +1,7 @@
 """Utility functions for the application."""
 
 from .conversion import base10_to_urlsafe_base64
-from .timestamp import now
+from .json_array import JsonArrayParser
+from .timestamp import now, utcnow
 
-__all__ = ["base10_to_urlsafe_base64", "now"]
+__all__ = ["JsonArrayParser", "base10_to_urlsafe_base64", "now", "utcnow"]
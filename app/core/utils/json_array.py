@@ -0,0 +1,144 @@
+import codecs
+import json
+import re
+from collections.abc import Callable
+from typing import NoReturn
+
+_WHITESPACE: re.Pattern[str] = re.compile(r"[ \t\n\r]*")
+_NUMBER_END: re.Pattern[str] = re.compile(r"[ \t\n\r,\]]")
+_ITEM_ENDS: dict[str, re.Pattern[str]] = {
+    '"': re.compile('"'),
+    "{": re.compile("}"),
+    "[": re.compile("]"),
+    "t": re.compile("e"),
+    "f": re.compile("e"),
+    "n": re.compile("l"),
+}
+
+type _Handler = Callable[[int, list[object]], int | None]
+
+
+class JsonArrayParser:
+    """Incremental parser of the elements of a JSON array.
+
+    The array is fed in chunks of bytes as they are received and every
+    complete element is returned as soon as it is parsed, so only the
+    element being received is kept in memory. An incomplete element is only
+    decoded again once a character that may end it is received.
+
+    Examples:
+        >>> parser: JsonArrayParser = JsonArrayParser()
+        >>> parser.feed(b'[{"a": 1}, {"b"')
+        [{'a': 1}]
+        >>> parser.feed(b": 2}]", final=True)
+        [{'b': 2}]
+    """
+
+    def __init__(self) -> None:
+        """Initialize a parser expecting the start of the array."""
+        self._decoder: json.JSONDecoder = json.JSONDecoder()
+        self._text_decoder: codecs.IncrementalDecoder = (
+            codecs.getincrementaldecoder("utf-8")()
+        )
+        self._buffer: str = ""
+        self._final: bool = False
+        self._checked: int = 0
+        self._handler: _Handler = self._start
+
+    @property
+    def pending(self) -> int:
+        """The number of characters received and not parsed yet."""
+        return len(self._buffer)
+
+    def feed(self, data: bytes, /, *, final: bool = False) -> list[object]:
+        """Parse the next chunk of the array.
+
+        Args:
+            data: The next bytes of the array.
+            final: Whether this is the last chunk. Defaults to ` False `.
+
+        Raises:
+            ValueError: The data is not a JSON array.
+
+        Returns:
+            The elements completed by the chunk.
+        """
+        self._buffer += self._text_decoder.decode(data, final=final)
+        self._final = final
+        items: list[object] = []
+        position: int = 0
+
+        while (
+            next_position := self._handler(
+                _WHITESPACE.match(self._buffer, position).end(),  # type: ignore[union-attr]
+                items,
+            )
+        ) is not None:
+            position = next_position
+
+        self._buffer = self._buffer[position:]
+        self._checked = max(self._checked - position, 0)
+        if final and self._handler != self._end:
+            self._raise()
+
+        return items
+
+    def _start(self, position: int, _: list[object], /) -> int | None:
+        if position == len(self._buffer):
+            return None
+        if self._buffer[position] != "[":
+            self._raise()
+
+        self._handler = self._first_item
+        return position + 1
+
+    def _first_item(self, position: int, items: list[object], /) -> int | None:
+        if self._buffer[position : position + 1] == "]":
+            self._handler = self._end
+            return position + 1
+
+        return self._item(position, items)
+
+    def _item(self, position: int, items: list[object], /) -> int | None:
+        if not self._final and not _ITEM_ENDS.get(
+            self._buffer[position : position + 1],
+            _NUMBER_END,
+        ).search(self._buffer, max(position + 1, self._checked)):
+            self._checked = len(self._buffer)
+            return None
+
+        try:
+            item, end = self._decoder.raw_decode(self._buffer, position)
+        except json.JSONDecodeError:
+            self._checked = len(self._buffer)
+            return None
+
+        # A number at the end of the buffer may continue in the next chunk.
+        if not self._final and end == len(self._buffer):
+            return None
+
+        self._checked = 0
+        items.append(item)
+        self._handler = self._separator
+        return end
+
+    def _separator(self, position: int, _: list[object], /) -> int | None:
+        if position == len(self._buffer):
+            return None
+        if self._buffer[position] not in ",]":
+            self._raise()
+
+        self._handler = (
+            self._item if self._buffer[position] == "," else self._end
+        )
+        return position + 1
+
+    def _end(self, position: int, _: list[object], /) -> int | None:
+        if position != len(self._buffer):
+            self._raise()
+
+        return None
+
+    def _raise(self) -> NoReturn:
+        error_message: str = "Data is not a valid JSON array."
+        raise ValueError(error_message)
@@ -4,3 +4,8 @@ import datetime
 def now() -> int:
     """Get the current UTC timestamp in seconds since Unix epoch."""
     return int(datetime.datetime.now(tz=datetime.UTC).timestamp())
+
+
+def utcnow() -> datetime.datetime:
+    """Get the current naive UTC datetime, as stored in the database."""
+    return datetime.datetime.now(tz=datetime.UTC).replace(tzinfo=None)
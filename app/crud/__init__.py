@@ -3,22 +3,71 @@
 This module provides functions to interact with the database.
 """
 
-from .click import create_click
-from .network import get_network_by_ip
+from .click import create_click, create_clicks, get_url_clicks
+from .network import (
+    apply_staged_networks,
+    clear_staged_networks,
+    create_networks,
+    get_network_by_ip,
+    get_network_ranges,
+    get_networks_fingerprint,
+)
+from .rollup import (
+    get_country_clicks,
+    get_daily_clicks,
+    get_hourly_clicks,
+    get_rollup_cursor,
+    get_visitor_sketches,
+    get_worker_visitor_sketches,
+    rollup_clicks,
+    save_visitor_sketches,
+)
 from .status import create_status
-from .tag import create_tag
-from .url import create_url, get_url_by_slug, update_url
+from .tag import create_tag, create_tags
+from .url import (
+    create_url,
+    create_urls,
+    get_existing_slugs,
+    get_url_by_id,
+    get_url_by_slug,
+    get_url_slugs,
+    get_url_summary_by_slug,
+    increment_total_clicks,
+    update_url,
+)
 from .user import create_user, get_user_by_email, get_user_by_id
 
 __all__ = [
+    "apply_staged_networks",
+    "clear_staged_networks",
     "create_click",
+    "create_clicks",
+    "create_networks",
     "create_status",
     "create_tag",
+    "create_tags",
     "create_url",
+    "create_urls",
     "create_user",
+    "get_country_clicks",
+    "get_daily_clicks",
+    "get_existing_slugs",
+    "get_hourly_clicks",
     "get_network_by_ip",
+    "get_network_ranges",
+    "get_networks_fingerprint",
+    "get_rollup_cursor",
+    "get_url_by_id",
     "get_url_by_slug",
+    "get_url_clicks",
+    "get_url_slugs",
+    "get_url_summary_by_slug",
     "get_user_by_email",
     "get_user_by_id",
+    "get_visitor_sketches",
+    "get_worker_visitor_sketches",
+    "increment_total_clicks",
+    "rollup_clicks",
+    "save_visitor_sketches",
     "update_url",
 ]
@@ -1,7 +1,34 @@
+from collections import Counter
+from collections.abc import Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
+
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database.models import Click
 
+from .url import increment_total_clicks
+
+if TYPE_CHECKING:
+    from sqlalchemy import Result
+
+
+class ClickRow(TypedDict):
+    """Column values of a ` Click ` inserted in bulk."""
+
+    url_id: int
+    ip: str | None
+    country: str | None
+    created_at: datetime
+
+
+class ClickCursor(NamedTuple):
+    """Position of a ` Click ` in the newest-first order of a ` Url `."""
+
+    created_at: datetime
+    id: int
+
 
 async def create_click(
     *,
@@ -9,14 +36,20 @@ async def create_click(
     url_id: int,
     ip: str | None,
     country: str | None,
+    commit: bool = True,
 ) -> Click:
     """Initialize a new ` Click ` and commit it to the database.
 
+    The ` Url ` total clicks counter is incremented in the same transaction
+    without loading the ` Url ` itself.
+
     Args:
         async_session: The async database session.
         url_id: The unique identifier of the ` Url `.
         ip: The IP address from which the ` Click ` was made.
         country: The two-letter country code of the origin of the ` Click `.
+        commit: Whether to commit the transaction, otherwise it is only
+            flushed. Defaults to ` True `.
 
     Returns:
         The newly created ` Click ` instance.
@@ -28,7 +61,85 @@ async def create_click(
     )
 
     async_session.add(click)
-    await async_session.commit()
-    await async_session.refresh(click)
+    await increment_total_clicks(
+        async_session=async_session,
+        clicks={url_id: 1},
+        commit=False,
+    )
+    if commit:
+        await async_session.commit()
+    else:
+        await async_session.flush()
 
     return click
+
+
+async def create_clicks(
+    *,
+    async_session: AsyncSession,
+    clicks: Sequence[ClickRow],
+) -> None:
+    """Insert many ` Click `'s at once and commit them to the database.
+
+    The ` Click `'s are written with a single multi-row insert and the total
+    clicks counter of every affected ` Url ` is incremented by the number of
+    its new ` Click `'s, all in one transaction.
+
+    Args:
+        async_session: The async database session.
+        clicks: The ` Click ` rows to insert.
+    """
+    if not clicks:
+        return
+
+    await async_session.execute(
+        insert(Click.__table__),  # type: ignore[arg-type]
+        list(clicks),
+    )
+
+    await increment_total_clicks(
+        async_session=async_session,
+        clicks=Counter(click["url_id"] for click in clicks),
+        commit=False,
+    )
+    await async_session.commit()
+
+
+async def get_url_clicks(
+    *,
+    async_session: AsyncSession,
+    url_id: int,
+    before: ClickCursor | None,
+    limit: int,
+) -> list[Click]:
+    """Retrieve a page of the ` Click `'s of a ` Url `, newest first.
+
+    The page is selected with a keyset on ` (created_at, id) ` through the
+    matching index, so every page costs the same however many ` Click `'s
+    the ` Url ` has.
+
+    Args:
+        async_session: The async database session.
+        url_id: The unique identifier of the ` Url `.
+        before: The position of the last ` Click ` of the previous page, or
+            ` None ` for the first page.
+        limit: The maximum number of ` Click `'s in the page.
+
+    Returns:
+        The ` Click `'s of the page.
+    """
+    statement = select(Click).where(Click.url_id == url_id)
+
+    if before is not None:
+        statement = statement.where(
+            tuple_(Click.created_at, Click.id)
+            < tuple_(before.created_at, before.id),
+        )
+
+    result: Result[tuple[Click]] = await async_session.execute(
+        statement.order_by(Click.created_at.desc(), Click.id.desc()).limit(
+            limit,
+        ),
+    )
+
+    return list(result.scalars())
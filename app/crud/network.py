@@ -1,13 +1,82 @@
-from ipaddress import IPv4Address
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from ipaddress import IPv4Address, IPv6Address, ip_address
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    ColumnElement,
+    FromClause,
+    Table,
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
-from app.core.database.models import Network
+from app.core.database.models import Network, network_staging
 
 if TYPE_CHECKING:
-    from sqlalchemy import Result
+    from sqlalchemy import CursorResult, Result
+
+
+class NetworkRange(NamedTuple):
+    """Address range of a ` Network ` without the ORM instance."""
+
+    start_address: int
+    end_address: int
+    country: str
+    version: int = 4
+
+
+class NetworkChanges(NamedTuple):
+    """Number of ` Network `'s changed by applying staged ranges."""
+
+    inserted: int
+    deleted: int
+
+
+async def create_networks(
+    *,
+    async_session: AsyncSession,
+    network_ranges: Sequence[NetworkRange],
+    staged: bool = False,
+    commit: bool = True,
+) -> None:
+    """Insert many ` Network `'s at once and commit them to the database.
+
+    The ` Network `'s are written with a single multi-row insert without
+    constructing ORM instances.
+
+    Args:
+        async_session: The async database session.
+        network_ranges: The address ranges of the ` Network `'s to insert.
+        staged: Whether to insert the ranges into the staging table to be
+            applied later with ` apply_staged_networks `. Defaults to
+            ` False `.
+        commit: Whether to commit the transaction, otherwise the caller
+            commits it. Defaults to ` True `.
+    """
+    if not network_ranges:
+        return
+
+    table: FromClause = network_staging if staged else Network.__table__
+
+    await async_session.execute(
+        insert(table),  # type: ignore[arg-type]
+        [
+            {
+                "start_address": network_range.start_address,
+                "end_address": network_range.end_address,
+                "country": network_range.country,
+                "version": network_range.version,
+            }
+            for network_range in network_ranges
+        ],
+    )
+    if commit:
+        await async_session.commit()
 
 
 async def get_network_by_ip(
@@ -17,23 +86,161 @@ async def get_network_by_ip(
 ) -> Network | None:
     """Retrieve a `Network` from the database by IP address.
 
+    IPv4-mapped IPv6 addresses are looked up as IPv4 addresses.
+
     Args:
         async_session: The async database session.
-        ip: The IP address to search for.
+        ip: The IPv4 or IPv6 address to search for.
 
     Returns:
         The ` Network ` instance if found, otherwise ` None `.
+
+    Raises:
+        ValueError: If the IP address is invalid.
     """
-    ip_address: int = int(IPv4Address(ip))
+    address: IPv4Address | IPv6Address = ip_address(ip)
+    if isinstance(address, IPv6Address) and address.ipv4_mapped:
+        address = address.ipv4_mapped
 
     result: Result[tuple[Network]] = await async_session.execute(
         select(Network)
         .where(
-            (Network.start_address <= ip_address)
-            & (Network.end_address >= ip_address),
+            (Network.version == address.version)
+            & (Network.start_address <= int(address))
+            & (Network.end_address >= int(address)),
         )
         .limit(1),
     )
     network: Network | None = result.scalars().first()
 
     return network
+
+
+async def get_network_ranges(
+    *,
+    async_session: AsyncSession,
+) -> list[NetworkRange]:
+    """Retrieve the address ranges of all ` Network `'s from the database.
+
+    Args:
+        async_session: The async database session.
+
+    Returns:
+        The ` NetworkRange `'s ordered by their IP version and start address.
+    """
+    result: Result[tuple[int, int, str, int]] = await async_session.execute(
+        select(
+            Network.start_address,
+            Network.end_address,
+            Network.country,
+            Network.version,
+        ).order_by(Network.version, Network.start_address),
+    )
+
+    return [NetworkRange(*row) for row in result]
+
+
+async def get_networks_fingerprint(
+    *,
+    async_session: AsyncSession,
+) -> tuple[int, int]:
+    """Retrieve a cheap fingerprint of the ` Network ` table contents.
+
+    The fingerprint changes whenever ` Network `'s are added or removed.
+
+    Args:
+        async_session: The async database session.
+
+    Returns:
+        The number of ` Network `'s and the greatest ` Network ` id.
+    """
+    result: Result[tuple[int, int | None]] = await async_session.execute(
+        select(func.count(), func.max(Network.id)),
+    )
+    count, max_id = result.one()
+
+    return count, max_id or 0
+
+
+async def clear_staged_networks(*, async_session: AsyncSession) -> None:
+    """Remove all ranges from the ` Network ` staging table.
+
+    Args:
+        async_session: The async database session.
+    """
+    await async_session.execute(delete(network_staging))
+    await async_session.commit()
+
+
+async def apply_staged_networks(
+    *,
+    async_session: AsyncSession,
+) -> NetworkChanges:
+    """Replace the ` Network `'s with the staged ranges.
+
+    Only the difference is written: duplicated ` Network `'s and those that
+    are not staged are deleted, and staged ranges that do not exist yet are
+    inserted, all in one transaction. The staging table is emptied.
+
+    Args:
+        async_session: The async database session.
+
+    Returns:
+        The number of inserted and deleted ` Network `'s.
+    """
+    networks: Table = Network.__table__  # type: ignore[assignment]
+    connection: AsyncConnection = await async_session.connection()
+
+    duplicates: CursorResult[Any] = await connection.execute(
+        delete(networks).where(
+            networks.c.id.not_in(
+                select(func.min(networks.c.id)).group_by(
+                    networks.c.version,
+                    networks.c.start_address,
+                    networks.c.end_address,
+                    networks.c.country,
+                ),
+            ),
+        ),
+    )
+    stale: CursorResult[Any] = await connection.execute(
+        delete(networks).where(
+            ~exists().where(_same_range(networks, network_staging)),
+        ),
+    )
+    new: CursorResult[Any] = await connection.execute(
+        insert(networks).from_select(
+            [
+                "version",
+                "start_address",
+                "end_address",
+                "country",
+                "created_at",
+            ],
+            select(
+                network_staging.c.version,
+                network_staging.c.start_address,
+                network_staging.c.end_address,
+                network_staging.c.country,
+                func.now(),
+            )
+            .distinct()
+            .where(~exists().where(_same_range(networks, network_staging))),
+        ),
+    )
+    await connection.execute(delete(network_staging))
+    await async_session.commit()
+
+    return NetworkChanges(
+        inserted=new.rowcount,
+        deleted=duplicates.rowcount + stale.rowcount,
+    )
+
+
+def _same_range(left: FromClause, right: FromClause, /) -> ColumnElement[bool]:
+    return and_(
+        left.c.version == right.c.version,
+        left.c.start_address == right.c.start_address,
+        left.c.end_address == right.c.end_address,
+        left.c.country == right.c.country,
+    )
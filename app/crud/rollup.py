@@ -0,0 +1,391 @@
+from collections import Counter
+from collections.abc import Collection, Mapping
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Table, func, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database.models import (
+    Click,
+    daily_clicks,
+    daily_country_clicks,
+    daily_visitors,
+    hourly_clicks,
+    rollup_cursors,
+)
+
+if TYPE_CHECKING:
+    from datetime import date, datetime
+
+    from sqlalchemy import ColumnElement, CursorResult, Result, Row
+    from sqlalchemy.dialects.sqlite import Insert
+
+_CLICKS_CURSOR: str = "clicks"
+
+
+async def get_rollup_cursor(*, async_session: AsyncSession) -> int:
+    """Retrieve the id of the last ` Click ` included in the rollups.
+
+    Args:
+        async_session: The async database session.
+
+    Returns:
+        The id of the last ` Click ` rolled up, ` 0 ` if there is none.
+    """
+    result: Result[tuple[int]] = await async_session.execute(
+        select(rollup_cursors.c.last_id).where(
+            rollup_cursors.c.name == _CLICKS_CURSOR,
+        ),
+    )
+
+    return result.scalar() or 0
+
+
+async def get_hourly_clicks(
+    *,
+    async_session: AsyncSession,
+    url_id: int,
+    start: "datetime",
+    end: "datetime",
+) -> dict["datetime", int]:
+    """Retrieve the rolled up ` Click `'s of a ` Url ` per hour.
+
+    Args:
+        async_session: The async database session.
+        url_id: The unique identifier of the ` Url `.
+        start: The start of the first hour, included.
+        end: The start of the last hour, excluded.
+
+    Returns:
+        The number of ` Click `'s per start of hour, for the hours that have
+            any, in chronological order.
+    """
+    result: Result[tuple[datetime, int]] = await async_session.execute(
+        select(hourly_clicks.c.bucket, hourly_clicks.c.clicks)
+        .where(
+            hourly_clicks.c.url_id == url_id,
+            hourly_clicks.c.bucket >= start,
+            hourly_clicks.c.bucket < end,
+        )
+        .order_by(hourly_clicks.c.bucket),
+    )
+
+    return dict(result.all())
+
+
+async def get_daily_clicks(
+    *,
+    async_session: AsyncSession,
+    url_id: int,
+    start: "date",
+    end: "date",
+) -> dict["date", int]:
+    """Retrieve the rolled up ` Click `'s of a ` Url ` per day.
+
+    Args:
+        async_session: The async database session.
+        url_id: The unique identifier of the ` Url `.
+        start: The first day, included.
+        end: The last day, excluded.
+
+    Returns:
+        The number of ` Click `'s per day, for the days that have any, in
+            chronological order.
+    """
+    result: Result[tuple[date, int]] = await async_session.execute(
+        select(daily_clicks.c.bucket, daily_clicks.c.clicks)
+        .where(
+            daily_clicks.c.url_id == url_id,
+            daily_clicks.c.bucket >= start,
+            daily_clicks.c.bucket < end,
+        )
+        .order_by(daily_clicks.c.bucket),
+    )
+
+    return dict(result.all())
+
+
+async def get_country_clicks(
+    *,
+    async_session: AsyncSession,
+    url_id: int,
+    start: "date",
+    end: "date",
+) -> dict[str, int]:
+    """Retrieve the rolled up ` Click `'s of a ` Url ` per country.
+
+    Args:
+        async_session: The async database session.
+        url_id: The unique identifier of the ` Url `.
+        start: The first day, included.
+        end: The last day, excluded.
+
+    Returns:
+        The number of ` Click `'s per country code, for the countries that
+            have any, from the most to the least clicked.
+    """
+    clicks: ColumnElement[int] = func.sum(daily_country_clicks.c.clicks)
+    result: Result[tuple[str, int]] = await async_session.execute(
+        select(daily_country_clicks.c.country, clicks)
+        .where(
+            daily_country_clicks.c.url_id == url_id,
+            daily_country_clicks.c.bucket >= start,
+            daily_country_clicks.c.bucket < end,
+        )
+        .group_by(daily_country_clicks.c.country)
+        .order_by(clicks.desc(), daily_country_clicks.c.country),
+    )
+
+    return dict(result.all())
+
+
+async def get_visitor_sketches(
+    *,
+    async_session: AsyncSession,
+    url_id: int,
+    start: "date",
+    end: "date",
+) -> list[bytes]:
+    """Retrieve the visitor sketches of a ` Url ` written by every worker.
+
+    Args:
+        async_session: The async database session.
+        url_id: The unique identifier of the ` Url `.
+        start: The first day, included.
+        end: The last day, excluded.
+
+    Returns:
+        The serialized sketches, at most one per day and worker.
+    """
+    result: Result[tuple[bytes]] = await async_session.execute(
+        select(daily_visitors.c.sketch).where(
+            daily_visitors.c.url_id == url_id,
+            daily_visitors.c.bucket >= start,
+            daily_visitors.c.bucket < end,
+        ),
+    )
+
+    return list(result.scalars())
+
+
+async def get_worker_visitor_sketches(
+    *,
+    async_session: AsyncSession,
+    worker: int,
+    keys: Collection[tuple[int, "date"]],
+) -> dict[tuple[int, "date"], bytes]:
+    """Retrieve the visitor sketches written by a worker.
+
+    Args:
+        async_session: The async database session.
+        worker: The machine id of the worker.
+        keys: The ` Url ` ids and days of the sketches.
+
+    Returns:
+        The serialized sketches per ` Url ` id and day, for the keys that
+            have one.
+    """
+    if not keys:
+        return {}
+
+    result: Result[tuple[int, date, bytes]] = await async_session.execute(
+        select(
+            daily_visitors.c.url_id,
+            daily_visitors.c.bucket,
+            daily_visitors.c.sketch,
+        ).where(
+            daily_visitors.c.worker == worker,
+            tuple_(daily_visitors.c.url_id, daily_visitors.c.bucket).in_(
+                list(keys),
+            ),
+        ),
+    )
+
+    return {(url_id, bucket): sketch for url_id, bucket, sketch in result}
+
+
+async def save_visitor_sketches(
+    *,
+    async_session: AsyncSession,
+    worker: int,
+    sketches: Mapping[tuple[int, "date"], bytes],
+    commit: bool = True,
+) -> None:
+    """Create or replace the visitor sketches written by a worker.
+
+    Args:
+        async_session: The async database session.
+        worker: The machine id of the worker.
+        sketches: The serialized sketches per ` Url ` id and day.
+        commit: Whether to commit the transaction, otherwise it is only
+            flushed. Defaults to ` True `.
+    """
+    if sketches:
+        statement: Insert = _insert(async_session, daily_visitors)
+        await async_session.execute(
+            statement.on_conflict_do_update(
+                index_elements=daily_visitors.primary_key.columns,
+                set_={"sketch": statement.excluded.sketch},
+            ),
+            [
+                {
+                    "url_id": url_id,
+                    "bucket": bucket,
+                    "worker": worker,
+                    "sketch": sketch,
+                }
+                for (url_id, bucket), sketch in sketches.items()
+            ],
+        )
+
+    if commit:
+        await async_session.commit()
+    else:
+        await async_session.flush()
+
+
+async def rollup_clicks(
+    *,
+    async_session: AsyncSession,
+    before_id: int,
+    limit: int,
+) -> int:
+    """Add the next batch of ` Click `'s to the rollups and commit them.
+
+    The ` Click `'s after the rollup cursor and before ` before_id ` are
+    counted per ` Url ` and hour, per ` Url ` and day, and per ` Url `, day
+    and country, and the counts are added to the rollup tables. The cursor
+    only moves if no other process moved it meanwhile, so concurrent
+    aggregators never count a ` Click ` twice.
+
+    Args:
+        async_session: The async database session.
+        before_id: The id before which ` Click `'s are rolled up, e.g. to
+            leave out ` Click `'s whose transactions may not be committed yet.
+        limit: The maximum number of ` Click `'s in the batch.
+
+    Returns:
+        The number of ` Click `'s rolled up, ` 0 ` if there are none or the
+            cursor was moved by another process.
+    """
+    after_id: int = await _get_or_create_rollup_cursor(
+        async_session=async_session,
+    )
+    result: Result[
+        tuple[int, int, str | None, datetime]
+    ] = await async_session.execute(
+        select(Click.id, Click.url_id, Click.country, Click.created_at)
+        .where(Click.id > after_id, Click.id < before_id)
+        .order_by(Click.id)
+        .limit(limit),
+    )
+    clicks: list[Row[tuple[int, int, str | None, datetime]]] = list(result)
+
+    if not clicks or not await _move_rollup_cursor(
+        async_session=async_session,
+        after_id=after_id,
+        last_id=clicks[-1][0],
+    ):
+        await async_session.rollback()
+        return 0
+
+    hourly: Counter[tuple[int, datetime]] = Counter()
+    daily: Counter[tuple[int, date]] = Counter()
+    countries: Counter[tuple[int, date, str]] = Counter()
+
+    for _, url_id, country, created_at in clicks:
+        hour: datetime = created_at.replace(minute=0, second=0, microsecond=0)
+        day: date = created_at.date()
+
+        hourly[url_id, hour] += 1
+        daily[url_id, day] += 1
+        if country is not None:
+            countries[url_id, day, country] += 1
+
+    await _add_clicks(
+        async_session=async_session,
+        table=hourly_clicks,
+        clicks=[
+            {"url_id": url_id, "bucket": bucket, "clicks": total}
+            for (url_id, bucket), total in hourly.items()
+        ],
+    )
+    await _add_clicks(
+        async_session=async_session,
+        table=daily_clicks,
+        clicks=[
+            {"url_id": url_id, "bucket": bucket, "clicks": total}
+            for (url_id, bucket), total in daily.items()
+        ],
+    )
+    await _add_clicks(
+        async_session=async_session,
+        table=daily_country_clicks,
+        clicks=[
+            {
+                "url_id": url_id,
+                "bucket": bucket,
+                "country": country,
+                "clicks": total,
+            }
+            for (url_id, bucket, country), total in countries.items()
+        ],
+    )
+    await async_session.commit()
+
+    return len(clicks)
+
+
+async def _get_or_create_rollup_cursor(*, async_session: AsyncSession) -> int:
+    await async_session.execute(
+        _insert(async_session, rollup_cursors)
+        .values(name=_CLICKS_CURSOR, last_id=0)
+        .on_conflict_do_nothing(index_elements=[rollup_cursors.c.name]),
+    )
+
+    return await get_rollup_cursor(async_session=async_session)
+
+
+async def _move_rollup_cursor(
+    *,
+    async_session: AsyncSession,
+    after_id: int,
+    last_id: int,
+) -> bool:
+    result: CursorResult[Any] = await async_session.execute(  # type: ignore[assignment]
+        update(rollup_cursors)
+        .where(
+            rollup_cursors.c.name == _CLICKS_CURSOR,
+            rollup_cursors.c.last_id == after_id,
+        )
+        .values(last_id=last_id),
+    )
+
+    return result.rowcount == 1
+
+
+async def _add_clicks(
+    *,
+    async_session: AsyncSession,
+    table: Table,
+    clicks: list[dict[str, Any]],
+) -> None:
+    if not clicks:
+        return
+
+    statement: Insert = _insert(async_session, table)
+    await async_session.execute(
+        statement.on_conflict_do_update(
+            index_elements=table.primary_key.columns,
+            set_={"clicks": table.c.clicks + statement.excluded.clicks},
+        ),
+        clicks,
+    )
+
+
+def _insert(async_session: AsyncSession, table: Table, /) -> "Insert":
+    if async_session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)  # type: ignore[return-value]
+
+    return sqlite.insert(table)
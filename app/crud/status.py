@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate_user
 from app.core.database.models import Status
 
 
@@ -8,13 +9,20 @@ async def create_status(
     async_session: AsyncSession,
     user_id: int,
     active: bool,
+    commit: bool = True,
 ) -> Status:
     """Initialize a new ` Status ` and commit it to the database.
 
+    The cached record of the ` User ` is invalidated after committing, so
+    the new status is seen on their next request.
+
     Args:
         async_session: The async database session.
         user_id: The unique identifier of the ` User `.
         active: Indicates whether the ` User ` is currently active.
+        commit: Whether to commit the transaction and invalidate the cached
+            record of the ` User `, otherwise it is only flushed and the
+            caller invalidates it after committing. Defaults to ` True `.
 
     Returns:
         The newly created ` Status ` instance.
@@ -25,7 +33,10 @@ async def create_status(
     )
 
     async_session.add(status)
-    await async_session.commit()
-    await async_session.refresh(status)
+    if commit:
+        await async_session.commit()
+        await invalidate_user(user_id)
+    else:
+        await async_session.flush()
 
     return status
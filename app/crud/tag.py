@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database.models import Tag
@@ -8,6 +10,7 @@ async def create_tag(
     async_session: AsyncSession,
     url_id: int,
     name: str,
+    commit: bool = True,
 ) -> Tag:
     """Initialize a new ` Tag ` and commit it to the database.
 
@@ -15,6 +18,8 @@ async def create_tag(
         async_session: The async database session.
         url_id: The unique identifier of the ` Url `.
         name: The ` Tag ` value.
+        commit: Whether to commit the transaction, otherwise it is only
+            flushed. Defaults to ` True `.
 
     Returns:
         The newly created ` Tag ` instance.
@@ -25,7 +30,42 @@ async def create_tag(
     )
 
     async_session.add(tag)
-    await async_session.commit()
-    await async_session.refresh(tag)
+    if commit:
+        await async_session.commit()
+    else:
+        await async_session.flush()
 
     return tag
+
+
+async def create_tags(
+    *,
+    async_session: AsyncSession,
+    url_id: int,
+    names: Iterable[str],
+    commit: bool = True,
+) -> list[Tag]:
+    """Initialize many ` Tag `'s of a ` Url ` and commit them to the database.
+
+    All ` Tag `'s are flushed together, so they are written with a single
+    multi-row ` INSERT `.
+
+    Args:
+        async_session: The async database session.
+        url_id: The unique identifier of the ` Url `.
+        names: The ` Tag ` values.
+        commit: Whether to commit the transaction, otherwise it is only
+            flushed. Defaults to ` True `.
+
+    Returns:
+        The newly created ` Tag ` instances.
+    """
+    tags: list[Tag] = [Tag(url_id=url_id, name=name) for name in names]
+
+    async_session.add_all(tags)
+    if commit:
+        await async_session.commit()
+    else:
+        await async_session.flush()
+
+    return tags
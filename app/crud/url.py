@@ -1,20 +1,49 @@
-from typing import TYPE_CHECKING
+from collections.abc import Collection, Mapping, Sequence
+from typing import TYPE_CHECKING, NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import LoaderOption
 
-from app.core.database.models import Url
+from app.core import slugs
+from app.core.cache import invalidate_url
+from app.core.database.models import Tag, Url
+from app.core.settings.data import RedirectStatus
 
 if TYPE_CHECKING:
-    from sqlalchemy import Result
+    from sqlalchemy import Result, Row
 
 
-async def create_url(
+class UrlSummary(NamedTuple):
+    """Column values of a ` Url ` loaded without its relationships."""
+
+    id: int
+    source: str
+    total_clicks: int
+    redirect_status: int
+    cache_max_age: int | None
+
+
+class NewUrl(NamedTuple):
+    """Values of a ` Url ` and the names of its ` Tag `'s created in bulk."""
+
+    user_id: int
+    source: str
+    slug: str
+    tags: Collection[str]
+    redirect_status: int = RedirectStatus.TEMPORARY_REDIRECT
+    cache_max_age: int | None = None
+
+
+async def create_url(  # noqa: PLR0913
     *,
     async_session: AsyncSession,
     user_id: int,
     source: str,
     slug: str,
+    redirect_status: int = RedirectStatus.TEMPORARY_REDIRECT,
+    cache_max_age: int | None = None,
+    commit: bool = True,
 ) -> Url:
     """Initialize a new ` Url ` and commit it to the database.
 
@@ -23,6 +52,13 @@ async def create_url(
         user_id: The unique identifier of the ` User `.
         source: The original URL address.
         slug: The unique slug that identifies the shortened URL.
+        redirect_status: The HTTP status of the redirect. Defaults to
+            ` 307 `.
+        cache_max_age: The number of seconds caches may reuse the redirect.
+            Defaults to ` None `.
+        commit: Whether to commit the transaction and invalidate the cached
+            lookups of the slug, otherwise it is only flushed and the caller
+            invalidates them after committing. Defaults to ` True `.
 
     Returns:
         The newly created ` Url ` instance.
@@ -31,37 +67,207 @@ async def create_url(
         user_id=user_id,
         source=source,
         slug=slug,
+        redirect_status=redirect_status,
+        cache_max_age=cache_max_age,
     )
 
     async_session.add(url)
-    await async_session.commit()
-    await async_session.refresh(url)
+    if commit:
+        await async_session.commit()
+        invalidate_url(slug)
+    else:
+        await async_session.flush()
 
     return url
 
 
+async def create_urls(
+    *,
+    async_session: AsyncSession,
+    urls: Sequence[NewUrl],
+    commit: bool = True,
+) -> list[Url]:
+    """Initialize many ` Url `'s with their ` Tag `'s and commit them.
+
+    The ` Url `'s and then their ` Tag `'s are flushed together, so each
+    table is written with a single multi-row ` INSERT `.
+
+    Args:
+        async_session: The async database session.
+        urls: The values of the ` Url `'s to create.
+        commit: Whether to commit the transaction and invalidate the cached
+            lookups of the slugs, otherwise it is only flushed and the caller
+            invalidates them after committing. Defaults to ` True `.
+
+    Returns:
+        The newly created ` Url ` instances, in the order of ` urls `.
+    """
+    created_urls: list[Url] = [
+        Url(
+            user_id=url.user_id,
+            source=url.source,
+            slug=url.slug,
+            redirect_status=url.redirect_status,
+            cache_max_age=url.cache_max_age,
+        )
+        for url in urls
+    ]
+
+    async_session.add_all(created_urls)
+    await async_session.flush()
+
+    async_session.add_all(
+        [
+            Tag(url_id=created_url.id, name=name)
+            for created_url, url in zip(created_urls, urls, strict=True)
+            for name in url.tags
+        ],
+    )
+    if commit:
+        await async_session.commit()
+        for url in urls:
+            invalidate_url(url.slug)
+    else:
+        await async_session.flush()
+
+    return created_urls
+
+
+async def get_existing_slugs(
+    *,
+    async_session: AsyncSession,
+    slugs: Collection[str],
+) -> set[str]:
+    """Find which of the given slugs are already used by a ` Url `.
+
+    Args:
+        async_session: The async database session.
+        slugs: The slugs to check.
+
+    Returns:
+        The subset of ` slugs ` that are already in use.
+    """
+    if not slugs:
+        return set()
+
+    result: Result[tuple[str]] = await async_session.execute(
+        select(Url.slug).where(Url.slug.in_(slugs)),
+    )
+
+    return set(result.scalars())
+
+
+async def get_url_slugs(
+    *,
+    async_session: AsyncSession,
+    after_id: int,
+    limit: int,
+) -> list[tuple[int, str]]:
+    """Retrieve a batch of ` Url ` ids and slugs in the order of their ids.
+
+    The batch is selected with a keyset on the primary key, so reading all
+    slugs batch by batch costs the same for every batch.
+
+    Args:
+        async_session: The async database session.
+        after_id: The id after which the batch starts.
+        limit: The maximum number of rows in the batch.
+
+    Returns:
+        The ids and slugs of the batch.
+    """
+    result: Result[tuple[int, str]] = await async_session.execute(
+        select(Url.id, Url.slug)
+        .where(Url.id > after_id)
+        .order_by(Url.id)
+        .limit(limit),
+    )
+
+    return [(url_id, slug) for url_id, slug in result]
+
+
+async def get_url_by_id(
+    *,
+    async_session: AsyncSession,
+    url_id: int,
+    user_id: int,
+) -> Url | None:
+    """Retrieve a ` Url ` of a ` User ` by its id.
+
+    Args:
+        async_session: The async database session.
+        url_id: The unique identifier of the ` Url `.
+        user_id: The unique identifier of the ` User ` owning the ` Url `.
+
+    Returns:
+        The ` Url ` if found and owned by the ` User `, otherwise ` None `.
+    """
+    return await async_session.get(Url, (url_id, user_id))
+
+
 async def get_url_by_slug(
     *,
     async_session: AsyncSession,
     slug: str,
+    options: Sequence[LoaderOption] = (),
 ) -> Url | None:
     """Retrieve a ` Url ` from the database by its slug.
 
+    Relationships are not loaded unless requested through ` options `.
+
     Args:
         async_session: The async database session.
         slug: The unique slug that identifies the shortened URL.
+        options: Loader options for the relationships to load, e.g.
+            ` selectinload(Url.tags) `. Defaults to none.
 
     Returns:
         The ` Url ` instance if found, otherwise ` None `.
     """
     result: Result[tuple[Url]] = await async_session.execute(
-        select(Url).where(Url.slug == slug),
+        select(Url).where(Url.slug == slug).options(*options),
     )
     url: Url | None = result.scalars().first()
 
     return url
 
 
+async def get_url_summary_by_slug(
+    *,
+    async_session: AsyncSession,
+    slug: str,
+) -> UrlSummary | None:
+    """Retrieve the columns of a ` Url ` needed to serve a redirect.
+
+    Only the id, source, total clicks and redirect policy are selected, so
+    the cost of the query does not depend on the relationships of the
+    ` Url `.
+
+    Args:
+        async_session: The async database session.
+        slug: The unique slug that identifies the shortened URL.
+
+    Returns:
+        The ` UrlSummary ` if found, otherwise ` None `.
+    """
+    result: Result[
+        tuple[int, str, int, int, int | None]
+    ] = await async_session.execute(
+        select(
+            Url.id,
+            Url.source,
+            Url.total_clicks,
+            Url.redirect_status,
+            Url.cache_max_age,
+        )
+        .where(Url.slug == slug)
+        .limit(1),
+    )
+    row: Row[tuple[int, str, int, int, int | None]] | None = result.first()
+
+    return UrlSummary(*row) if row else None
+
+
 async def update_url(
     *,
     async_session: AsyncSession,
@@ -72,6 +278,9 @@ async def update_url(
 ) -> Url:
     """Update a ` Url ` and commit the changes to the database.
 
+    The new slug is added to the ` slug_filter `, its incremental sync only
+    reads new ` Url `'s and would never see the renamed one.
+
     Args:
         async_session: The async database session.
         url: The ` Url ` to update.
@@ -82,12 +291,51 @@ async def update_url(
     Returns:
         The updated ` Url ` instance.
     """
+    previous_slug: str = url.slug
+
     url.source = source
     url.slug = slug
     url.total_clicks = total_clicks
 
     async_session.add(url)
     await async_session.commit()
-    await async_session.refresh(url)
+
+    invalidate_url(previous_slug)
+    invalidate_url(url.slug)
+    slugs.slug_filter.add(url.slug)
 
     return url
+
+
+async def increment_total_clicks(
+    *,
+    async_session: AsyncSession,
+    clicks: Mapping[int, int],
+    commit: bool = True,
+) -> None:
+    """Atomically increment the total clicks of ` Url `'s in the database.
+
+    The increment is computed by the database, so concurrent increments of
+    the same ` Url ` are never lost, and no ` Url ` is loaded or refreshed.
+    All increments are sent as a single executemany ` UPDATE `.
+
+    Args:
+        async_session: The async database session.
+        clicks: The mapping of ` Url ` ids to the number of new ` Click `'s.
+        commit: Whether to commit the transaction. Defaults to ` True `.
+    """
+    if not clicks:
+        return
+
+    await async_session.execute(
+        update(Url.__table__)
+        .where(Url.id == bindparam("url_id"))
+        .values({Url.total_clicks: Url.total_clicks + bindparam("clicks")}),
+        [
+            {"url_id": url_id, "clicks": total}
+            for url_id, total in clicks.items()
+        ],
+    )
+
+    if commit:
+        await async_session.commit()
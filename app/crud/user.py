@@ -1,44 +1,67 @@
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.database.models import User
+from app.core.passwords import password_hasher
+from app.core.settings import settings
+from app.core.settings.data import Password
 
 if TYPE_CHECKING:
     from sqlalchemy import Result
 
 
-async def create_user(
+async def create_user(  # noqa: PLR0913
     *,
     async_session: AsyncSession,
     first_name: str,
     last_name: str | None,
     email: str,
     password: str,
+    commit: bool = True,
 ) -> User:
     """Initialize a new ` User ` and commit it to the database.
 
+    The password is hashed by the ` password_hasher ` off the event loop.
+
     Args:
         async_session: The async database session.
         first_name: The ` User `'s first name.
         last_name: The ` User `'s last name.
         email: The ` User `'s email address.
         password: The ` User `'s password.
+        commit: Whether to commit the transaction, otherwise it is only
+            flushed. Defaults to ` True `.
 
     Returns:
         The newly created ` User ` instance.
+
+    Raises:
+        ValueError: If the input values are invalid.
     """
+    if not Password.validate_length(password):
+        error_message: str = "Password length is invalid."
+        raise ValueError(error_message)
+
     user: User = User(
         first_name=first_name,
         last_name=last_name,
         email=email,
-        password=password,
+        password=await password_hasher.hash(
+            password,
+            rounds=settings.database.SALT_ROUNDS,
+        ),
+        is_password_hashed=True,
     )
 
     async_session.add(user)
-    await async_session.commit()
-    await async_session.refresh(user)
+    if commit:
+        await async_session.commit()
+    else:
+        await async_session.flush()
 
     return user
 
@@ -47,18 +70,23 @@ async def get_user_by_id(
     *,
     async_session: AsyncSession,
     user_id: int,
+    options: Sequence[LoaderOption] = (),
 ) -> User | None:
     """Retrieve a ` User ` from the database by their id.
 
+    Relationships are not loaded unless requested through ` options `.
+
     Args:
         async_session: The async database session.
         user_id: The unique identifier of the ` User ` to retrieve.
+        options: Loader options for the relationships to load, e.g.
+            ` selectinload(User.status) `. Defaults to none.
 
     Returns:
         The ` User ` instance if found, otherwise ` None `.
     """
     result: Result[tuple[User]] = await async_session.execute(
-        select(User).where(User.id == user_id),
+        select(User).where(User.id == user_id).options(*options),
     )
     user: User | None = result.scalars().first()
 
@@ -69,18 +97,23 @@ async def get_user_by_email(
     *,
     async_session: AsyncSession,
     email: str,
+    options: Sequence[LoaderOption] = (),
 ) -> User | None:
     """Retrieve a ` User ` from the database by their email address.
 
+    Relationships are not loaded unless requested through ` options `.
+
     Args:
         async_session: The async database session.
         email: The email address of the ` User ` to retrieve.
+        options: Loader options for the relationships to load, e.g.
+            ` selectinload(User.status) `. Defaults to none.
 
     Returns:
         The ` User ` instance if found, otherwise ` None `.
     """
     result: Result[tuple[User]] = await async_session.execute(
-        select(User).where(User.email == email),
+        select(User).where(User.email == email).options(*options),
     )
     user: User | None = result.scalars().first()
 
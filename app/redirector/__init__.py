@@ -1,8 +1,9 @@
 from fastapi import APIRouter
 
 from .controller import router
+from .middleware import RedirectMiddleware
 
 redirector: APIRouter = APIRouter(prefix="", include_in_schema=False)
 redirector.include_router(router)
 
-__all__ = ("redirector",)
+__all__ = ("RedirectMiddleware", "redirector")
@@ -1,17 +1,16 @@
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import APIRouter, Depends, Path, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud
-from app.api.exceptions import HTTPError
-from app.core import utils
 from app.core.database import database
 from app.core.settings.data import Page
 
+from .resolver import get_cache_control, record_click, resolve_slug
+
 if TYPE_CHECKING:
-    from app.core.database.models import Url
+    from app.core.cache import UrlRecord
 
 router: APIRouter = APIRouter(prefix="")
 
@@ -29,13 +28,12 @@ async def redirect_to_url(
     ],
 ) -> RedirectResponse:
     if slug == Page.NOT_FOUND:
-        raise HTTPError(
-            errors=[],
-            message="Not Found",
-            status=status.HTTP_404_NOT_FOUND,
+        raise HTTPException(
+            detail="Not Found",
+            status_code=status.HTTP_404_NOT_FOUND,
         )
 
-    url: Url | None = await crud.get_url_by_slug(
+    url: UrlRecord | None = await resolve_slug(
         async_session=async_session,
         slug=slug,
     )
@@ -46,27 +44,15 @@ async def redirect_to_url(
             status_code=status.HTTP_307_TEMPORARY_REDIRECT,
         )
 
-    ip: str | None = request.client.host if request.client else None
-    country: str | None = None
-    if ip:
-        country = await utils.get_country_by_ip(
-            session=async_session,
-            ip=ip,
-        )
-
-    await crud.create_click(
-        async_session=async_session,
+    record_click(
         url_id=url.id,
-        ip=ip,
-        country=country,
-    )
-    await crud.update_url(
-        async_session=async_session,
-        url=url,
-        total_clicks=url.total_clicks + 1,
+        ip=request.client.host if request.client else None,
     )
 
+    cache_control: str | None = get_cache_control(url)
+
     return RedirectResponse(
-        url=url.address,
-        status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+        url=url.source,
+        status_code=url.redirect_status,
+        headers={"Cache-Control": cache_control} if cache_control else None,
     )
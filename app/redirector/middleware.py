@@ -0,0 +1,121 @@
+import functools
+import re
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from fastapi import status
+
+from app.core.cache import UrlRecord
+from app.core.settings import settings
+from app.core.settings.data import Page, Slug
+
+from .resolver import get_cache_control, record_click, resolve_slug
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+_SLUG_PATH: re.Pattern[str] = re.compile(
+    rf"/([a-zA-Z0-9\-_]{{{Slug.MIN_LENGTH},{Slug.MAX_LENGTH}}})",
+)
+_NOT_FOUND_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"content-length", b"0"),
+    (b"location", quote(Page.NOT_FOUND.value).encode()),
+]
+
+
+class RedirectMiddleware:
+    """Pure ASGI fast path for redirects.
+
+    ` GET ` requests to a path made of a single valid slug are answered
+    directly, without routing, dependency resolution or a response object:
+    the slug is resolved through the caches, opening a database session only
+    on a miss, and the header block prebuilt for the ` Url ` is written.
+    Only the blocks of the ` REDIRECT_HEADERS_CACHE_SIZE ` most requested
+    ` Url `'s are kept, keyed on their ` UrlRecord `, so the block of an
+    updated ` Url ` is no longer hit and is evicted as it ages.
+    Every other request is passed to the wrapped application, so the
+    responses are the same as the redirector routes.
+    """
+
+    def __init__(self, app: "ASGIApp", *, enabled: bool = True) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            enabled: Whether redirects are served by the fast path, otherwise
+                every request is passed through. Defaults to ` True `.
+        """
+        self._app: ASGIApp = app
+        self._enabled: bool = enabled
+
+    async def __call__(
+        self,
+        scope: "Scope",
+        receive: "Receive",
+        send: "Send",
+    ) -> None:
+        match: re.Match[str] | None = (
+            _SLUG_PATH.fullmatch(scope["path"])
+            if self._enabled
+            and scope["type"] == "http"
+            and scope["method"] == "GET"
+            else None
+        )
+
+        if match is None or match[1] == Page.NOT_FOUND:
+            await self._app(scope, receive, send)
+            return
+
+        url: UrlRecord | None = await resolve_slug(slug=match[1])
+
+        if url is None:
+            await _send_redirect(
+                send,
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+                headers=_NOT_FOUND_HEADERS,
+            )
+            return
+
+        client: tuple[str, int] | None = scope.get("client")
+        record_click(url_id=url.id, ip=client[0] if client else None)
+
+        await _send_redirect(
+            send,
+            status_code=url.redirect_status,
+            headers=_get_headers(url),
+        )
+
+
+@functools.lru_cache(maxsize=settings.redirect.HEADERS_CACHE_SIZE)
+def _get_headers(url: UrlRecord, /) -> list[tuple[bytes, bytes]]:
+    headers: list[tuple[bytes, bytes]] = [(b"content-length", b"0")]
+
+    cache_control: str | None = get_cache_control(url)
+    if cache_control is not None:
+        headers.append((b"cache-control", cache_control.encode()))
+
+    headers.append(
+        (
+            b"location",
+            quote(url.source, safe=":/%#?=@[]!$&'()*+,;").encode(),
+        ),
+    )
+
+    return headers
+
+
+async def _send_redirect(
+    send: "Send",
+    /,
+    *,
+    status_code: int,
+    headers: list[tuple[bytes, bytes]],
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": headers,
+        },
+    )
+    await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,133 @@
+import datetime
+import functools
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.cache import (
+    UrlRecord,
+    missing_url_cache,
+    url_cache,
+    url_lookups,
+)
+from app.core.clicks import ClickEvent, click_buffer
+from app.core.database import database
+from app.core.slugs import slug_filter
+
+if TYPE_CHECKING:
+    from app.crud.url import UrlSummary
+
+
+async def resolve_slug(
+    *,
+    async_session: AsyncSession | None = None,
+    slug: str,
+) -> UrlRecord | None:
+    """Resolve a slug to the data required to serve a redirect.
+
+    The ` url_cache ` and ` missing_url_cache ` are consulted first, so hot
+    links and dead links hammered by clients are resolved without a
+    database round trip. Concurrent lookups of the same slug share a single
+    query. Unknown slugs are rejected by the ` slug_filter ` without a
+    query, once it has caught up with the ` Url `'s created by other workers
+    since its last sync. Slugs found in the database are added to the
+    filter.
+
+    Args:
+        async_session: The async database session. Defaults to ` None `,
+            a session is then opened only if the database is queried.
+        slug: The unique slug that identifies the shortened URL.
+
+    Returns:
+        The ` UrlRecord ` if the slug exists, otherwise ` None `.
+    """
+    record: UrlRecord | None = url_cache.get(slug)
+
+    if record is not None:
+        return record
+
+    if missing_url_cache.get(slug):
+        return None
+
+    if not await slug_filter.might_exist_now(slug):
+        return None
+
+    return await url_lookups.do(
+        slug,
+        functools.partial(
+            _get_url_record,
+            async_session=async_session,
+            slug=slug,
+        ),
+        store=functools.partial(_store_url_record, slug),
+    )
+
+
+def get_cache_control(url: UrlRecord, /) -> str | None:
+    """Get the ` Cache-Control ` header value of a redirect.
+
+    Args:
+        url: The resolved ` Url `.
+
+    Returns:
+        The header value, or ` None ` if the redirect has no cache policy.
+    """
+    if url.cache_max_age is None:
+        return None
+
+    return f"public, max-age={url.cache_max_age}"
+
+
+def record_click(*, url_id: int, ip: str | None) -> None:
+    """Queue a ` Click ` on a redirect to be written in background.
+
+    Args:
+        url_id: The unique identifier of the ` Url `.
+        ip: The IP address of the client, if known.
+    """
+    click_buffer.put(
+        ClickEvent(
+            url_id=url_id,
+            ip=ip,
+            created_at=datetime.datetime.now(tz=datetime.UTC).replace(
+                tzinfo=None,
+            ),
+        ),
+    )
+
+
+async def _get_url_record(
+    *,
+    async_session: AsyncSession | None,
+    slug: str,
+) -> UrlRecord | None:
+    if async_session is None:
+        async with database.create_async_session() as new_async_session:
+            return await _get_url_record(
+                async_session=new_async_session,
+                slug=slug,
+            )
+
+    url: UrlSummary | None = await crud.get_url_summary_by_slug(
+        async_session=async_session,
+        slug=slug,
+    )
+
+    if url is None:
+        return None
+
+    return UrlRecord(
+        id=url.id,
+        source=url.source,
+        redirect_status=url.redirect_status,
+        cache_max_age=url.cache_max_age,
+    )
+
+
+def _store_url_record(slug: str, record: UrlRecord | None, /) -> None:
+    if record is None:
+        missing_url_cache.set(slug, True)  # noqa: FBT003
+    else:
+        url_cache.set(slug, record)
+        slug_filter.add(slug)
@@ -0,0 +1,75 @@
+import httpx
+import pytest
+from fastapi import FastAPI, status
+
+from app.api import api
+from app.core.settings import settings
+
+_TOKEN: str = "metrics-token-for-tests"  # noqa: S105
+
+
+@pytest.fixture()
+def app() -> FastAPI:
+    app: FastAPI = FastAPI()
+    app.include_router(api)
+
+    return app
+
+
+async def _get_metrics(
+    app: FastAPI,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        return await client.get("/api/metrics", headers=headers)
+
+
+@pytest.mark.asyncio()
+async def test_get_metrics(
+    app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.metrics, "TOKEN", _TOKEN)
+
+    response: httpx.Response = await _get_metrics(
+        app,
+        headers={"Authorization": f"Bearer {_TOKEN}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("headers"),
+    [None, {"Authorization": "Bearer invalid"}, {"Authorization": _TOKEN}],
+)
+async def test_get_metrics_invalid_token(
+    app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+    headers: dict[str, str] | None,
+) -> None:
+    monkeypatch.setattr(settings.metrics, "TOKEN", _TOKEN)
+
+    response: httpx.Response = await _get_metrics(app, headers=headers)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio()
+async def test_get_metrics_disabled(
+    app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.metrics, "TOKEN", None)
+
+    response: httpx.Response = await _get_metrics(
+        app,
+        headers={"Authorization": f"Bearer {_TOKEN}"},
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,81 @@
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+
+import httpx
+import pytest
+from fastapi import FastAPI, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import api
+from app.core.auth.jwt import generate_token
+from app.core.database import database
+from app.core.settings import settings
+
+
+@pytest.fixture()
+def app(async_session: AsyncSession) -> FastAPI:
+    async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+        yield async_session
+
+    app: FastAPI = FastAPI()
+    app.include_router(api)
+    app.dependency_overrides[database.get_async_session] = get_async_session
+
+    return app
+
+
+async def _create_urls_in_bulk(
+    app: FastAPI,
+    *,
+    content: AsyncIterator[bytes],
+    content_type: str,
+) -> httpx.Response:
+    access_token: str = generate_token(
+        "access",
+        user_id=1,
+        email="john.doe@example.com",
+        key=settings.jwt.SECRET,
+        current_time=int(time.time()),
+    )
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        headers={"Cookie": f"access_token={access_token}"},
+    ) as client:
+        return await client.post(
+            "/api/url/bulk",
+            content=content,
+            headers={"Content-Type": content_type},
+        )
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("content", "content_type"),
+    [
+        (b'[{"source": "https://example.com/', "application/json"),
+        (b'{"source": "https://example.com/', "application/x-ndjson"),
+    ],
+)
+async def test_create_urls_in_bulk_item_too_large(
+    app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+    content: bytes,
+    content_type: str,
+) -> None:
+    monkeypatch.setattr(settings.bulk, "MAX_ITEM_SIZE", 1024)
+
+    async def stream() -> AsyncIterator[bytes]:
+        yield content
+        for _ in range(4):
+            yield b"a" * 512
+        yield b'"}]'
+
+    response: httpx.Response = await _create_urls_in_bulk(
+        app,
+        content=stream(),
+        content_type=content_type,
+    )
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
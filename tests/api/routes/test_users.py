@@ -0,0 +1,71 @@
+import time
+from collections.abc import AsyncGenerator
+
+import httpx
+import pytest
+from fastapi import FastAPI, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.api import api
+from app.core.auth.jwt import generate_token
+from app.core.cache import invalidate_user
+from app.core.database import database
+from app.core.database.models import Status, User
+from app.core.settings import settings
+
+
+@pytest.fixture()
+def app(async_session: AsyncSession) -> FastAPI:
+    async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+        yield async_session
+
+    app: FastAPI = FastAPI()
+    app.include_router(api)
+    app.dependency_overrides[database.get_async_session] = get_async_session
+
+    return app
+
+
+async def _get_users_me(app: FastAPI, *, user: User) -> httpx.Response:
+    access_token: str = generate_token(
+        "access",
+        user_id=user.id,
+        email=user.email,
+        key=settings.jwt.SECRET,
+        current_time=int(time.time()),
+    )
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        headers={"Cookie": f"access_token={access_token}"},
+    ) as client:
+        return await client.get("/api/users/me")
+
+
+@pytest.mark.asyncio()
+async def test_get_users_me_deactivated(
+    app: FastAPI,
+    async_session: AsyncSession,
+    user: User,
+) -> None:
+    await crud.create_status(
+        async_session=async_session,
+        user_id=user.id,
+        active=True,
+    )
+
+    response: httpx.Response = await _get_users_me(app, user=user)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    user_status: Status | None = await async_session.get(Status, user.id)
+    assert user_status is not None
+    user_status.active = False
+    await async_session.commit()
+    await invalidate_user(user.id)
+
+    response = await _get_users_me(app, user=user)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
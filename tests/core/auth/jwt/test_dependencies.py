@@ -1,16 +1,32 @@
 import pytest
-from fastapi import HTTPException
+import pytest_asyncio
+from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import crud
 from app.core.auth.jwt import (
+    Principal,
     generate_token,
+    get_current_principal,
     get_current_user,
     get_refreshed_user,
 )
-from app.core.database.models import User
+from app.core.cache import UserRecord, invalidate_user, user_cache
+from app.core.database.models import Status, User
 from app.core.settings import settings
 
 
+@pytest_asyncio.fixture()
+async def active_user(async_session: AsyncSession, user: User) -> User:
+    await crud.create_status(
+        async_session=async_session,
+        user_id=user.id,
+        active=True,
+    )
+
+    return user
+
+
 @pytest.fixture()
 def access_token(user: User, current_time: int) -> str:
     return generate_token(
@@ -33,16 +49,75 @@ def refresh_token(user: User, current_time: int) -> str:
     )
 
 
+@pytest.mark.asyncio()
+async def test_get_current_principal(current_time: int) -> None:
+    access_token: str = generate_token(
+        "access",
+        user_id=1,
+        email="john.doe@example.com",
+        key=settings.jwt.SECRET,
+        current_time=current_time,
+    )
+
+    principal: Principal = await get_current_principal(access_token)
+
+    assert principal == Principal(
+        id=1,
+        email="john.doe@example.com",
+        active=True,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_get_current_principal_inactive(current_time: int) -> None:
+    access_token: str = generate_token(
+        "access",
+        user_id=1,
+        email="john.doe@example.com",
+        key=settings.jwt.SECRET,
+        current_time=current_time,
+        active=False,
+    )
+
+    with pytest.raises(HTTPException) as error:
+        await get_current_principal(access_token)
+
+    assert error.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio()
+async def test_get_current_principal_no_token() -> None:
+    with pytest.raises(HTTPException):
+        await get_current_principal(None)
+
+
+@pytest.mark.asyncio()
+async def test_get_current_principal_invalid_token() -> None:
+    with pytest.raises(HTTPException):
+        await get_current_principal("invalid_token")
+
+
+@pytest.mark.asyncio()
+async def test_get_current_principal_refresh_token(
+    refresh_token: str,
+) -> None:
+    with pytest.raises(HTTPException):
+        await get_current_principal(refresh_token)
+
+
 @pytest.mark.asyncio()
 async def test_get_current_user(
     async_session: AsyncSession,
     access_token: str | None,
-    user: User,
+    active_user: User,
 ) -> None:
-    current_user: User = await get_current_user(async_session, access_token)
+    current_user: UserRecord = await get_current_user(
+        async_session,
+        access_token,
+    )
 
-    assert current_user.id == user.id
-    assert current_user.email == user.email
+    assert current_user.id == active_user.id
+    assert current_user.email == active_user.email
 
 
 @pytest.mark.asyncio()
@@ -83,15 +158,16 @@ async def test_get_current_user_no_user(
 async def test_get_refreshed_user(
     async_session: AsyncSession,
     refresh_token: str | None,
-    user: User,
+    active_user: User,
 ) -> None:
-    refreshed_user: User = await get_refreshed_user(
+    refreshed_user: UserRecord = await get_refreshed_user(
         async_session,
         refresh_token,
     )
 
-    assert refreshed_user.id == user.id
-    assert refreshed_user.email == user.email
+    assert refreshed_user.id == active_user.id
+    assert refreshed_user.email == active_user.email
+    assert refreshed_user.active is True
 
 
 @pytest.mark.asyncio()
@@ -126,3 +202,85 @@ async def test_get_refreshed_user_no_user(
 
     with pytest.raises(HTTPException):
         await get_refreshed_user(async_session, refresh_token)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("user")
+async def test_get_refreshed_user_inactive(
+    async_session: AsyncSession,
+    refresh_token: str,
+) -> None:
+    with pytest.raises(HTTPException) as error:
+        await get_refreshed_user(async_session, refresh_token)
+
+    assert error.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio()
+async def test_get_current_user_cached(
+    async_session: AsyncSession,
+    access_token: str,
+    active_user: User,
+) -> None:
+    current_user: UserRecord = await get_current_user(
+        async_session,
+        access_token,
+    )
+    hits: int = user_cache.hits
+
+    assert current_user == UserRecord(
+        id=active_user.id,
+        email=active_user.email,
+        first_name=active_user.first_name,
+        last_name=active_user.last_name,
+        active=True,
+    )
+    assert await get_current_user(async_session, access_token) == current_user
+    assert user_cache.hits == hits + 1
+
+
+@pytest.mark.asyncio()
+async def test_get_current_user_status_invalidated(
+    async_session: AsyncSession,
+    access_token: str,
+    user: User,
+) -> None:
+    with pytest.raises(HTTPException) as error:
+        await get_current_user(async_session, access_token)
+
+    assert error.value.status_code == status.HTTP_403_FORBIDDEN
+
+    await crud.create_status(
+        async_session=async_session,
+        user_id=user.id,
+        active=True,
+    )
+
+    assert user_cache.get(user.id) is None
+
+    async_session.expire_all()
+
+    assert (await get_current_user(async_session, access_token)).active is True
+
+
+@pytest.mark.asyncio()
+async def test_get_current_user_deactivated(
+    async_session: AsyncSession,
+    access_token: str,
+    active_user: User,
+) -> None:
+    await get_current_user(async_session, access_token)
+
+    user_status: Status | None = await async_session.get(
+        Status,
+        active_user.id,
+    )
+    assert user_status is not None
+    user_status.active = False
+    await async_session.commit()
+    await invalidate_user(active_user.id)
+
+    with pytest.raises(HTTPException) as error:
+        await get_current_user(async_session, access_token)
+
+    assert error.value.status_code == status.HTTP_403_FORBIDDEN
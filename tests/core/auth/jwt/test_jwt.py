@@ -4,6 +4,7 @@ import jwt as pyjwt
 import pytest
 
 from app.core.auth.jwt import generate_token, get_token_payload
+from app.core.cache import token_cache
 from app.core.settings import settings
 
 
@@ -49,6 +50,34 @@ def test_generate_token(
     assert pyjwt.get_unverified_header(token).get("typ", None) == token_type
     assert token_payload.get("sub") == str(user_id)
     assert token_payload.get("email") == email
+    assert token_payload.get("active") is True
+
+
+@pytest.mark.parametrize("active", [True, False])
+def test_generate_token_active(
+    user_id: int,
+    email: str,
+    key: str,
+    current_time: int,
+    active: bool,
+) -> None:
+    token: str = generate_token(
+        "access",
+        user_id=user_id,
+        email=email,
+        key=key,
+        current_time=current_time,
+        active=active,
+    )
+
+    token_payload: dict[str, Any] | None = get_token_payload(
+        "access",
+        token=token,
+        key=key,
+    )
+
+    assert token_payload is not None
+    assert token_payload.get("active") is active
 
 
 @pytest.mark.parametrize("token_type", ["access", "refresh"])
@@ -131,3 +160,95 @@ def test_get_token_payload_invalid_key(
     )
 
     assert token_payload is None
+
+
+@pytest.mark.parametrize("token_type", ["access", "refresh"])
+def test_get_token_payload_cached(
+    token_type: Literal["access", "refresh"],
+    key: str,
+    current_time: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    token: str = generate_token(
+        token_type,
+        user_id=1,
+        email="john.doe@example.com",
+        key=key,
+        current_time=current_time,
+    )
+    token_payload: dict[str, Any] | None = get_token_payload(
+        token_type,
+        token=token,
+        key=key,
+    )
+
+    def decode(*_args: Any, **_kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        raise AssertionError
+
+    monkeypatch.setattr(pyjwt, "decode", decode)
+    hits: int = token_cache.hits
+
+    assert get_token_payload(token_type, token=token, key=key) == token_payload
+    assert token_cache.hits == hits + 1
+
+
+@pytest.mark.parametrize(
+    ("token_type", "invalid_token_type"),
+    [
+        ("access", "refresh"),
+        ("refresh", "access"),
+    ],
+)
+def test_get_token_payload_cached_invalid_token_type(
+    token_type: Literal["access", "refresh"],
+    invalid_token_type: Literal["access", "refresh"],
+    key: str,
+    current_time: int,
+) -> None:
+    token: str = generate_token(
+        token_type,
+        user_id=1,
+        email="john.doe@example.com",
+        key=key,
+        current_time=current_time,
+    )
+
+    assert get_token_payload(token_type, token=token, key=key) is not None
+    assert get_token_payload(invalid_token_type, token=token, key=key) is None
+
+
+def test_get_token_payload_cached_invalid_key(
+    key: str,
+    user_id: int,
+    email: str,
+    current_time: int,
+) -> None:
+    token: str = generate_token(
+        "access",
+        user_id=user_id,
+        email=email,
+        key=key,
+        current_time=current_time,
+    )
+
+    assert get_token_payload("access", token=token, key=key) is not None
+    assert get_token_payload("access", token=token, key=key + "other") is None
+
+
+def test_get_token_payload_expired_not_cached(
+    key: str,
+    user_id: int,
+    email: str,
+    current_time: int,
+) -> None:
+    token: str = generate_token(
+        "access",
+        user_id=user_id,
+        email=email,
+        key=key,
+        current_time=current_time - 24 * 60 * 60,
+    )
+    size: int = len(token_cache)
+
+    assert get_token_payload("access", token=token, key=key) is None
+    assert len(token_cache) == size
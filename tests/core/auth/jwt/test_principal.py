@@ -0,0 +1,46 @@
+from typing import Any
+
+import pytest
+
+from app.core.auth.jwt import Principal
+
+
+@pytest.mark.parametrize("active", [True, False])
+def test_principal_from_token_payload(active: bool) -> None:
+    principal: Principal | None = Principal.from_token_payload(
+        {"sub": "1", "email": "john.doe@example.com", "active": active},
+    )
+
+    assert principal == Principal(
+        id=1,
+        email="john.doe@example.com",
+        active=active,
+    )
+
+
+def test_principal_from_token_payload_without_active() -> None:
+    principal: Principal | None = Principal.from_token_payload(
+        {"sub": "1", "email": "john.doe@example.com"},
+    )
+
+    assert principal is not None
+    assert principal.active is True
+
+
+@pytest.mark.parametrize(
+    "token_payload",
+    [
+        {},
+        {"sub": "1"},
+        {"email": "john.doe@example.com"},
+        {"sub": "one", "email": "john.doe@example.com"},
+        {"sub": "-1", "email": "john.doe@example.com"},
+        {"sub": 1, "email": "john.doe@example.com"},
+        {"sub": "1", "email": None},
+        {"sub": "1", "email": "john.doe@example.com", "active": "yes"},
+    ],
+)
+def test_principal_from_token_payload_invalid(
+    token_payload: dict[str, Any],
+) -> None:
+    assert Principal.from_token_payload(token_payload) is None
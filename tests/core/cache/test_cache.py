@@ -0,0 +1,93 @@
+import pytest
+
+from app.core.cache import Cache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.time: float = 0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+@pytest.fixture()
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture()
+def cache(clock: _Clock) -> Cache[str, int]:
+    return Cache(max_size=2, ttl=10, clock=clock)
+
+
+def test_cache_get(cache: Cache[str, int]) -> None:
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+
+def test_cache_get_missing(cache: Cache[str, int]) -> None:
+    assert cache.get("a") is None
+    assert cache.hits == 0
+    assert cache.misses == 1
+
+
+def test_cache_get_expired(cache: Cache[str, int], clock: _Clock) -> None:
+    cache.set("a", 1)
+    clock.time = 10
+
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+
+def test_cache_set_expires_at(cache: Cache[str, int], clock: _Clock) -> None:
+    cache.set("a", 1, expires_at=100)
+    clock.time = 99
+
+    assert cache.get("a") == 1
+
+
+def test_cache_set_evicts_least_recently_used(cache: Cache[str, int]) -> None:
+    cache.set("a", 1)
+    cache.set("b", 1)
+    cache.get("a")
+    cache.set("c", 1)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 1
+    assert cache.evictions == 1
+
+
+def test_cache_delete(cache: Cache[str, int]) -> None:
+    cache.set("a", 1)
+    cache.delete("a")
+    cache.delete("b")
+
+    assert cache.get("a") is None
+
+
+def test_cache_clear(cache: Cache[str, int]) -> None:
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_cache_stats(cache: Cache[str, int]) -> None:
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+        "size": 1,
+    }
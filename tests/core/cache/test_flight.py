@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import SingleFlight
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_coalesces() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release: asyncio.Event = asyncio.Event()
+    stored: list[int] = []
+    calls: int = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    tasks: list[asyncio.Task[int]] = [
+        asyncio.create_task(flight.do("a", load, store=stored.append))
+        for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    assert len(flight) == 1
+
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [1] * 10
+    assert calls == 1
+    assert stored == [1]
+    assert flight.stats() == {"calls": 1, "coalesced": 9, "in_flight": 0}
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_sequential_calls() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def load() -> int:
+        return 1
+
+    assert await flight.do("a", load) == 1
+    assert await flight.do("a", load) == 1
+    assert flight.calls == 2  # noqa: PLR2004
+    assert flight.coalesced == 0
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_shares_exception() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release: asyncio.Event = asyncio.Event()
+
+    async def load() -> int:
+        await release.wait()
+        error_message: str = "failed"
+        raise ValueError(error_message)
+
+    tasks: list[asyncio.Task[int]] = [
+        asyncio.create_task(flight.do("a", load)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    results: list[int | BaseException] = await asyncio.gather(
+        *tasks,
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_forget() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release: asyncio.Event = asyncio.Event()
+    stored: list[int] = []
+
+    async def load() -> int:
+        await release.wait()
+        return 1
+
+    task: asyncio.Task[int] = asyncio.create_task(
+        flight.do("a", load, store=stored.append),
+    )
+    await asyncio.sleep(0)
+    flight.forget("a")
+    release.set()
+
+    assert await task == 1
+    assert stored == []
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio()
+async def test_single_flight_leader_cancelled() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release: asyncio.Event = asyncio.Event()
+
+    async def load() -> int:
+        await release.wait()
+        return 1
+
+    leader: asyncio.Task[int] = asyncio.create_task(flight.do("a", load))
+    await asyncio.sleep(0)
+    follower: asyncio.Task[int] = asyncio.create_task(flight.do("a", load))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == 1
+    assert leader.cancelled()
+    assert flight.calls == 2  # noqa: PLR2004
@@ -0,0 +1,170 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from app.core.cache import SharedCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.time: float = 0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+@pytest.fixture()
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture()
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "cache.sqlite3"
+
+
+def _create_cache(
+    path: Path,
+    clock: _Clock,
+    *,
+    eviction_interval: int = 1,
+) -> SharedCache[int]:
+    return SharedCache(
+        path=path,
+        max_size=2,
+        ttl=10,
+        encode=str,
+        decode=int,
+        clock=clock,
+        eviction_interval=eviction_interval,
+    )
+
+
+@pytest.fixture()
+def cache(path: Path, clock: _Clock) -> SharedCache[int]:
+    return _create_cache(path, clock)
+
+
+def test_shared_cache_get(cache: SharedCache[int]) -> None:
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+
+def test_shared_cache_get_missing(cache: SharedCache[int]) -> None:
+    assert cache.get("a") is None
+    assert cache.hits == 0
+    assert cache.misses == 1
+
+
+def test_shared_cache_get_expired(
+    cache: SharedCache[int],
+    clock: _Clock,
+) -> None:
+    cache.set("a", 1)
+    clock.time = 10
+
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+
+def test_shared_cache_set_expires_at(
+    cache: SharedCache[int],
+    clock: _Clock,
+) -> None:
+    cache.set("a", 1, expires_at=100)
+    clock.time = 99
+
+    assert cache.get("a") == 1
+
+
+def test_shared_cache_evicts(cache: SharedCache[int]) -> None:
+    cache.set("a", 1, expires_at=30)
+    cache.set("b", 2, expires_at=10)
+    cache.set("c", 3, expires_at=20)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+    assert cache.evictions == 1
+
+
+def test_shared_cache_evicts_every_interval(
+    path: Path,
+    clock: _Clock,
+) -> None:
+    cache: SharedCache[int] = _create_cache(path, clock, eviction_interval=4)
+
+    for key in range(3):
+        cache.set(key, key, expires_at=key + 10)
+
+    assert len(cache) == 3  # noqa: PLR2004
+    assert cache.stats()["size"] == 0
+
+    cache.set(3, 3, expires_at=13)
+
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.stats()["size"] == 2  # noqa: PLR2004
+    assert cache.get(0) is None
+    assert cache.get(3) == 3  # noqa: PLR2004
+    assert cache.evictions == 2  # noqa: PLR2004
+
+
+def test_shared_cache_delete(cache: SharedCache[int]) -> None:
+    cache.set("a", 1)
+    cache.delete("a")
+    cache.delete("b")
+
+    assert cache.get("a") is None
+
+
+def test_shared_cache_clear(cache: SharedCache[int]) -> None:
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_shared_cache_shared(
+    cache: SharedCache[int],
+    path: Path,
+    clock: _Clock,
+) -> None:
+    other: SharedCache[int] = _create_cache(path, clock)
+
+    cache.set(1, 1)
+
+    assert other.get(1) == 1
+
+    other.delete(1)
+
+    assert cache.get(1) is None
+
+
+def test_shared_cache_stats(cache: SharedCache[int]) -> None:
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+        "size": 1,
+    }
+
+
+def test_shared_cache_threads(cache: SharedCache[int]) -> None:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda key: cache.set(key, key), range(8)))
+        values: list[int | None] = list(executor.map(cache.get, range(8)))
+
+    assert len(cache) == 2  # noqa: PLR2004
+    assert values.count(None) == 6  # noqa: PLR2004
+    assert cache.evictions == 6  # noqa: PLR2004
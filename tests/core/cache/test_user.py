@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from app.core.cache import (
+    Cache,
+    SharedCache,
+    UserRecord,
+    cache_user_record,
+    get_user_record,
+    invalidate_user,
+    user,
+)
+
+_RECORD: UserRecord = UserRecord(
+    id=1,
+    email="john@example.com",
+    first_name="John",
+    last_name=None,
+    active=True,
+)
+
+
+@pytest.fixture(params=["in_process", "shared"])
+def user_cache(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Cache[int, UserRecord] | SharedCache[UserRecord]:
+    user_cache: Cache[int, UserRecord] | SharedCache[UserRecord] = (
+        SharedCache(
+            path=tmp_path / "cache.sqlite3",
+            max_size=2,
+            ttl=10,
+            encode=user._encode_user_record,
+            decode=user._decode_user_record,
+        )
+        if request.param == "shared"
+        else Cache(max_size=2, ttl=10)
+    )
+    monkeypatch.setattr(user, "user_cache", user_cache)
+
+    return user_cache
+
+
+@pytest.mark.asyncio()
+async def test_cache_user_record(
+    user_cache: Cache[int, UserRecord] | SharedCache[UserRecord],
+) -> None:
+    assert await get_user_record(_RECORD.id) is None
+
+    await cache_user_record(_RECORD)
+
+    assert await get_user_record(_RECORD.id) == _RECORD
+    assert user_cache.get(_RECORD.id) == _RECORD
+
+
+@pytest.mark.asyncio()
+async def test_invalidate_user(
+    user_cache: Cache[int, UserRecord] | SharedCache[UserRecord],
+) -> None:
+    await cache_user_record(_RECORD)
+    await invalidate_user(_RECORD.id)
+
+    assert user_cache.get(_RECORD.id) is None
@@ -0,0 +1,160 @@
+import asyncio
+import datetime
+
+import pytest
+
+from app.core.clicks import ClickBuffer, ClickEvent, OverflowPolicy
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.batches: list[list[ClickEvent]] = []
+
+    async def __call__(self, events: list[ClickEvent]) -> None:
+        self.batches.append(events)
+
+
+async def _failing_flush(_events: list[ClickEvent]) -> None:
+    raise RuntimeError
+
+
+@pytest.fixture()
+def sink() -> _Sink:
+    return _Sink()
+
+
+@pytest.fixture()
+def event() -> ClickEvent:
+    return ClickEvent(
+        url_id=1,
+        ip="127.0.0.1",
+        created_at=datetime.datetime(2025, 1, 1),  # noqa: DTZ001
+    )
+
+
+def _click_buffer(
+    sink: _Sink,
+    *,
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+) -> ClickBuffer:
+    return ClickBuffer(
+        flush=sink,
+        max_size=2,
+        batch_size=2,
+        flush_interval=60,
+        overflow_policy=overflow_policy,
+    )
+
+
+def test_click_buffer_put(sink: _Sink, event: ClickEvent) -> None:
+    click_buffer: ClickBuffer = _click_buffer(sink)
+
+    assert click_buffer.put(event)
+    assert len(click_buffer) == 1
+    assert click_buffer.enqueued == 1
+
+
+def test_click_buffer_put_drop_newest(sink: _Sink, event: ClickEvent) -> None:
+    click_buffer: ClickBuffer = _click_buffer(sink)
+    newest: ClickEvent = event._replace(url_id=2)
+
+    click_buffer.put(event)
+    click_buffer.put(event)
+
+    assert not click_buffer.put(newest)
+    assert list(click_buffer._events) == [event, event]
+    assert click_buffer.dropped == 1
+
+
+def test_click_buffer_put_drop_oldest(sink: _Sink, event: ClickEvent) -> None:
+    click_buffer: ClickBuffer = _click_buffer(
+        sink,
+        overflow_policy=OverflowPolicy.DROP_OLDEST,
+    )
+    newest: ClickEvent = event._replace(url_id=2)
+
+    click_buffer.put(event)
+    click_buffer.put(event)
+
+    assert click_buffer.put(newest)
+    assert list(click_buffer._events) == [event, newest]
+    assert click_buffer.dropped == 1
+
+
+@pytest.mark.asyncio()
+async def test_click_buffer_drain(sink: _Sink, event: ClickEvent) -> None:
+    click_buffer: ClickBuffer = ClickBuffer(
+        flush=sink,
+        max_size=3,
+        batch_size=2,
+        flush_interval=60,
+        overflow_policy=OverflowPolicy.DROP_NEWEST,
+    )
+    for _ in range(3):
+        click_buffer.put(event)
+
+    await click_buffer.drain()
+
+    assert sink.batches == [[event, event], [event]]
+    assert len(click_buffer) == 0
+    assert click_buffer.flushed == len([event, event, event])
+
+
+@pytest.mark.asyncio()
+async def test_click_buffer_drain_failed(event: ClickEvent) -> None:
+    click_buffer: ClickBuffer = ClickBuffer(
+        flush=_failing_flush,
+        max_size=2,
+        batch_size=2,
+        flush_interval=60,
+        overflow_policy=OverflowPolicy.DROP_NEWEST,
+    )
+    click_buffer.put(event)
+
+    await click_buffer.drain()
+
+    assert len(click_buffer) == 0
+    assert click_buffer.failed == 1
+
+
+@pytest.mark.asyncio()
+async def test_click_buffer_flushes_full_batch(
+    sink: _Sink,
+    event: ClickEvent,
+) -> None:
+    click_buffer: ClickBuffer = _click_buffer(sink)
+    click_buffer.start()
+
+    click_buffer.put(event)
+    click_buffer.put(event)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert sink.batches == [[event, event]]
+
+    await click_buffer.stop()
+
+
+@pytest.mark.asyncio()
+async def test_click_buffer_stop(sink: _Sink, event: ClickEvent) -> None:
+    click_buffer: ClickBuffer = _click_buffer(sink)
+    click_buffer.start()
+    click_buffer.put(event)
+
+    await click_buffer.stop()
+
+    assert sink.batches == [[event]]
+    assert click_buffer._task is None
+
+
+def test_click_buffer_stats(sink: _Sink, event: ClickEvent) -> None:
+    click_buffer: ClickBuffer = _click_buffer(sink)
+    click_buffer.put(event)
+
+    assert click_buffer.stats() == {
+        "enqueued": 1,
+        "dropped": 0,
+        "flushed": 0,
+        "failed": 0,
+        "pending": 1,
+    }
@@ -0,0 +1,87 @@
+import zlib
+
+import pytest
+
+from app.core.clicks import HyperLogLog
+
+
+def _sketch(precision: int, items: range) -> HyperLogLog:
+    hyperloglog: HyperLogLog = HyperLogLog(precision=precision)
+
+    for item in items:
+        hyperloglog.add(f"10.0.0.{item}")
+
+    return hyperloglog
+
+
+def test_hyperloglog_small_counts() -> None:
+    assert _sketch(12, range(0)).count() == 0
+    assert _sketch(12, range(1)).count() == 1
+    assert _sketch(12, range(10)).count() == 10  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("items", [1000, 10000, 100000])
+def test_hyperloglog_error(items: int) -> None:
+    hyperloglog: HyperLogLog = _sketch(12, range(items))
+
+    assert abs(hyperloglog.count() - items) < 4 * hyperloglog.error * items
+
+
+def test_hyperloglog_duplicates() -> None:
+    hyperloglog: HyperLogLog = _sketch(12, range(100))
+
+    for item in range(100):
+        hyperloglog.add(f"10.0.0.{item}")
+
+    assert hyperloglog.count() == _sketch(12, range(100)).count()
+
+
+def test_hyperloglog_update() -> None:
+    hyperloglog: HyperLogLog = _sketch(12, range(20000))
+    hyperloglog.update(_sketch(12, range(10000, 30000)))
+
+    assert bytes(hyperloglog.registers) == bytes(
+        _sketch(12, range(30000)).registers,
+    )
+
+
+@pytest.mark.parametrize(("first", "second"), [(12, 14), (14, 12)])
+def test_hyperloglog_update_other_precision(first: int, second: int) -> None:
+    hyperloglog: HyperLogLog = _sketch(first, range(20000))
+    hyperloglog.update(_sketch(second, range(10000, 30000)))
+
+    assert hyperloglog.precision == 12  # noqa: PLR2004
+    assert bytes(hyperloglog.registers) == bytes(
+        _sketch(12, range(30000)).registers,
+    )
+
+
+def test_hyperloglog_bytes() -> None:
+    hyperloglog: HyperLogLog = _sketch(14, range(1000))
+    data: bytes = hyperloglog.to_bytes()
+    loaded: HyperLogLog = HyperLogLog.from_bytes(data)
+
+    assert len(data) < len(hyperloglog.registers)
+    assert loaded.precision == 14  # noqa: PLR2004
+    assert bytes(loaded.registers) == bytes(hyperloglog.registers)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"sketch",
+        zlib.compress(b""),
+        zlib.compress(bytes((12,)) + bytes(16)),
+        zlib.compress(bytes((30,)) + bytes(1 << 30 >> 20)),
+    ],
+)
+def test_hyperloglog_from_invalid_bytes(data: bytes) -> None:
+    with pytest.raises(ValueError, match=r".*"):
+        HyperLogLog.from_bytes(data)
+
+
+def test_hyperloglog_invalid_precision() -> None:
+    with pytest.raises(ValueError, match=r".*"):
+        HyperLogLog(precision=3)
+    with pytest.raises(ValueError, match=r".*"):
+        HyperLogLog(precision=19)
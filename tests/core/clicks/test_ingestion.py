@@ -0,0 +1,48 @@
+import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.clicks import HyperLogLog, add_visitors
+
+if TYPE_CHECKING:
+    from app.crud.click import ClickRow
+
+_DAY: datetime.datetime = datetime.datetime(2026, 1, 1)  # noqa: DTZ001
+
+
+def _click(url_id: int, ip: str | None) -> "ClickRow":
+    return {
+        "url_id": url_id,
+        "ip": ip,
+        "country": None,
+        "created_at": _DAY,
+    }
+
+
+@pytest.mark.asyncio()
+async def test_add_visitors(async_session: AsyncSession) -> None:
+    await add_visitors(
+        async_session=async_session,
+        clicks=[_click(1, f"10.0.0.{index}") for index in range(10)],
+    )
+    await add_visitors(
+        async_session=async_session,
+        clicks=[
+            *(_click(1, f"10.0.0.{index}") for index in range(5, 15)),
+            _click(1, None),
+            _click(2, "10.0.0.1"),
+        ],
+    )
+    await async_session.commit()
+
+    sketches: list[bytes] = await crud.get_visitor_sketches(
+        async_session=async_session,
+        url_id=1,
+        start=_DAY.date(),
+        end=_DAY.date() + datetime.timedelta(days=1),
+    )
+    assert len(sketches) == 1
+    assert HyperLogLog.from_bytes(sketches[0]).count() == 15  # noqa: PLR2004
@@ -0,0 +1,75 @@
+import asyncio
+import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.clicks import ClickAggregator
+from app.core.database.id_generator import IdGenerator
+from app.core.database.models import daily_clicks
+
+if TYPE_CHECKING:
+    from sqlalchemy import Result
+
+
+@pytest.mark.asyncio()
+async def test_click_aggregator_aggregate(async_session: AsyncSession) -> None:
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[
+            {
+                "url_id": 1,
+                "ip": None,
+                "country": None,
+                "created_at": datetime.datetime(2026, 1, 1),  # noqa: DTZ001
+            }
+            for _ in range(5)
+        ],
+    )
+    click_aggregator: ClickAggregator = ClickAggregator(
+        interval=1.0,
+        batch_size=2,
+        settle_delay=0.0,
+    )
+    await asyncio.sleep(0.002)
+
+    assert await click_aggregator.aggregate(async_session=async_session) == 5  # noqa: PLR2004
+    assert await click_aggregator.aggregate(async_session=async_session) == 0
+    assert click_aggregator.stats()["runs"] == 2  # noqa: PLR2004
+    assert click_aggregator.stats()["aggregated"] == 5  # noqa: PLR2004
+
+    result: Result[tuple[int]] = await async_session.execute(
+        select(daily_clicks.c.clicks),
+    )
+    assert result.scalar() == 5  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_click_aggregator_settle_delay(
+    async_session: AsyncSession,
+) -> None:
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[
+            {
+                "url_id": 1,
+                "ip": None,
+                "country": None,
+                "created_at": datetime.datetime(2026, 1, 1),  # noqa: DTZ001
+            },
+        ],
+    )
+    click_aggregator: ClickAggregator = ClickAggregator(
+        interval=1.0,
+        batch_size=100,
+        settle_delay=60.0,
+    )
+
+    assert await click_aggregator.aggregate(async_session=async_session) == 0
+
+
+def test_first_id() -> None:
+    assert IdGenerator.first_id(1.0) == 1000 << 22
@@ -1,7 +1,7 @@
 import pytest
 
 from app.core.database.models import Click
-from app.core.settings.data import Country
+from app.core.settings.data import IP, Country
 
 
 @pytest.fixture(scope="module")
@@ -52,14 +52,17 @@ def test_click_property_ip(url_id: int, ip: str | None, country: str) -> None:
     assert click.ip == ip
 
 
-@pytest.mark.parametrize("ip", ["192.168.0.1", "10.0.0.1", None])
+@pytest.mark.parametrize(
+    "ip",
+    ["192.168.0.1", "10.0.0.1", "::1", "2001:db8::ffff:0:1", None],
+)
 def test_click_property_ip_setter(ip: str, click: Click) -> None:
     click.ip = ip
 
     assert click.ip == ip
 
 
-@pytest.mark.parametrize("ip", ["", "2560.256.256.256", "1.1.1."])
+@pytest.mark.parametrize("ip", ["", "1", "f" * (IP.MAX_LENGTH + 1)])
 def test_click_property_ip_setter_invalid_length(ip: str, click: Click) -> None:
     with pytest.raises(ValueError, match="^$"):
         click.ip = ip
@@ -1,4 +1,4 @@
-from ipaddress import IPv4Network
+from ipaddress import IPv4Network, IPv6Network
 
 import pytest
 
@@ -38,6 +38,18 @@ def test_network_init(address: str, mask: int, country: str) -> None:
     assert network._country == country
 
 
+@pytest.mark.parametrize("address", ["2001:db8::", "2a00:1450::", "::"])
+@pytest.mark.parametrize("mask", [32, 64, 128])
+def test_network_init_ipv6(address: str, mask: int, country: str) -> None:
+    ipv6_network: IPv6Network = IPv6Network(f"{address}/{mask}")
+
+    network: Network = Network(address=address, mask=mask, country=country)
+
+    assert network._version == ipv6_network.version
+    assert network._start_address == int(ipv6_network.network_address)
+    assert network._end_address == int(ipv6_network.broadcast_address)
+
+
 @pytest.mark.parametrize("address", ["1227.9.9.9", "256.256.256.256", "1.1.1."])
 def test_network_init_invalid_address(
     address: str,
@@ -72,6 +84,21 @@ def test_network_property_id(network: Network) -> None:
     assert network.id is None
 
 
+@pytest.mark.parametrize(
+    ("address", "mask", "version"),
+    [("192.168.0.0", 24, 4), ("2001:db8::", 32, 6)],
+)
+def test_network_property_version(
+    address: str,
+    mask: int,
+    country: str,
+    version: int,
+) -> None:
+    network: Network = Network(address=address, mask=mask, country=country)
+
+    assert network.version == version
+
+
 @pytest.mark.parametrize("address", ["192.168.1.0", "10.20.30.0", "172.16.1.0"])
 def test_network_property_start_address(
     address: str,
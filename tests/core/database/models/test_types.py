@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy.dialects import sqlite
+
+from app.core.database.models.types import IP_ADDRESS_SIZE, IPAddressInteger
+
+
+@pytest.mark.parametrize("value", [0, 1, 2**32 - 1, 2**128 - 1])
+def test_ip_address_integer_round_trip(value: int) -> None:
+    ip_address_integer: IPAddressInteger = IPAddressInteger()
+
+    data: bytes | None = ip_address_integer.process_bind_param(
+        value,
+        sqlite.dialect(),
+    )
+
+    assert data is not None
+    assert len(data) == IP_ADDRESS_SIZE
+    assert (
+        ip_address_integer.process_result_value(data, sqlite.dialect()) == value
+    )
+
+
+def test_ip_address_integer_preserves_order() -> None:
+    ip_address_integer: IPAddressInteger = IPAddressInteger()
+    values: list[int] = [2**128 - 1, 0, 2**32, 2**32 - 1, 256]
+
+    assert sorted(
+        values,
+        key=lambda v: (
+            ip_address_integer.process_bind_param(
+                v,
+                sqlite.dialect(),
+            )
+            or b""
+        ),
+    ) == sorted(values)
+
+
+def test_ip_address_integer_none() -> None:
+    ip_address_integer: IPAddressInteger = IPAddressInteger()
+
+    assert ip_address_integer.process_bind_param(None, sqlite.dialect()) is None
+    assert (
+        ip_address_integer.process_result_value(None, sqlite.dialect()) is None
+    )
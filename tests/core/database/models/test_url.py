@@ -1,7 +1,7 @@
 import pytest
 
 from app.core.database.models import Url
-from app.core.settings.data import Slug, Source
+from app.core.settings.data import Redirect, RedirectStatus, Slug, Source
 
 
 @pytest.fixture(scope="module")
@@ -40,6 +40,8 @@ def test_url_init(user_id: int, source: str, slug: str) -> None:
     assert url.source == source
     assert url.slug == slug
     assert url.total_clicks == 0
+    assert url.redirect_status == RedirectStatus.TEMPORARY_REDIRECT
+    assert url.cache_max_age is None
 
 
 @pytest.mark.parametrize("user_id", [0, 1, 2])
@@ -147,5 +149,46 @@ def test_url_property_total_clicks_setter_invalid_value(
         url.total_clicks = total_clicks
 
 
+@pytest.mark.parametrize("redirect_status", list(RedirectStatus))
+def test_url_property_redirect_status_setter(
+    url: Url,
+    redirect_status: int,
+) -> None:
+    url.redirect_status = redirect_status
+
+    assert url.redirect_status == redirect_status
+
+
+@pytest.mark.parametrize("redirect_status", [200, 300, 303, 404])
+def test_url_property_redirect_status_setter_invalid_value(
+    url: Url,
+    redirect_status: int,
+) -> None:
+    with pytest.raises(ValueError, match=r".*"):
+        url.redirect_status = redirect_status
+
+
+@pytest.mark.parametrize(
+    "cache_max_age",
+    [None, 0, 3600, Redirect.MAX_CACHE_MAX_AGE],
+)
+def test_url_property_cache_max_age_setter(
+    url: Url,
+    cache_max_age: int | None,
+) -> None:
+    url.cache_max_age = cache_max_age
+
+    assert url.cache_max_age == cache_max_age
+
+
+@pytest.mark.parametrize("cache_max_age", [-1, Redirect.MAX_CACHE_MAX_AGE + 1])
+def test_url_property_cache_max_age_setter_invalid_value(
+    url: Url,
+    cache_max_age: int,
+) -> None:
+    with pytest.raises(ValueError, match=r".*"):
+        url.cache_max_age = cache_max_age
+
+
 def test_url_repr(url: Url) -> None:
     assert repr(url) == f"<Url /{url.slug} -> {url.source}>"
@@ -324,6 +324,33 @@ def test_user_property_password_setter_invalid_length(
         user.password = password
 
 
+def test_user_init_hashed_password(password: str) -> None:
+    hashed_password: str = bcrypt.hashpw(
+        password.encode("utf-8"),
+        bcrypt.gensalt(rounds=4),
+    ).decode("utf-8")
+
+    user: User = User(
+        first_name="John",
+        email="john.doe@example.com",
+        password=hashed_password,
+        is_password_hashed=True,
+    )
+
+    assert user.password == hashed_password
+    assert user.is_password_valid(password) is True
+
+
+def test_user_init_hashed_password_invalid_length() -> None:
+    with pytest.raises(ValueError, match=r"^Hashed password is too long\.$"):
+        User(
+            first_name="John",
+            email="john.doe@example.com",
+            password="1" * (Password.HASHED_LENGTH + 1),
+            is_password_hashed=True,
+        )
+
+
 def test_user_property_display_name(user: User) -> None:
     assert user.display_name == "John Doe"
 
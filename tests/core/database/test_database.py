@@ -30,6 +30,13 @@ async def test_database_get_async_session(database: Database) -> None:
     assert async_session.is_active
 
 
+@pytest.mark.asyncio()
+async def test_database_create_async_session(database: Database) -> None:
+    async with database.create_async_session() as async_session:
+        assert isinstance(async_session, AsyncSession)
+        assert async_session.is_active
+
+
 @pytest.mark.asyncio()
 async def test_database_shutdown(database: Database) -> None:
     await database.shutdown()
@@ -0,0 +1,157 @@
+import struct
+from ipaddress import IPv4Network, IPv6Network, ip_network
+from pathlib import Path
+
+import pytest
+
+from app.core.geo import (
+    MappedNetworkIndex,
+    merge_network_ranges,
+    write_geo_file,
+)
+from app.core.geo.file import GEO_FILE_VERSION
+from app.crud.network import NetworkRange
+
+
+def _network_range(network: str, country: str) -> NetworkRange:
+    parsed_network: IPv4Network | IPv6Network = ip_network(network)
+
+    return NetworkRange(
+        start_address=int(parsed_network.network_address),
+        end_address=int(parsed_network.broadcast_address),
+        country=country,
+        version=parsed_network.version,
+    )
+
+
+@pytest.fixture()
+def network_ranges() -> list[NetworkRange]:
+    return [
+        _network_range("192.168.0.0/24", "es"),
+        _network_range("10.0.0.0/8", "ru"),
+        _network_range("172.16.0.0/16", "es"),
+        _network_range("255.255.255.0/24", "us"),
+        _network_range("2001:db8::/32", "us"),
+        _network_range("::/96", "ru"),
+        _network_range("ffff::/16", "ca"),
+    ]
+
+
+@pytest.fixture()
+def path(tmp_path: Path, network_ranges: list[NetworkRange]) -> Path:
+    path: Path = tmp_path / "geo.bin"
+    write_geo_file(path, network_ranges)
+
+    return path
+
+
+def test_merge_network_ranges_joins_same_country() -> None:
+    assert merge_network_ranges(
+        [
+            _network_range("10.0.1.0/24", "ru"),
+            _network_range("10.0.0.0/24", "ru"),
+            _network_range("10.0.0.128/25", "ru"),
+        ],
+    ) == [_network_range("10.0.0.0/23", "ru")]
+
+
+def test_merge_network_ranges_keeps_ip_versions_apart() -> None:
+    network_ranges: list[NetworkRange] = [
+        _network_range("0.0.0.0/24", "ru"),
+        _network_range("::/120", "ru"),
+    ]
+
+    assert merge_network_ranges(reversed(network_ranges)) == network_ranges
+
+
+def test_merge_network_ranges_keeps_adjacent_countries() -> None:
+    network_ranges: list[NetworkRange] = [
+        _network_range("10.0.0.0/24", "ru"),
+        _network_range("10.0.1.0/24", "es"),
+    ]
+
+    assert merge_network_ranges(network_ranges) == network_ranges
+
+
+def test_merge_network_ranges_clips_overlapping_countries() -> None:
+    assert merge_network_ranges(
+        [
+            _network_range("10.0.0.0/23", "ru"),
+            _network_range("10.0.1.0/24", "es"),
+            _network_range("10.0.1.128/25", "us"),
+            _network_range("10.0.2.0/24", "us"),
+        ],
+    ) == [
+        _network_range("10.0.0.0/23", "ru"),
+        _network_range("10.0.2.0/24", "us"),
+    ]
+
+
+def test_write_geo_file(path: Path, network_ranges: list[NetworkRange]) -> None:
+    assert path.exists()
+    assert not path.with_name(f"{path.name}.tmp").exists()
+    assert write_geo_file(path, network_ranges) == len(network_ranges)
+
+
+def test_mapped_network_index(
+    path: Path,
+    network_ranges: list[NetworkRange],
+) -> None:
+    network_index: MappedNetworkIndex = MappedNetworkIndex(path)
+
+    assert len(network_index) == len(network_ranges)
+    assert network_index.lookup("10.1.2.3") == "ru"
+    assert network_index.lookup("172.16.255.255") == "es"
+    assert network_index.lookup("192.168.0.1") == "es"
+    assert network_index.lookup("255.255.255.255") == "us"
+    assert network_index.lookup("8.8.8.8") is None
+    assert network_index.lookup("::1") == "ru"
+    assert network_index.lookup("::ffff:10.1.2.3") == "ru"
+    assert network_index.lookup("2001:db8:1::1") == "us"
+    assert network_index.lookup("ffff:ffff::") == "ca"
+    assert network_index.lookup("2001:db9::") is None
+    assert network_index.lookup("1::") is None
+
+
+def test_mapped_network_index_empty(tmp_path: Path) -> None:
+    path: Path = tmp_path / "geo.bin"
+    write_geo_file(path, [])
+
+    network_index: MappedNetworkIndex = MappedNetworkIndex(path)
+
+    assert len(network_index) == 0
+    assert network_index.lookup("10.0.0.1") is None
+
+
+def test_mapped_network_index_corrupted(path: Path) -> None:
+    data: bytearray = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError, match="corrupted"):
+        MappedNetworkIndex(path)
+
+
+def test_mapped_network_index_truncated(path: Path) -> None:
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError, match="corrupted"):
+        MappedNetworkIndex(path)
+
+
+def test_mapped_network_index_unsupported_version(path: Path) -> None:
+    data: bytearray = bytearray(path.read_bytes())
+    struct.pack_into("<H", data, 4, GEO_FILE_VERSION + 1)
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError, match="version"):
+        MappedNetworkIndex(path)
+
+
+@pytest.mark.parametrize("data", [b"", b"not a geo database file"])
+def test_mapped_network_index_invalid(tmp_path: Path, data: bytes) -> None:
+    path: Path = tmp_path / "geo.bin"
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError, match=r"geo database file|version"):
+        MappedNetworkIndex(path)
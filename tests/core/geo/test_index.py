@@ -0,0 +1,127 @@
+from ipaddress import IPv4Network, IPv6Network, ip_network
+
+import pytest
+
+from app.core.geo import NetworkIndex
+from app.crud.network import NetworkRange
+
+
+def _network_range(network: str, country: str) -> NetworkRange:
+    parsed_network: IPv4Network | IPv6Network = ip_network(network)
+
+    return NetworkRange(
+        start_address=int(parsed_network.network_address),
+        end_address=int(parsed_network.broadcast_address),
+        country=country,
+        version=parsed_network.version,
+    )
+
+
+@pytest.fixture()
+def network_index() -> NetworkIndex:
+    return NetworkIndex(
+        [
+            _network_range("192.168.0.0/24", "es"),
+            _network_range("10.0.0.0/8", "ru"),
+            _network_range("172.16.0.0/16", "es"),
+            _network_range("2001:db8::/32", "us"),
+            _network_range("::/112", "ru"),
+        ],
+    )
+
+
+def test_network_index_len(network_index: NetworkIndex) -> None:
+    assert len(network_index) == len(["es", "ru", "es", "us", "ru"])
+
+
+@pytest.mark.parametrize(
+    ("ip", "country"),
+    [
+        ("10.0.0.0", "ru"),
+        ("10.255.255.255", "ru"),
+        ("172.16.1.1", "es"),
+        ("192.168.0.128", "es"),
+        ("2001:db8::", "us"),
+        ("2001:db8:ffff:ffff:ffff:ffff:ffff:ffff", "us"),
+        ("::1", "ru"),
+        ("::ffff:10.1.2.3", "ru"),
+        ("::ffff:192.168.0.1", "es"),
+    ],
+)
+def test_network_index_lookup(
+    network_index: NetworkIndex,
+    ip: str,
+    country: str,
+) -> None:
+    assert network_index.lookup(ip) == country
+
+
+@pytest.mark.parametrize(
+    "ip",
+    [
+        "9.255.255.255",
+        "11.0.0.0",
+        "192.168.1.0",
+        "255.255.255.255",
+        "0.0.0.0",  # noqa: S104
+        "2001:db9::",
+        "::1:0:0",
+        "::ffff:8.8.8.8",
+    ],
+)
+def test_network_index_lookup_not_found(
+    network_index: NetworkIndex,
+    ip: str,
+) -> None:
+    assert network_index.lookup(ip) is None
+
+
+@pytest.mark.parametrize("ip", ["", "testclient", "256.0.0.1", "::g"])
+def test_network_index_lookup_invalid(
+    network_index: NetworkIndex,
+    ip: str,
+) -> None:
+    assert network_index.lookup(ip) is None
+
+
+def test_network_index_lookup_empty() -> None:
+    assert NetworkIndex([]).lookup("10.0.0.1") is None
+
+
+@pytest.mark.parametrize(
+    ("ip", "country"),
+    [
+        ("10.0.0.1", "ru"),
+        ("10.1.2.3", "ru"),
+        ("10.200.0.1", "ru"),
+        ("172.16.0.1", "es"),
+        ("172.16.128.1", "es"),
+        ("172.16.255.255", "es"),
+        ("2001:db8:1::1", "us"),
+        ("2001:db8:ffff::1", "us"),
+    ],
+)
+def test_network_index_lookup_nested(ip: str, country: str) -> None:
+    network_index: NetworkIndex = NetworkIndex(
+        [
+            _network_range("10.1.0.0/16", "ru"),
+            _network_range("10.0.0.0/8", "ru"),
+            _network_range("172.16.128.0/24", "us"),
+            _network_range("172.16.0.0/16", "es"),
+            _network_range("2001:db8:1::/48", "us"),
+            _network_range("2001:db8::/32", "us"),
+        ],
+    )
+
+    assert len(network_index) == len(["ru", "es", "us"])
+    assert network_index.lookup(ip) == country
+
+
+def test_network_index_lookup_many(network_index: NetworkIndex) -> None:
+    assert network_index.lookup_many(
+        ["10.0.0.1", "10.0.0.1", "192.168.0.1", "8.8.8.8"],
+    ) == {
+        "10.0.0.1": "ru",
+        "192.168.0.1": "es",
+        "8.8.8.8": None,
+    }
@@ -0,0 +1,115 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database.models import Network
+from app.core.geo import GeoLocator, write_geo_file
+from app.crud.network import NetworkRange
+
+
+@pytest.fixture()
+def geo_locator() -> GeoLocator:
+    return GeoLocator(reload_interval=60)
+
+
+def test_geo_locator_init(geo_locator: GeoLocator) -> None:
+    assert len(geo_locator.index) == 0
+    assert geo_locator.lookup("10.0.0.1") is None
+
+
+@pytest.mark.asyncio()
+async def test_geo_locator_reload(
+    async_session: AsyncSession,
+    geo_locator: GeoLocator,
+) -> None:
+    async_session.add(Network(address="10.0.0.0", mask=8, country="ru"))
+    await async_session.commit()
+
+    assert await geo_locator.reload(async_session=async_session)
+    assert geo_locator.lookup("10.0.0.1") == "ru"
+    assert geo_locator.lookup_many(["10.0.0.1", "8.8.8.8"]) == {
+        "10.0.0.1": "ru",
+        "8.8.8.8": None,
+    }
+
+
+@pytest.mark.asyncio()
+async def test_geo_locator_reload_unchanged(
+    async_session: AsyncSession,
+    geo_locator: GeoLocator,
+) -> None:
+    async_session.add(Network(address="10.0.0.0", mask=8, country="ru"))
+    await async_session.commit()
+    await geo_locator.reload(async_session=async_session)
+
+    assert not await geo_locator.reload(async_session=async_session)
+    assert geo_locator.reloads == 1
+
+
+@pytest.mark.asyncio()
+async def test_geo_locator_reload_swaps_index(
+    async_session: AsyncSession,
+    geo_locator: GeoLocator,
+) -> None:
+    async_session.add(Network(address="10.0.0.0", mask=8, country="ru"))
+    await async_session.commit()
+    await geo_locator.reload(async_session=async_session)
+    previous_index = geo_locator.index
+
+    async_session.add(Network(address="8.8.8.0", mask=24, country="us"))
+    await async_session.commit()
+
+    assert await geo_locator.reload(async_session=async_session)
+    assert geo_locator.index is not previous_index
+    assert geo_locator.lookup("8.8.8.8") == "us"
+    assert previous_index.lookup("8.8.8.8") is None
+
+
+@pytest.mark.asyncio()
+async def test_geo_locator_start_stop(geo_locator: GeoLocator) -> None:
+    geo_locator.start()
+    await geo_locator.stop()
+
+    assert geo_locator._task is None
+
+
+def test_geo_locator_stats(geo_locator: GeoLocator) -> None:
+    assert geo_locator.stats() == {"networks": 0, "reloads": 0}
+
+
+@pytest.mark.asyncio()
+async def test_geo_locator_reload_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "geo.bin"
+    write_geo_file(
+        path,
+        [NetworkRange(start_address=0, end_address=255, country="ru")],
+    )
+    geo_locator: GeoLocator = GeoLocator(reload_interval=60, path=path)
+
+    assert await geo_locator.refresh()
+    assert not await geo_locator.refresh()
+    assert geo_locator.lookup("0.0.0.1") == "ru"
+
+    write_geo_file(
+        path,
+        [NetworkRange(start_address=0, end_address=255, country="us")],
+    )
+
+    assert await geo_locator.refresh()
+    assert geo_locator.lookup("0.0.0.1") == "us"
+    assert geo_locator.reloads == len(["ru", "us"])
+
+
+@pytest.mark.asyncio()
+async def test_geo_locator_reload_file_corrupted(tmp_path: Path) -> None:
+    path: Path = tmp_path / "geo.bin"
+    write_geo_file(path, [])
+    await asyncio.to_thread(path.write_bytes, b"corrupted")
+    geo_locator: GeoLocator = GeoLocator(reload_interval=60, path=path)
+
+    with pytest.raises(ValueError, match=r"geo database file|version"):
+        await geo_locator.refresh()
+
+    assert len(geo_locator.index) == 0
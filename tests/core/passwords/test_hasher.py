@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.passwords import PasswordHasher, check_password
+
+
+@pytest.fixture()
+def password_hasher() -> PasswordHasher:
+    return PasswordHasher(max_concurrency=2)
+
+
+@pytest.mark.asyncio()
+async def test_password_hasher_hash(password_hasher: PasswordHasher) -> None:
+    hashed_password: str = await password_hasher.hash("password", rounds=4)
+
+    assert check_password("password", hashed_password)
+    assert password_hasher.completed == 1
+
+    password_hasher.shutdown()
+
+
+@pytest.mark.asyncio()
+async def test_password_hasher_verify(password_hasher: PasswordHasher) -> None:
+    hashed_password: str = await password_hasher.hash("password", rounds=4)
+
+    assert await password_hasher.verify("password", hashed_password) is True
+    assert await password_hasher.verify("drowssap", hashed_password) is False
+
+    password_hasher.shutdown()
+
+
+@pytest.mark.asyncio()
+async def test_password_hasher_runs_off_event_loop(
+    password_hasher: PasswordHasher,
+) -> None:
+    thread_names: list[str] = []
+
+    await password_hasher._run(
+        lambda: thread_names.append(threading.current_thread().name),
+    )
+
+    assert thread_names[0].startswith("password-hasher")
+
+    password_hasher.shutdown()
+
+
+@pytest.mark.asyncio()
+async def test_password_hasher_max_concurrency(
+    password_hasher: PasswordHasher,
+) -> None:
+    started: threading.Barrier = threading.Barrier(
+        password_hasher._max_concurrency + 1,
+    )
+    release: threading.Event = threading.Event()
+    running: list[int] = []
+
+    def block() -> None:
+        running.append(password_hasher.running)
+        if not release.is_set():
+            started.wait()
+        release.wait()
+
+    tasks: list[asyncio.Task[None]] = [
+        asyncio.create_task(password_hasher._run(block)) for _ in range(5)
+    ]
+    await asyncio.to_thread(started.wait)
+
+    assert password_hasher.stats() == {
+        "waiting": len(tasks) - password_hasher._max_concurrency,
+        "running": password_hasher._max_concurrency,
+        "completed": 0,
+    }
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert max(running) <= password_hasher._max_concurrency
+    assert password_hasher.stats() == {
+        "waiting": 0,
+        "running": 0,
+        "completed": len(tasks),
+    }
+
+    password_hasher.shutdown()
+
+
+def test_password_hasher_shutdown(password_hasher: PasswordHasher) -> None:
+    password_hasher.shutdown()
+
+    assert password_hasher._executor is None
@@ -0,0 +1,24 @@
+import bcrypt
+import pytest
+
+from app.core.passwords import check_password, hash_password
+
+
+@pytest.mark.parametrize("password", ["password123", "*&#^!(*@*&#$81)"])
+def test_hash_password(password: str) -> None:
+    hashed_password: str = hash_password(password, rounds=4)
+
+    assert hashed_password != password
+    assert hashed_password.startswith("$2b$04$")
+    assert bcrypt.checkpw(
+        password.encode("utf-8"),
+        hashed_password.encode("utf-8"),
+    )
+
+
+@pytest.mark.parametrize("password", ["password123", "*&#^!(*@*&#$81)"])
+def test_check_password(password: str) -> None:
+    hashed_password: str = hash_password(password, rounds=4)
+
+    assert check_password(password, hashed_password) is True
+    assert check_password(password[::-1], hashed_password) is False
@@ -0,0 +1,57 @@
+from app.core.slugs import BloomFilter
+
+
+def test_bloom_filter_no_false_negatives() -> None:
+    bloom_filter: BloomFilter = BloomFilter(
+        capacity=1000,
+        false_positive_rate=0.01,
+    )
+    items: list[str] = [f"slug-{index}" for index in range(1000)]
+
+    for item in items:
+        bloom_filter.add(item)
+
+    assert all(item in bloom_filter for item in items)
+    assert bloom_filter.count == 1000  # noqa: PLR2004
+
+
+def test_bloom_filter_false_positive_rate() -> None:
+    bloom_filter: BloomFilter = BloomFilter(
+        capacity=10000,
+        false_positive_rate=0.01,
+    )
+
+    for index in range(10000):
+        bloom_filter.add(f"slug-{index}")
+
+    false_positives: int = sum(
+        f"missing-{index}" in bloom_filter for index in range(10000)
+    )
+
+    assert false_positives < 200  # noqa: PLR2004
+    assert 0.005 < bloom_filter.estimated_false_positive_rate() < 0.02  # noqa: PLR2004
+
+
+def test_bloom_filter_sizing() -> None:
+    bloom_filter: BloomFilter = BloomFilter(
+        capacity=1000000,
+        false_positive_rate=0.01,
+    )
+
+    assert bloom_filter.hashes == 7  # noqa: PLR2004
+    assert 1150000 < bloom_filter.memory < 1250000  # noqa: PLR2004
+    assert bloom_filter.count == 0
+    assert "a" not in bloom_filter
+
+
+def test_bloom_filter_add_existing() -> None:
+    bloom_filter: BloomFilter = BloomFilter(
+        capacity=100,
+        false_positive_rate=0.01,
+    )
+
+    bloom_filter.add("a")
+    bloom_filter.add("a")
+
+    assert bloom_filter.count == 1
+    assert 1 not in bloom_filter
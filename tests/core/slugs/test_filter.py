@@ -0,0 +1,146 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database import Database
+from app.core.slugs import SlugFilter
+from app.core.slugs import filter as filter_module
+
+
+def _create_slug_filter(
+    *,
+    enabled: bool = True,
+    catch_up_interval: float = 0,
+) -> SlugFilter:
+    return SlugFilter(
+        enabled=enabled,
+        capacity=1000,
+        false_positive_rate=0.001,
+        sync_interval=1.0,
+        catch_up_interval=catch_up_interval,
+    )
+
+
+@pytest.fixture()
+def database(
+    database: Database,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Database:
+    monkeypatch.setattr(filter_module, "database", database)
+
+    return database
+
+
+@pytest.mark.asyncio()
+async def test_slug_filter_sync(async_session: AsyncSession) -> None:
+    await crud.create_url(
+        async_session=async_session,
+        user_id=1,
+        source="https://example.com",
+        slug="existing",
+    )
+    slug_filter: SlugFilter = _create_slug_filter()
+
+    assert slug_filter.might_exist("missing")
+    assert await slug_filter.sync(async_session=async_session) == 1
+    assert slug_filter.might_exist("existing")
+    assert not slug_filter.might_exist("missing")
+    assert slug_filter.rejected == 1
+    assert slug_filter.syncs == 1
+
+
+@pytest.mark.asyncio()
+async def test_slug_filter_sync_incremental(
+    async_session: AsyncSession,
+) -> None:
+    slug_filter: SlugFilter = _create_slug_filter()
+    await slug_filter.sync(async_session=async_session)
+
+    await crud.create_url(
+        async_session=async_session,
+        user_id=1,
+        source="https://example.com",
+        slug="later",
+    )
+
+    assert not slug_filter.might_exist("later")
+    assert await slug_filter.sync(async_session=async_session) == 1
+    assert slug_filter.might_exist("later")
+
+
+@pytest.mark.asyncio()
+async def test_slug_filter_add(async_session: AsyncSession) -> None:
+    slug_filter: SlugFilter = _create_slug_filter()
+    await slug_filter.sync(async_session=async_session)
+
+    slug_filter.add("a", "b")
+
+    assert slug_filter.might_exist("a")
+    assert slug_filter.might_exist("b")
+    assert slug_filter.stats()["slugs"] == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_slug_filter_disabled(async_session: AsyncSession) -> None:
+    await crud.create_url(
+        async_session=async_session,
+        user_id=1,
+        source="https://example.com",
+        slug="existing",
+    )
+    slug_filter: SlugFilter = _create_slug_filter(enabled=False)
+
+    assert await slug_filter.sync(async_session=async_session) == 0
+    assert slug_filter.might_exist("missing")
+    assert slug_filter.rejected == 0
+
+
+@pytest.mark.asyncio()
+async def test_slug_filter_might_exist_now(
+    async_session: AsyncSession,
+) -> None:
+    slug_filter: SlugFilter = _create_slug_filter()
+    await slug_filter.sync(async_session=async_session)
+
+    await crud.create_url(
+        async_session=async_session,
+        user_id=1,
+        source="https://example.com",
+        slug="elsewhere",
+    )
+
+    assert not slug_filter.might_exist("elsewhere")
+    assert await slug_filter.might_exist_now("elsewhere")
+    assert not await slug_filter.might_exist_now("missing")
+    assert slug_filter.catch_ups == 2  # noqa: PLR2004
+    assert slug_filter.rejected == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_slug_filter_might_exist_now_interval(
+    async_session: AsyncSession,
+) -> None:
+    slug_filter: SlugFilter = _create_slug_filter(catch_up_interval=60)
+    await slug_filter.sync(async_session=async_session)
+
+    assert not await slug_filter.might_exist_now("a")
+    assert not await slug_filter.might_exist_now("b")
+    assert slug_filter.catch_ups == 1
+
+
+@pytest.mark.asyncio()
+async def test_slug_filter_might_exist_now_error(
+    async_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    slug_filter: SlugFilter = _create_slug_filter()
+    await slug_filter.sync(async_session=async_session)
+
+    async def get_url_slugs(**_: object) -> None:
+        error_message: str = "Database unavailable."
+        raise OSError(error_message)
+
+    monkeypatch.setattr(crud, "get_url_slugs", get_url_slugs)
+
+    assert await slug_filter.might_exist_now("missing")
+    assert slug_filter.rejected == 0
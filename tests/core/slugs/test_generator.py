@@ -0,0 +1,45 @@
+import itertools
+import re
+
+import pytest
+
+from app.core.slugs import SlugGenerator, slug_generator
+
+
+def test_slug_generator() -> None:
+    slugs: list[str] = [slug_generator() for _ in range(1000)]
+
+    assert len(set(slugs)) == len(slugs)
+    assert all(re.fullmatch(r"[a-zA-Z0-9\-_]+", slug) for slug in slugs)
+
+
+@pytest.mark.parametrize("min_length", [1, 2, 3, 4, 6, 8, 12])
+def test_slug_generator_min_length(min_length: int) -> None:
+    generator: SlugGenerator = SlugGenerator(
+        ids=itertools.count().__next__,
+        min_length=min_length,
+    )
+
+    slugs: list[str] = [generator() for _ in range(70000)]
+
+    assert len(set(slugs)) == len(slugs)
+    assert min_length <= min(len(slug) for slug in slugs) <= min_length + 1
+
+
+def test_slug_generator_obfuscation() -> None:
+    generator: SlugGenerator = SlugGenerator(
+        ids=itertools.count().__next__,
+        min_length=1,
+    )
+    obfuscated_generator: SlugGenerator = SlugGenerator(
+        ids=itertools.count().__next__,
+        min_length=1,
+        obfuscation_key=0x5DEECE66D,
+    )
+
+    slugs: list[str] = [generator() for _ in range(1000)]
+    obfuscated_slugs: list[str] = [obfuscated_generator() for _ in range(1000)]
+
+    assert len(set(obfuscated_slugs)) == len(obfuscated_slugs)
+    assert not set(slugs) & set(obfuscated_slugs)
+    assert sorted(obfuscated_slugs) != obfuscated_slugs
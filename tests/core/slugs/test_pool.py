@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.slugs import SlugPool
+
+
+@pytest.mark.asyncio()
+async def test_slug_pool_refill(async_session: AsyncSession) -> None:
+    slug_pool: SlugPool = SlugPool(length=6, size=100, low_water_mark=10)
+
+    assert await slug_pool.refill(async_session=async_session) == 100  # noqa: PLR2004
+    assert len(slug_pool) == 100  # noqa: PLR2004
+    assert slug_pool.refills == 1
+
+    slugs: list[str] = [slug_pool.pop() or "" for _ in range(100)]
+
+    assert len(set(slugs)) == len(slugs)
+    assert all(len(slug) == 6 for slug in slugs)  # noqa: PLR2004
+    assert slug_pool.pop() is None
+    assert slug_pool.exhausted == 1
+
+
+@pytest.mark.asyncio()
+async def test_slug_pool_refill_skips_existing(
+    async_session: AsyncSession,
+) -> None:
+    await crud.create_url(
+        async_session=async_session,
+        user_id=1,
+        source="https://example.com",
+        slug="a",
+    )
+    slug_pool: SlugPool = SlugPool(length=1, size=64, low_water_mark=0)
+
+    await slug_pool.refill(async_session=async_session)
+
+    slugs: list[str] = [slug_pool.pop() or "" for _ in range(len(slug_pool))]
+    assert slugs
+    assert "a" not in slugs
+    assert len(set(slugs)) == len(slugs)
+
+
+@pytest.mark.asyncio()
+async def test_slug_pool_disabled(async_session: AsyncSession) -> None:
+    slug_pool: SlugPool = SlugPool(length=None, size=100, low_water_mark=10)
+
+    assert await slug_pool.refill(async_session=async_session) == 0
+    assert slug_pool.pop() is None
+    assert slug_pool.exhausted == 0
@@ -0,0 +1,34 @@
+import pytest
+
+from app.core.metrics import Metrics
+
+
+@pytest.fixture()
+def metrics() -> Metrics:
+    return Metrics(namespace="test")
+
+
+def test_metrics_collect(metrics: Metrics) -> None:
+    metrics.register("cache", lambda: {"hits": 1, "misses": 2})
+
+    assert metrics.collect() == {
+        "test_cache_hits": 1,
+        "test_cache_misses": 2,
+    }
+
+
+def test_metrics_collect_empty(metrics: Metrics) -> None:
+    assert metrics.collect() == {}
+
+
+def test_metrics_register_replaces_collector(metrics: Metrics) -> None:
+    metrics.register("cache", lambda: {"hits": 1})
+    metrics.register("cache", lambda: {"hits": 2})
+
+    assert metrics.collect() == {"test_cache_hits": 2}
+
+
+def test_metrics_render(metrics: Metrics) -> None:
+    metrics.register("cache", lambda: {"hits": 1, "ratio": 0.5})
+
+    assert metrics.render() == "test_cache_hits 1\ntest_cache_ratio 0.5\n"
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from app.core.utils import JsonArrayParser
+
+
+def _parse(data: bytes, *, size: int) -> list[object]:
+    parser: JsonArrayParser = JsonArrayParser()
+    items: list[object] = []
+
+    for start in range(0, len(data), size):
+        items += parser.feed(data[start : start + size])
+
+    return items + parser.feed(b"", final=True)
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 100000])
+def test_json_array_parser(size: int) -> None:
+    items: list[object] = [
+        *({"source": f"https://example.com/é{index}"} for index in range(50)),
+        12345,
+        "a]b",
+        None,
+        [1, [2]],
+    ]
+
+    assert _parse(json.dumps(items).encode(), size=size) == items
+
+
+def test_json_array_parser_incremental() -> None:
+    parser: JsonArrayParser = JsonArrayParser()
+
+    assert parser.feed(b'[{"a": 1}, 12') == [{"a": 1}]
+    assert parser.feed(b"3, {") == [123]
+    assert parser.feed(b"}]", final=True) == [{}]
+
+
+def test_json_array_parser_empty() -> None:
+    assert _parse(b" [ ] ", size=1) == []
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"{}", b"[", b"[1,", b"[1 2]", b"[1]x", b"[,]", b"[1,]", b"[\xff]"],
+)
+def test_json_array_parser_invalid(data: bytes) -> None:
+    with pytest.raises(ValueError, match=r"."):
+        _parse(data, size=1)
+
+
+def test_json_array_parser_decodes_on_possible_end(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    decodes: list[int] = []
+    raw_decode = json.JSONDecoder.raw_decode
+
+    def count_raw_decode(
+        decoder: json.JSONDecoder,
+        s: str,
+        idx: int = 0,
+    ) -> tuple[object, int]:
+        decodes.append(idx)
+        return raw_decode(decoder, s, idx)
+
+    monkeypatch.setattr(json.JSONDecoder, "raw_decode", count_raw_decode)
+    parser: JsonArrayParser = JsonArrayParser()
+
+    assert parser.feed(b'["') == []
+    for _ in range(100):
+        assert parser.feed(b"a" * 10) == []
+
+    assert parser.pending == 1001  # noqa: PLR2004
+    assert decodes == []
+    assert parser.feed(b'", 1') == ["a" * 1000]
+    assert parser.pending == len(" 1")
+    assert len(decodes) == 1
@@ -1,3 +1,4 @@
+import datetime
 from typing import TYPE_CHECKING
 
 import pytest
@@ -5,11 +6,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
-from app.core.database.models import Click
+from app.core.database.models import Click, Url
+from app.crud.click import ClickCursor
 
 if TYPE_CHECKING:
     from sqlalchemy import Result
 
+    from app.crud.click import ClickRow
+
 
 @pytest.fixture(scope="module")
 def url_id() -> int:
@@ -49,3 +53,105 @@ async def test_create_click(
     assert database_click.url_id == click.url_id
     assert database_click.ip == click.ip
     assert database_click.country == click.country
+
+
+@pytest.mark.asyncio()
+async def test_create_click_increments_total_clicks(
+    async_session: AsyncSession,
+    ip: str,
+    country: str,
+) -> None:
+    url: Url = Url(user_id=1, source="https://example.com", slug="example")
+    async_session.add(url)
+    await async_session.commit()
+
+    clicks: int = 2
+    for _ in range(clicks):
+        await crud.create_click(
+            async_session=async_session,
+            url_id=url.id,
+            ip=ip,
+            country=country,
+        )
+
+    await async_session.refresh(url)
+    assert url.total_clicks == clicks
+
+
+@pytest.mark.asyncio()
+async def test_create_clicks(
+    async_session: AsyncSession,
+    ip: str,
+    country: str,
+) -> None:
+    urls: list[Url] = [
+        Url(user_id=1, source="https://example.com", slug=slug)
+        for slug in ("first", "second")
+    ]
+    async_session.add_all(urls)
+    await async_session.commit()
+    created_at: datetime.datetime = datetime.datetime(2025, 1, 1)  # noqa: DTZ001
+    clicks: list[ClickRow] = [
+        {
+            "url_id": url.id,
+            "ip": ip,
+            "country": country,
+            "created_at": created_at,
+        }
+        for url in (urls[0], urls[0], urls[1])
+    ]
+
+    await crud.create_clicks(async_session=async_session, clicks=clicks)
+
+    result: Result[tuple[Click]] = await async_session.execute(select(Click))
+    database_clicks: list[Click] = list(result.scalars().all())
+    assert len(database_clicks) == len(clicks)
+    assert {click.created_at for click in database_clicks} == {created_at}
+    for url in urls:
+        await async_session.refresh(url)
+    assert [url.total_clicks for url in urls] == [2, 1]
+
+
+@pytest.mark.asyncio()
+async def test_create_clicks_empty(async_session: AsyncSession) -> None:
+    await crud.create_clicks(async_session=async_session, clicks=[])
+
+    result: Result[tuple[Click]] = await async_session.execute(select(Click))
+    assert result.scalars().first() is None
+
+
+@pytest.mark.asyncio()
+async def test_get_url_clicks(async_session: AsyncSession, ip: str) -> None:
+    created_at: datetime.datetime = datetime.datetime(2025, 1, 1)  # noqa: DTZ001
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[
+            {
+                "url_id": url_id,
+                "ip": ip,
+                "country": None,
+                "created_at": created_at + datetime.timedelta(minutes=minute),
+            }
+            for url_id, minute in ((1, 0), (1, 0), (1, 1), (2, 2), (1, 3))
+        ],
+    )
+
+    pages: list[list[Click]] = []
+    before: ClickCursor | None = None
+    while page := await crud.get_url_clicks(
+        async_session=async_session,
+        url_id=1,
+        before=before,
+        limit=2,
+    ):
+        pages.append(page)
+        before = ClickCursor(page[-1].created_at, page[-1].id)
+
+    clicks: list[Click] = [click for page in pages for click in page]
+    assert [len(page) for page in pages] == [2, 2]
+    assert {click.url_id for click in clicks} == {1}
+    assert len({click.id for click in clicks}) == len(clicks)
+    assert [(click.created_at, click.id) for click in clicks] == sorted(
+        ((click.created_at, click.id) for click in clicks),
+        reverse=True,
+    )
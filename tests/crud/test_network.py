@@ -0,0 +1,314 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database.models import Network
+from app.crud.network import NetworkChanges, NetworkRange
+
+
+@pytest_asyncio.fixture()
+async def networks(async_session: AsyncSession) -> list[Network]:
+    networks: list[Network] = [
+        Network(address="192.168.0.0", mask=24, country="es"),
+        Network(address="10.0.0.0", mask=8, country="ru"),
+        Network(address="2001:db8::", mask=32, country="us"),
+    ]
+
+    async_session.add_all(networks)
+    await async_session.commit()
+
+    return networks
+
+
+@pytest.mark.asyncio()
+async def test_get_network_by_ip(
+    async_session: AsyncSession,
+    networks: list[Network],
+) -> None:
+    network: Network | None = await crud.get_network_by_ip(
+        async_session=async_session,
+        ip="10.1.2.3",
+    )
+
+    assert network is not None
+    assert network.country == networks[1].country
+
+
+@pytest.mark.asyncio()
+async def test_get_network_by_ip_ipv6(
+    async_session: AsyncSession,
+    networks: list[Network],
+) -> None:
+    network: Network | None = await crud.get_network_by_ip(
+        async_session=async_session,
+        ip="2001:db8:ffff::1",
+    )
+
+    assert network is not None
+    assert network.country == networks[2].country
+    assert network.version == networks[2].version
+
+
+@pytest.mark.asyncio()
+async def test_get_network_by_ip_ipv4_mapped(
+    async_session: AsyncSession,
+    networks: list[Network],
+) -> None:
+    network: Network | None = await crud.get_network_by_ip(
+        async_session=async_session,
+        ip="::ffff:10.1.2.3",
+    )
+
+    assert network is not None
+    assert network.country == networks[1].country
+
+
+@pytest.mark.parametrize("ip", ["8.8.8.8", "2001:db9::1", "::a00:1"])
+@pytest.mark.asyncio()
+async def test_get_network_by_ip_not_found(
+    async_session: AsyncSession,
+    networks: list[Network],  # noqa: ARG001
+    ip: str,
+) -> None:
+    network: Network | None = await crud.get_network_by_ip(
+        async_session=async_session,
+        ip=ip,
+    )
+
+    assert network is None
+
+
+@pytest.mark.asyncio()
+async def test_get_network_ranges(
+    async_session: AsyncSession,
+    networks: list[Network],
+) -> None:
+    network_ranges: list[NetworkRange] = await crud.get_network_ranges(
+        async_session=async_session,
+    )
+
+    assert network_ranges == [
+        NetworkRange(
+            start_address=network.start_address,
+            end_address=network.end_address,
+            country=network.country,
+            version=network.version,
+        )
+        for network in sorted(
+            networks,
+            key=lambda n: (n.version, n.start_address),
+        )
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_get_networks_fingerprint(
+    async_session: AsyncSession,
+    networks: list[Network],
+) -> None:
+    fingerprint: tuple[int, int] = await crud.get_networks_fingerprint(
+        async_session=async_session,
+    )
+
+    assert fingerprint == (
+        len(networks),
+        max(network.id for network in networks),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_get_networks_fingerprint_empty(
+    async_session: AsyncSession,
+) -> None:
+    fingerprint: tuple[int, int] = await crud.get_networks_fingerprint(
+        async_session=async_session,
+    )
+
+    assert fingerprint == (0, 0)
+
+
+@pytest.mark.asyncio()
+async def test_create_networks(async_session: AsyncSession) -> None:
+    network_ranges: list[NetworkRange] = [
+        NetworkRange(start_address=0, end_address=255, country="ru"),
+        NetworkRange(
+            start_address=2**128 - 256,
+            end_address=2**128 - 1,
+            country="us",
+            version=6,
+        ),
+    ]
+
+    await crud.create_networks(
+        async_session=async_session,
+        network_ranges=network_ranges,
+    )
+
+    assert (
+        await crud.get_network_ranges(async_session=async_session)
+        == network_ranges
+    )
+
+
+@pytest.mark.asyncio()
+async def test_create_networks_without_commit(
+    async_session: AsyncSession,
+) -> None:
+    await crud.create_networks(
+        async_session=async_session,
+        network_ranges=[
+            NetworkRange(start_address=0, end_address=255, country="ru"),
+        ],
+        commit=False,
+    )
+    await async_session.rollback()
+
+    assert await crud.get_network_ranges(async_session=async_session) == []
+
+
+@pytest.mark.asyncio()
+async def test_create_networks_empty(async_session: AsyncSession) -> None:
+    await crud.create_networks(async_session=async_session, network_ranges=[])
+
+    assert await crud.get_network_ranges(async_session=async_session) == []
+
+
+@pytest.mark.asyncio()
+async def test_apply_staged_networks(
+    async_session: AsyncSession,
+    networks: list[Network],
+) -> None:
+    network_ranges: list[NetworkRange] = [
+        NetworkRange(
+            start_address=network.start_address,
+            end_address=network.end_address,
+            country=network.country,
+            version=network.version,
+        )
+        for network in networks[1:]
+    ]
+    new_network_range: NetworkRange = NetworkRange(
+        start_address=0,
+        end_address=255,
+        country="us",
+    )
+
+    await crud.create_networks(
+        async_session=async_session,
+        network_ranges=[*network_ranges, new_network_range, new_network_range],
+        staged=True,
+    )
+    network_changes: NetworkChanges = await crud.apply_staged_networks(
+        async_session=async_session,
+    )
+
+    assert network_changes == NetworkChanges(inserted=1, deleted=1)
+    assert sorted(
+        await crud.get_network_ranges(async_session=async_session),
+    ) == sorted([*network_ranges, new_network_range])
+
+
+@pytest.mark.asyncio()
+async def test_apply_staged_networks_unchanged(
+    async_session: AsyncSession,
+    networks: list[Network],
+) -> None:
+    await crud.create_networks(
+        async_session=async_session,
+        network_ranges=[
+            NetworkRange(
+                start_address=network.start_address,
+                end_address=network.end_address,
+                country=network.country,
+                version=network.version,
+            )
+            for network in networks
+        ],
+        staged=True,
+    )
+    fingerprint: tuple[int, int] = await crud.get_networks_fingerprint(
+        async_session=async_session,
+    )
+
+    assert await crud.apply_staged_networks(
+        async_session=async_session,
+    ) == NetworkChanges(inserted=0, deleted=0)
+    assert (
+        await crud.get_networks_fingerprint(async_session=async_session)
+        == fingerprint
+    )
+
+
+@pytest.mark.asyncio()
+async def test_apply_staged_networks_deletes_duplicates(
+    async_session: AsyncSession,
+) -> None:
+    network_range: NetworkRange = NetworkRange(
+        start_address=0,
+        end_address=255,
+        country="us",
+    )
+    await crud.create_networks(
+        async_session=async_session,
+        network_ranges=[network_range, network_range],
+    )
+    await crud.create_networks(
+        async_session=async_session,
+        network_ranges=[network_range],
+        staged=True,
+    )
+
+    assert await crud.apply_staged_networks(
+        async_session=async_session,
+    ) == NetworkChanges(inserted=0, deleted=1)
+    assert await crud.get_network_ranges(async_session=async_session) == [
+        network_range,
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_apply_staged_networks_changes_fingerprint(
+    async_session: AsyncSession,
+    networks: list[Network],
+) -> None:
+    fingerprint: tuple[int, int] = await crud.get_networks_fingerprint(
+        async_session=async_session,
+    )
+    await crud.create_networks(
+        async_session=async_session,
+        network_ranges=[
+            NetworkRange(
+                start_address=network.start_address,
+                end_address=network.end_address,
+                country="us",
+                version=network.version,
+            )
+            for network in networks
+        ],
+        staged=True,
+    )
+
+    await crud.apply_staged_networks(async_session=async_session)
+
+    assert (
+        await crud.get_networks_fingerprint(async_session=async_session)
+        != fingerprint
+    )
+
+
+@pytest.mark.asyncio()
+async def test_clear_staged_networks(async_session: AsyncSession) -> None:
+    await crud.create_networks(
+        async_session=async_session,
+        network_ranges=[
+            NetworkRange(start_address=0, end_address=255, country="us"),
+        ],
+        staged=True,
+    )
+
+    await crud.clear_staged_networks(async_session=async_session)
+
+    assert await crud.apply_staged_networks(
+        async_session=async_session,
+    ) == NetworkChanges(inserted=0, deleted=0)
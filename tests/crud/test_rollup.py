@@ -0,0 +1,264 @@
+import datetime
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database.id_generator import IdGenerator
+from app.core.database.models import (
+    daily_clicks,
+    daily_country_clicks,
+    hourly_clicks,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Result
+
+    from app.crud.click import ClickRow
+
+_DAY: datetime.datetime = datetime.datetime(2026, 1, 1)  # noqa: DTZ001
+
+
+def _click(
+    url_id: int,
+    country: str | None,
+    created_at: datetime.datetime,
+) -> "ClickRow":
+    return {
+        "url_id": url_id,
+        "ip": None,
+        "country": country,
+        "created_at": created_at,
+    }
+
+
+@pytest.mark.asyncio()
+async def test_rollup_clicks(async_session: AsyncSession) -> None:
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[
+            _click(1, "es", _DAY + datetime.timedelta(hours=10, minutes=5)),
+            _click(1, "es", _DAY + datetime.timedelta(hours=10, minutes=55)),
+            _click(1, None, _DAY + datetime.timedelta(hours=11)),
+            _click(1, "fr", _DAY + datetime.timedelta(days=1)),
+            _click(2, "es", _DAY + datetime.timedelta(hours=10)),
+        ],
+    )
+
+    assert (
+        await crud.rollup_clicks(
+            async_session=async_session,
+            before_id=IdGenerator.first_id(time.time() + 1),
+            limit=100,
+        )
+        == 5  # noqa: PLR2004
+    )
+
+    hourly: Result[
+        tuple[int, datetime.datetime, int]
+    ] = await async_session.execute(
+        select(hourly_clicks).order_by(*hourly_clicks.primary_key),
+    )
+    assert list(hourly) == [
+        (1, _DAY + datetime.timedelta(hours=10), 2),
+        (1, _DAY + datetime.timedelta(hours=11), 1),
+        (1, _DAY + datetime.timedelta(days=1), 1),
+        (2, _DAY + datetime.timedelta(hours=10), 1),
+    ]
+    daily: Result[tuple[int, datetime.date, int]] = await async_session.execute(
+        select(daily_clicks).order_by(*daily_clicks.primary_key),
+    )
+    assert list(daily) == [
+        (1, datetime.date(2026, 1, 1), 3),
+        (1, datetime.date(2026, 1, 2), 1),
+        (2, datetime.date(2026, 1, 1), 1),
+    ]
+    countries: Result[
+        tuple[int, datetime.date, str, int]
+    ] = await async_session.execute(
+        select(daily_country_clicks).order_by(
+            *daily_country_clicks.primary_key,
+        ),
+    )
+    assert list(countries) == [
+        (1, datetime.date(2026, 1, 1), "es", 2),
+        (1, datetime.date(2026, 1, 2), "fr", 1),
+        (2, datetime.date(2026, 1, 1), "es", 1),
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_rollup_clicks_incremental(async_session: AsyncSession) -> None:
+    created_at: datetime.datetime = _DAY + datetime.timedelta(hours=10)
+    before_id: int = IdGenerator.first_id(time.time() + 60)
+
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[_click(1, "es", created_at) for _ in range(3)],
+    )
+
+    assert (
+        await crud.rollup_clicks(
+            async_session=async_session,
+            before_id=before_id,
+            limit=2,
+        )
+        == 2  # noqa: PLR2004
+    )
+    assert (
+        await crud.rollup_clicks(
+            async_session=async_session,
+            before_id=before_id,
+            limit=2,
+        )
+        == 1
+    )
+    assert (
+        await crud.rollup_clicks(
+            async_session=async_session,
+            before_id=before_id,
+            limit=2,
+        )
+        == 0
+    )
+
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[_click(1, "es", created_at)],
+    )
+    await crud.rollup_clicks(
+        async_session=async_session,
+        before_id=before_id,
+        limit=2,
+    )
+
+    result: Result[tuple[int]] = await async_session.execute(
+        select(daily_clicks.c.clicks),
+    )
+    assert result.scalar() == 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_rollup_clicks_before_id(async_session: AsyncSession) -> None:
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[_click(1, "es", _DAY)],
+    )
+
+    assert (
+        await crud.rollup_clicks(
+            async_session=async_session,
+            before_id=IdGenerator.first_id(time.time() - 60),
+            limit=100,
+        )
+        == 0
+    )
+    assert await crud.get_rollup_cursor(async_session=async_session) == 0
+
+
+@pytest.mark.asyncio()
+async def test_get_rollup_cursor(async_session: AsyncSession) -> None:
+    assert await crud.get_rollup_cursor(async_session=async_session) == 0
+
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[_click(1, None, _DAY)],
+    )
+    await crud.rollup_clicks(
+        async_session=async_session,
+        before_id=IdGenerator.first_id(time.time() + 1),
+        limit=100,
+    )
+
+    assert await crud.get_rollup_cursor(async_session=async_session) > 0
+
+
+@pytest.mark.asyncio()
+async def test_get_rollup_clicks(async_session: AsyncSession) -> None:
+    await crud.create_clicks(
+        async_session=async_session,
+        clicks=[
+            _click(1, "es", _DAY + datetime.timedelta(hours=10)),
+            _click(1, "fr", _DAY + datetime.timedelta(hours=10)),
+            _click(1, "es", _DAY + datetime.timedelta(days=1, hours=2)),
+            _click(1, None, _DAY + datetime.timedelta(days=2)),
+            _click(2, "es", _DAY),
+        ],
+    )
+    await crud.rollup_clicks(
+        async_session=async_session,
+        before_id=IdGenerator.first_id(time.time() + 1),
+        limit=100,
+    )
+
+    assert await crud.get_hourly_clicks(
+        async_session=async_session,
+        url_id=1,
+        start=_DAY,
+        end=_DAY + datetime.timedelta(days=2),
+    ) == {
+        _DAY + datetime.timedelta(hours=10): 2,
+        _DAY + datetime.timedelta(days=1, hours=2): 1,
+    }
+    assert await crud.get_daily_clicks(
+        async_session=async_session,
+        url_id=1,
+        start=datetime.date(2026, 1, 2),
+        end=datetime.date(2026, 1, 4),
+    ) == {datetime.date(2026, 1, 2): 1, datetime.date(2026, 1, 3): 1}
+    assert list(
+        (
+            await crud.get_country_clicks(
+                async_session=async_session,
+                url_id=1,
+                start=datetime.date(2026, 1, 1),
+                end=datetime.date(2026, 1, 4),
+            )
+        ).items(),
+    ) == [("es", 2), ("fr", 1)]
+
+
+@pytest.mark.asyncio()
+async def test_visitor_sketches(async_session: AsyncSession) -> None:
+    day: datetime.date = _DAY.date()
+
+    await crud.save_visitor_sketches(
+        async_session=async_session,
+        worker=1,
+        sketches={(1, day): b"first", (2, day): b"other"},
+    )
+    await crud.save_visitor_sketches(
+        async_session=async_session,
+        worker=2,
+        sketches={(1, day + datetime.timedelta(days=1)): b"second"},
+    )
+    await crud.save_visitor_sketches(
+        async_session=async_session,
+        worker=1,
+        sketches={(1, day): b"updated"},
+    )
+
+    assert sorted(
+        await crud.get_visitor_sketches(
+            async_session=async_session,
+            url_id=1,
+            start=day,
+            end=day + datetime.timedelta(days=2),
+        ),
+    ) == [b"second", b"updated"]
+    assert await crud.get_worker_visitor_sketches(
+        async_session=async_session,
+        worker=1,
+        keys=[(1, day), (1, day + datetime.timedelta(days=1))],
+    ) == {(1, day): b"updated"}
+    assert (
+        await crud.get_worker_visitor_sketches(
+            async_session=async_session,
+            worker=1,
+            keys=[],
+        )
+        == {}
+    )
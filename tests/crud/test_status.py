@@ -3,6 +3,7 @@ from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
+from app.core.cache import UserRecord, invalidate_user, user_cache
 from app.core.database.models import Status
 
 
@@ -33,3 +34,32 @@ async def test_create_status(
     assert database_status.active == status.active
     assert database_status.email_verified == status.email_verified
     assert database_status.phone_verified == status.phone_verified
+
+
+@pytest.mark.asyncio()
+async def test_create_status_without_commit(
+    async_session: AsyncSession,
+    user_id: int,
+) -> None:
+    record: UserRecord = UserRecord(
+        id=user_id,
+        email="john@example.com",
+        first_name="John",
+        last_name=None,
+        active=False,
+    )
+    user_cache.set(user_id, record)
+
+    await crud.create_status(
+        async_session=async_session,
+        user_id=user_id,
+        active=True,
+        commit=False,
+    )
+
+    assert user_cache.get(user_id) == record
+
+    await async_session.commit()
+    await invalidate_user(user_id)
+
+    assert user_cache.get(user_id) is None
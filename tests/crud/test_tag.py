@@ -41,3 +41,43 @@ async def test_create_tag(
     assert database_tag.id == tag.id
     assert database_tag.url_id == url_id
     assert database_tag.name == name
+
+
+@pytest.mark.asyncio()
+async def test_create_tags(
+    async_session: AsyncSession,
+    url_id: int,
+) -> None:
+    names: set[str] = {"first", "second", "third"}
+
+    tags: list[Tag] = await crud.create_tags(
+        async_session=async_session,
+        url_id=url_id,
+        names=names,
+    )
+
+    result: Result[tuple[Tag]] = await async_session.execute(
+        select(Tag).where(Tag.url_id == url_id),
+    )
+    database_tags: list[Tag] = list(result.scalars())
+    assert {tag.id for tag in database_tags} == {tag.id for tag in tags}
+    assert {tag.name for tag in database_tags} == names
+
+
+@pytest.mark.asyncio()
+async def test_create_tags_invalid_name(
+    async_session: AsyncSession,
+    url_id: int,
+    name: str,
+) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        await crud.create_tags(
+            async_session=async_session,
+            url_id=url_id,
+            names=[name, ""],
+        )
+
+    result: Result[tuple[Tag]] = await async_session.execute(
+        select(Tag).where(Tag.url_id == url_id),
+    )
+    assert result.scalars().first() is None
@@ -1,10 +1,15 @@
 import pytest
 import pytest_asyncio
-from sqlalchemy import Result, select
+from sqlalchemy import Result, inspect, select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app import crud
-from app.core.database.models import Url
+from app.core import slugs
+from app.core.cache import UrlRecord, missing_url_cache, url_cache
+from app.core.database.models import Tag, Url
+from app.crud.url import NewUrl, UrlSummary
 
 
 @pytest.fixture(scope="module")
@@ -56,6 +61,161 @@ async def test_create_url(
     assert database_url.slug == url.slug
 
 
+@pytest.mark.asyncio()
+async def test_create_url_populated(
+    async_session: AsyncSession,
+    user_id: int,
+    source: str,
+    slug: str,
+) -> None:
+    url: Url = await crud.create_url(
+        async_session=async_session,
+        user_id=user_id,
+        source=source,
+        slug=slug,
+    )
+
+    assert not inspect(url).expired_attributes
+    assert url.id
+    assert url.created_at
+    assert url.updated_at
+    assert url.total_clicks == 0
+
+
+@pytest.mark.asyncio()
+async def test_create_url_without_commit(
+    async_session: AsyncSession,
+    user_id: int,
+    source: str,
+    slug: str,
+) -> None:
+    url: Url = await crud.create_url(
+        async_session=async_session,
+        user_id=user_id,
+        source=source,
+        slug=slug,
+        commit=False,
+    )
+    url_id: int = url.id
+
+    await async_session.rollback()
+
+    result: Result[tuple[Url]] = await async_session.execute(
+        select(Url).where(Url.id == url_id),
+    )
+    assert result.scalars().first() is None
+
+
+@pytest.mark.asyncio()
+async def test_create_urls(
+    async_session: AsyncSession,
+    user_id: int,
+    source: str,
+) -> None:
+    new_urls: list[NewUrl] = [
+        NewUrl(user_id=user_id, source=source, slug="first", tags={"a", "b"}),
+        NewUrl(user_id=user_id, source=source, slug="second", tags=set()),
+    ]
+
+    urls: list[Url] = await crud.create_urls(
+        async_session=async_session,
+        urls=new_urls,
+    )
+
+    assert [url.slug for url in urls] == ["first", "second"]
+
+    result: Result[tuple[Url]] = await async_session.execute(
+        select(Url)
+        .where(Url.user_id == user_id)
+        .options(selectinload(Url.tags)),
+    )
+    database_urls: dict[str, Url] = {url.slug: url for url in result.scalars()}
+    assert database_urls.keys() == {"first", "second"}
+    assert {tag.name for tag in database_urls["first"].tags} == {"a", "b"}
+    assert database_urls["second"].tags == []
+
+
+@pytest.mark.asyncio()
+async def test_create_urls_empty(async_session: AsyncSession) -> None:
+    assert await crud.create_urls(async_session=async_session, urls=[]) == []
+
+
+@pytest.mark.asyncio()
+async def test_get_existing_slugs(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    existing_slugs: set[str] = await crud.get_existing_slugs(
+        async_session=async_session,
+        slugs={url.slug, "missing"},
+    )
+
+    assert existing_slugs == {url.slug}
+
+
+@pytest.mark.asyncio()
+async def test_get_existing_slugs_empty(async_session: AsyncSession) -> None:
+    assert (
+        await crud.get_existing_slugs(async_session=async_session, slugs=[])
+        == set()
+    )
+
+
+@pytest.mark.asyncio()
+async def test_get_url_slugs(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    other_url: Url = await crud.create_url(
+        async_session=async_session,
+        user_id=url.user_id,
+        source=url.source,
+        slug=url.slug[::-1],
+    )
+
+    assert await crud.get_url_slugs(
+        async_session=async_session,
+        after_id=0,
+        limit=10,
+    ) == [(url.id, url.slug), (other_url.id, other_url.slug)]
+    assert await crud.get_url_slugs(
+        async_session=async_session,
+        after_id=url.id,
+        limit=10,
+    ) == [(other_url.id, other_url.slug)]
+    assert await crud.get_url_slugs(
+        async_session=async_session,
+        after_id=0,
+        limit=1,
+    ) == [(url.id, url.slug)]
+
+
+@pytest.mark.asyncio()
+async def test_get_url_by_id(async_session: AsyncSession, url: Url) -> None:
+    database_url: Url | None = await crud.get_url_by_id(
+        async_session=async_session,
+        url_id=url.id,
+        user_id=url.user_id,
+    )
+
+    assert database_url is not None
+    assert database_url.id == url.id
+
+
+@pytest.mark.asyncio()
+async def test_get_url_by_id_of_other_user(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    database_url: Url | None = await crud.get_url_by_id(
+        async_session=async_session,
+        url_id=url.id,
+        user_id=url.user_id + 1,
+    )
+
+    assert database_url is None
+
+
 @pytest.mark.asyncio()
 async def test_get_url_by_slug(
     async_session: AsyncSession,
@@ -83,6 +243,74 @@ async def test_get_url_by_slug_not_found(
     assert database_url is None
 
 
+@pytest.mark.asyncio()
+async def test_get_url_by_slug_without_relationships(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    async_session.expunge(url)
+
+    database_url: Url | None = await crud.get_url_by_slug(
+        async_session=async_session,
+        slug=url.slug,
+    )
+
+    assert database_url is not None
+    with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+        _ = database_url.tags
+
+
+@pytest.mark.asyncio()
+async def test_get_url_by_slug_with_options(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    async_session.add(Tag(url_id=url.id, name="name"))
+    await async_session.commit()
+    async_session.expunge(url)
+
+    database_url: Url | None = await crud.get_url_by_slug(
+        async_session=async_session,
+        slug=url.slug,
+        options=(selectinload(Url.tags),),
+    )
+
+    assert database_url is not None
+    assert [tag.name for tag in database_url.tags] == ["name"]
+
+
+@pytest.mark.asyncio()
+async def test_get_url_summary_by_slug(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    url_summary: UrlSummary | None = await crud.get_url_summary_by_slug(
+        async_session=async_session,
+        slug=url.slug,
+    )
+
+    assert url_summary == UrlSummary(
+        id=url.id,
+        source=url.source,
+        total_clicks=url.total_clicks,
+        redirect_status=url.redirect_status,
+        cache_max_age=url.cache_max_age,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_get_url_summary_by_slug_not_found(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    url_summary: UrlSummary | None = await crud.get_url_summary_by_slug(
+        async_session=async_session,
+        slug=url.slug[::-1],
+    )
+
+    assert url_summary is None
+
+
 @pytest.mark.asyncio()
 async def test_update_url(async_session: AsyncSession, url: Url) -> None:
     updated_source: str = url.source[::-1]
@@ -105,3 +333,175 @@ async def test_update_url(async_session: AsyncSession, url: Url) -> None:
     assert database_url.source == updated_source
     assert database_url.slug == updated_slug
     assert database_url.total_clicks == updated_total_clicks
+
+
+@pytest.mark.asyncio()
+async def test_update_url_invalidates_cache(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    previous_slug: str = url.slug
+    updated_slug: str = url.slug[::-1]
+    record: UrlRecord = UrlRecord(
+        id=url.id,
+        source=url.source,
+        redirect_status=url.redirect_status,
+        cache_max_age=url.cache_max_age,
+    )
+    url_cache.set(previous_slug, record)
+    url_cache.set(updated_slug, record)
+
+    await crud.update_url(
+        async_session=async_session,
+        url=url,
+        source=url.source,
+        slug=updated_slug,
+        total_clicks=url.total_clicks,
+    )
+
+    assert url_cache.get(previous_slug) is None
+    assert url_cache.get(updated_slug) is None
+
+
+@pytest.mark.asyncio()
+async def test_update_url_adds_slug_to_filter(
+    monkeypatch: pytest.MonkeyPatch,
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    slug_filter: slugs.SlugFilter = slugs.SlugFilter(
+        enabled=True,
+        capacity=1000,
+        false_positive_rate=0.001,
+        sync_interval=1.0,
+    )
+    await slug_filter.sync(async_session=async_session)
+    monkeypatch.setattr(slugs, "slug_filter", slug_filter)
+    updated_slug: str = url.slug[::-1]
+
+    await crud.update_url(
+        async_session=async_session,
+        url=url,
+        source=url.source,
+        slug=updated_slug,
+        total_clicks=url.total_clicks,
+    )
+
+    assert slug_filter.might_exist(updated_slug)
+
+
+@pytest.mark.asyncio()
+async def test_create_url_redirect_policy(async_session: AsyncSession) -> None:
+    url: Url = await crud.create_url(
+        async_session=async_session,
+        user_id=1,
+        source="https://example.com",
+        slug="permanent",
+        redirect_status=301,
+        cache_max_age=3600,
+    )
+
+    assert await crud.get_url_summary_by_slug(
+        async_session=async_session,
+        slug="permanent",
+    ) == UrlSummary(
+        id=url.id,
+        source="https://example.com",
+        total_clicks=0,
+        redirect_status=301,
+        cache_max_age=3600,
+    )
+
+
+@pytest.mark.asyncio()
+async def test_create_url_invalidates_missing_url_cache(
+    async_session: AsyncSession,
+) -> None:
+    missing_url_cache.set("created", True)  # noqa: FBT003
+
+    await crud.create_url(
+        async_session=async_session,
+        user_id=1,
+        source="https://example.com",
+        slug="created",
+    )
+
+    assert missing_url_cache.get("created") is None
+
+
+@pytest.mark.asyncio()
+async def test_create_urls_invalidates_missing_url_cache(
+    async_session: AsyncSession,
+) -> None:
+    missing_url_cache.set("created", True)  # noqa: FBT003
+
+    await crud.create_urls(
+        async_session=async_session,
+        urls=[
+            NewUrl(
+                user_id=1,
+                source="https://example.com",
+                slug="created",
+                tags=[],
+            ),
+        ],
+    )
+
+    assert missing_url_cache.get("created") is None
+
+
+@pytest.mark.asyncio()
+async def test_increment_total_clicks(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    other_url: Url = Url(user_id=1, source="https://example.com", slug="other")
+    async_session.add(other_url)
+    await async_session.commit()
+
+    await crud.increment_total_clicks(
+        async_session=async_session,
+        clicks={url.id: 3, other_url.id: 1},
+    )
+    await crud.increment_total_clicks(
+        async_session=async_session,
+        clicks={url.id: 2},
+    )
+
+    result: Result[tuple[int]] = await async_session.execute(
+        select(Url.total_clicks).order_by(Url.slug),
+    )
+    assert list(result.scalars().all()) == [5, 1]
+
+
+@pytest.mark.asyncio()
+async def test_increment_total_clicks_does_not_refresh(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    await crud.increment_total_clicks(
+        async_session=async_session,
+        clicks={url.id: 1},
+    )
+
+    assert url.total_clicks == 0
+
+
+@pytest.mark.asyncio()
+async def test_increment_total_clicks_without_commit(
+    async_session: AsyncSession,
+    url: Url,
+) -> None:
+    url_id: int = url.id
+
+    await crud.increment_total_clicks(
+        async_session=async_session,
+        clicks={url_id: 1},
+        commit=False,
+    )
+    await async_session.rollback()
+
+    result: Result[tuple[int]] = await async_session.execute(
+        select(Url.total_clicks).where(Url.id == url_id),
+    )
+    assert result.scalar_one() == 0
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.core.database.models import User
+from app.core.settings.data import Password
 
 
 @pytest.fixture(scope="module")
@@ -72,6 +73,24 @@ async def test_create_user(
     assert database_user.first_name == user.first_name
     assert database_user.last_name == user.last_name
     assert database_user.email == user.email
+    assert database_user.is_password_valid(password)
+
+
+@pytest.mark.asyncio()
+async def test_create_user_invalid_password(
+    async_session: AsyncSession,
+    first_name: str,
+    last_name: str,
+    email: str,
+) -> None:
+    with pytest.raises(ValueError, match=r"^Password length is invalid\.$"):
+        await crud.create_user(
+            async_session=async_session,
+            first_name=first_name,
+            last_name=last_name,
+            email=email,
+            password="1" * (Password.MIN_LENGTH - 1),
+        )
 
 
 @pytest.mark.asyncio()
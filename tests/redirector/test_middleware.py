@@ -0,0 +1,193 @@
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from fastapi import FastAPI, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import UrlRecord, missing_url_cache, url_cache
+from app.core.database import database
+from app.core.settings.data import Page
+from app.redirector import RedirectMiddleware, redirector
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+_HEADERS: tuple[str, ...] = ("cache-control", "content-length", "location")
+
+
+class _App:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+
+    async def __call__(
+        self,
+        scope: "Scope",
+        receive: "Receive",
+        send: "Send",
+    ) -> None:
+        self.paths.append(scope["path"])
+        await PlainTextResponse("passed")(scope, receive, send)
+
+
+@pytest.fixture(autouse=True)
+def urls() -> None:
+    url_cache.clear()
+    missing_url_cache.clear()
+    url_cache.set(
+        "temporary",
+        UrlRecord(
+            id=1,
+            source="https://example.com/a b?q=1",
+            redirect_status=status.HTTP_307_TEMPORARY_REDIRECT,
+            cache_max_age=None,
+        ),
+    )
+    url_cache.set(
+        "permanent",
+        UrlRecord(
+            id=2,
+            source="https://example.com",
+            redirect_status=status.HTTP_308_PERMANENT_REDIRECT,
+            cache_max_age=3600,
+        ),
+    )
+    missing_url_cache.set("missing", True)  # noqa: FBT003
+
+
+def _create_app(*, async_session: AsyncSession, enabled: bool) -> FastAPI:
+    async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+        yield async_session
+
+    app: FastAPI = FastAPI()
+    app.add_middleware(RedirectMiddleware, enabled=enabled)
+    app.include_router(redirector)
+    app.dependency_overrides[database.get_async_session] = get_async_session
+
+    return app
+
+
+async def _request(
+    app: "ASGIApp",
+    method: str,
+    path: str,
+) -> httpx.Response:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        return await client.request(method, path)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("GET", "/temporary"),
+        ("GET", "/permanent"),
+        ("GET", "/missing"),
+        ("GET", f"/{Page.NOT_FOUND.value}"),
+        ("POST", "/temporary"),
+    ],
+)
+async def test_redirect_middleware_same_as_route(
+    async_session: AsyncSession,
+    method: str,
+    path: str,
+) -> None:
+    fast: httpx.Response = await _request(
+        _create_app(async_session=async_session, enabled=True),
+        method,
+        path,
+    )
+    routed: httpx.Response = await _request(
+        _create_app(async_session=async_session, enabled=False),
+        method,
+        path,
+    )
+
+    assert fast.status_code == routed.status_code
+    assert [fast.headers.get(name) for name in _HEADERS] == [
+        routed.headers.get(name) for name in _HEADERS
+    ]
+    assert fast.content == routed.content
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("path", "status_code", "location"),
+    [
+        (
+            "/temporary",
+            status.HTTP_307_TEMPORARY_REDIRECT,
+            "https://example.com/a%20b?q=1",
+        ),
+        (
+            "/permanent",
+            status.HTTP_308_PERMANENT_REDIRECT,
+            "https://example.com",
+        ),
+        ("/missing", status.HTTP_307_TEMPORARY_REDIRECT, Page.NOT_FOUND.value),
+    ],
+)
+async def test_redirect_middleware(
+    path: str,
+    status_code: int,
+    location: str,
+) -> None:
+    app: _App = _App()
+
+    response: httpx.Response = await _request(
+        RedirectMiddleware(app),
+        "GET",
+        path,
+    )
+
+    assert response.status_code == status_code
+    assert response.headers["location"] == location
+    assert app.paths == []
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("POST", "/temporary"),
+        ("HEAD", "/temporary"),
+        ("GET", "/"),
+        ("GET", "/api/temporary"),
+        ("GET", "/temporary/"),
+        ("GET", "/invalid.slug"),
+        ("GET", f"/{Page.NOT_FOUND.value}"),
+    ],
+)
+async def test_redirect_middleware_passes_through(
+    method: str,
+    path: str,
+) -> None:
+    app: _App = _App()
+
+    response: httpx.Response = await _request(
+        RedirectMiddleware(app),
+        method,
+        path,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert app.paths == [path]
+
+
+@pytest.mark.asyncio()
+async def test_redirect_middleware_disabled() -> None:
+    app: _App = _App()
+
+    response: httpx.Response = await _request(
+        RedirectMiddleware(app, enabled=False),
+        "GET",
+        "/temporary",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert app.paths == ["/temporary"]
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.cache import UrlRecord, missing_url_cache, url_cache
+from app.core.database import Database
+from app.core.slugs import SlugFilter
+from app.core.slugs import filter as filter_module
+from app.redirector import resolver
+
+if TYPE_CHECKING:
+    from app.core.database.models import Url
+
+
+@pytest.fixture()
+def slug_filter(
+    database: Database,
+    monkeypatch: pytest.MonkeyPatch,
+) -> SlugFilter:
+    slug_filter: SlugFilter = SlugFilter(
+        enabled=True,
+        capacity=1000,
+        false_positive_rate=0.001,
+        sync_interval=1.0,
+        catch_up_interval=0,
+    )
+    monkeypatch.setattr(filter_module, "database", database)
+    monkeypatch.setattr(resolver, "slug_filter", slug_filter)
+    url_cache.clear()
+    missing_url_cache.clear()
+
+    return slug_filter
+
+
+@pytest.mark.asyncio()
+async def test_resolve_slug_with_lagging_filter(
+    async_session: AsyncSession,
+    slug_filter: SlugFilter,
+) -> None:
+    await slug_filter.sync(async_session=async_session)
+    url: Url = await crud.create_url(
+        async_session=async_session,
+        user_id=1,
+        source="https://example.com",
+        slug="elsewhere",
+    )
+
+    assert not slug_filter.might_exist("elsewhere")
+
+    record: UrlRecord | None = await resolver.resolve_slug(
+        async_session=async_session,
+        slug="elsewhere",
+    )
+
+    assert record is not None
+    assert record.id == url.id
+    assert slug_filter.might_exist("elsewhere")
+
+
+@pytest.mark.asyncio()
+async def test_resolve_slug_missing(
+    async_session: AsyncSession,
+    slug_filter: SlugFilter,
+) -> None:
+    await slug_filter.sync(async_session=async_session)
+
+    assert (
+        await resolver.resolve_slug(async_session=async_session, slug="nope")
+        is None
+    )
+    assert slug_filter.rejected == 1
+    assert missing_url_cache.get("nope") is None
+
+
+@pytest.mark.asyncio()
+async def test_resolve_slug_missing_before_sync(
+    async_session: AsyncSession,
+    slug_filter: SlugFilter,
+) -> None:
+    assert (
+        await resolver.resolve_slug(async_session=async_session, slug="nope")
+        is None
+    )
+    assert slug_filter.rejected == 0
+    assert missing_url_cache.get("nope")
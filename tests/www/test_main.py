@@ -0,0 +1,74 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.database import Database
+from app.crud.network import NetworkRange
+from www import __main__
+
+_NETWORK_RANGES: list[NetworkRange] = [
+    NetworkRange(start_address=0, end_address=255, country="es"),
+    NetworkRange(start_address=256, end_address=511, country="es"),
+]
+
+
+@pytest.fixture(autouse=True)
+def database(
+    database: Database,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Database:
+    monkeypatch.setattr(__main__, "database", database)
+
+    return database
+
+
+async def _read(
+    *,
+    error: Exception | None = None,
+) -> AsyncIterator[NetworkRange]:
+    for network_range in _NETWORK_RANGES:
+        yield network_range
+
+    if error is not None:
+        # Let the writer insert the ranges read so far first.
+        await asyncio.sleep(0.01)
+        raise error
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(("refresh"), [True, False])
+async def test_import_to_database(
+    async_session: AsyncSession,
+    refresh: bool,
+) -> None:
+    await __main__.import_to_database(
+        [_read()],
+        refresh=refresh,
+        concurrency=1,
+        batch_size=1,
+    )
+
+    assert (
+        await crud.get_network_ranges(async_session=async_session)
+        == _NETWORK_RANGES
+    )
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(("refresh"), [True, False])
+async def test_import_to_database_error(
+    async_session: AsyncSession,
+    refresh: bool,
+) -> None:
+    with pytest.raises(ExceptionGroup):
+        await __main__.import_to_database(
+            [_read(error=OSError("Download failed."))],
+            refresh=refresh,
+            concurrency=1,
+            batch_size=1,
+        )
+
+    assert await crud.get_network_ranges(async_session=async_session) == []
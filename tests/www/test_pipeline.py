@@ -0,0 +1,110 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.crud.network import NetworkRange
+from www.pipeline import run_pipeline
+
+
+def _network_range(start_address: int, /) -> NetworkRange:
+    return NetworkRange(
+        start_address=start_address,
+        end_address=start_address,
+        country="es",
+    )
+
+
+async def _read(start: int, stop: int) -> AsyncIterator[NetworkRange]:
+    for start_address in range(start, stop):
+        await asyncio.sleep(0)
+        yield _network_range(start_address)
+
+
+@pytest.mark.asyncio()
+async def test_run_pipeline() -> None:
+    batches: list[list[NetworkRange]] = []
+
+    async def write(batch: list[NetworkRange]) -> None:
+        batches.append(batch)
+
+    count: int = await run_pipeline(
+        [_read(0, 5), _read(5, 7), _read(7, 7)],
+        write=write,
+        concurrency=2,
+        batch_size=3,
+    )
+
+    assert count == 7  # noqa: PLR2004
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert sorted(
+        network_range for batch in batches for network_range in batch
+    ) == [_network_range(start_address) for start_address in range(7)]
+
+
+@pytest.mark.asyncio()
+async def test_run_pipeline_concurrency() -> None:
+    reading: int = 0
+    max_reading: int = 0
+
+    async def read() -> AsyncIterator[NetworkRange]:
+        nonlocal reading, max_reading
+        reading += 1
+        max_reading = max(max_reading, reading)
+        await asyncio.sleep(0.01)
+        yield _network_range(0)
+        reading -= 1
+
+    async def write(_: list[NetworkRange]) -> None:
+        pass
+
+    count: int = await run_pipeline(
+        [read() for _ in range(6)],
+        write=write,
+        concurrency=2,
+        batch_size=10,
+    )
+
+    assert count == 6  # noqa: PLR2004
+    assert max_reading == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_run_pipeline_source_error() -> None:
+    written: list[NetworkRange] = []
+
+    async def fail() -> AsyncIterator[NetworkRange]:
+        yield _network_range(0)
+        error_message: str = "Download failed."
+        raise OSError(error_message)
+
+    async def write(batch: list[NetworkRange]) -> None:
+        written.extend(batch)
+
+    with pytest.raises(ExceptionGroup) as error:
+        await run_pipeline(
+            [fail()],
+            write=write,
+            concurrency=1,
+            batch_size=10,
+        )
+
+    assert error.group_contains(OSError)
+    assert written == []
+
+
+@pytest.mark.asyncio()
+async def test_run_pipeline_write_error() -> None:
+    async def write(_: list[NetworkRange]) -> None:
+        error_message: str = "Write failed."
+        raise ValueError(error_message)
+
+    with pytest.raises(ExceptionGroup) as error:
+        await run_pipeline(
+            [_read(0, 100)],
+            write=write,
+            concurrency=1,
+            batch_size=10,
+        )
+
+    assert error.group_contains(ValueError)
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from app.crud.network import NetworkRange
+from www.read import list_network_files, read_network_ranges
+
+
+@pytest.fixture()
+def source(tmp_path: Path) -> Path:
+    (tmp_path / "ipv4").mkdir()
+    (tmp_path / "ipv4" / "es.cidr").write_text(
+        "10.0.0.0/8\ninvalid\n\n192.168.0.0/31\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "ipv4" / "ad.cidr").write_text("", encoding="utf-8")
+    (tmp_path / "ipv4" / "README.md").write_text("", encoding="utf-8")
+
+    return tmp_path
+
+
+def test_list_network_files(source: Path) -> None:
+    assert list_network_files(directory="ipv4", source=source) == [
+        source / "ipv4" / "ad.cidr",
+        source / "ipv4" / "es.cidr",
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_read_network_ranges(source: Path) -> None:
+    network_ranges: list[NetworkRange] = [
+        network_range
+        async for network_range in read_network_ranges(
+            source / "ipv4" / "es.cidr",
+        )
+    ]
+
+    assert network_ranges == [
+        NetworkRange(
+            start_address=10 << 24,
+            end_address=(11 << 24) - 1,
+            country="es",
+        ),
+        NetworkRange(
+            start_address=(192 << 24) + (168 << 16),
+            end_address=(192 << 24) + (168 << 16) + 1,
+            country="es",
+        ),
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_read_network_ranges_empty(source: Path) -> None:
+    assert [
+        network_range
+        async for network_range in read_network_ranges(
+            source / "ipv4" / "ad.cidr",
+        )
+    ] == []
@@ -1,49 +1,200 @@
+import argparse
 import asyncio
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterable
+from pathlib import Path
+from typing import Literal
 
 from httpx import AsyncClient, Timeout
 
+from app import crud
 from app.core.database import database
+from app.core.geo import write_geo_file
 from app.core.logger import logger
+from app.crud.network import NetworkChanges, NetworkRange
 
-from .fetch import fetch_download_urls, fetch_networks
+from .fetch import fetch_download_urls, fetch_network_ranges
+from .pipeline import run_pipeline
+from .read import list_network_files, read_network_ranges
 
-if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio import AsyncSession
+DIRECTORIES: tuple[Literal["ipv4", "ipv6"], ...] = ("ipv4", "ipv6")
 
-    from app.core.database.models import Network
 
+def parse_args() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m www",
+        description="Import per-country network lists.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=(
+            "compile the networks into a geo database file at this path "
+            "instead of writing them to the database"
+        ),
+    )
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=None,
+        help=(
+            "read the networks from a local copy of the repository instead "
+            "of downloading them"
+        ),
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help=(
+            "replace the networks in the database, writing only the ranges "
+            "that changed, instead of appending them"
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="the maximum number of lists read at once",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="the maximum number of networks per insert",
+    )
 
-async def main() -> None:
-    await database.create_tables(hard_reset=False)
-    async_session: AsyncSession = await anext(database.get_async_session())
+    return parser.parse_args()
+
+
+async def collect_sources(
+    *,
+    source: Path | None,
+    async_client: AsyncClient,
+) -> list[AsyncIterable[NetworkRange]]:
+    sources: list[AsyncIterable[NetworkRange]] = []
+
+    for directory in DIRECTORIES:
+        if source is not None:
+            paths: list[Path] = list_network_files(
+                directory=directory,
+                source=source,
+            )
+            logger.info(f"Found {len(paths)} {directory} files in {source}.")
+            sources.extend(map(read_network_ranges, paths))
+            continue
 
-    logger.info("Parsing network data from GitHub API.")
-    async with AsyncClient(timeout=Timeout(timeout=9, pool=60)) as async_client:
         download_urls: list[str] = await fetch_download_urls(
-            directory="ipv4",
+            directory=directory,
             async_client=async_client,
         )
-        logger.info(f"Found {len(download_urls)}/241 download URL's.")
-
-        results: list[list[Network]] = await asyncio.gather(
-            *[
-                fetch_networks(
-                    download_url=download_url,
-                    async_client=async_client,
-                )
-                for download_url in download_urls
-            ],
+        logger.info(f"Found {len(download_urls)}/241 {directory} URL's.")
+        sources.extend(
+            fetch_network_ranges(
+                download_url=download_url,
+                async_client=async_client,
+            )
+            for download_url in download_urls
+        )
+
+    return sources
+
+
+async def import_to_database(
+    sources: list[AsyncIterable[NetworkRange]],
+    /,
+    *,
+    refresh: bool,
+    concurrency: int,
+    batch_size: int,
+) -> None:
+    await database.create_tables(hard_reset=False)
+
+    # The whole import is one transaction, so a failed read leaves the
+    # networks as they were.
+    async with database.create_async_session() as async_session:
+
+        async def write(batch: list[NetworkRange]) -> None:
+            await crud.create_networks(
+                async_session=async_session,
+                network_ranges=batch,
+                staged=refresh,
+                commit=False,
+            )
+
+        if refresh:
+            await crud.clear_staged_networks(async_session=async_session)
+
+        count: int = await run_pipeline(
+            sources,
+            write=write,
+            concurrency=concurrency,
+            batch_size=batch_size,
         )
-        for networks in results:
-            async_session.add_all(networks)
+
+        if not refresh:
             await async_session.commit()
+            logger.info(f"Successfully imported {count} networks.")
+            return
+
+        network_changes: NetworkChanges = await crud.apply_staged_networks(
+            async_session=async_session,
+        )
+
+    logger.info(
+        f"Successfully refreshed {count} networks: "
+        f"{network_changes.inserted} inserted, "
+        f"{network_changes.deleted} deleted.",
+    )
+
+
+async def import_to_file(
+    sources: list[AsyncIterable[NetworkRange]],
+    /,
+    *,
+    output: Path,
+    concurrency: int,
+    batch_size: int,
+) -> None:
+    network_ranges: list[NetworkRange] = []
+
+    async def write(batch: list[NetworkRange]) -> None:
+        network_ranges.extend(batch)
+
+    await run_pipeline(
+        sources,
+        write=write,
+        concurrency=concurrency,
+        batch_size=batch_size,
+    )
 
-            logger.info(
-                f"Successfully processed {len(networks)} networks from "
-                f"{networks[0].country}.",
+    count: int = write_geo_file(output, network_ranges)
+    logger.info(f"Successfully compiled {count} networks into {output}.")
+
+
+async def main(args: argparse.Namespace, /) -> None:
+    async with AsyncClient(timeout=Timeout(timeout=9, pool=60)) as async_client:
+        sources: list[AsyncIterable[NetworkRange]] = await collect_sources(
+            source=args.source,
+            async_client=async_client,
+        )
+
+        if args.output is not None:
+            await import_to_file(
+                sources,
+                output=args.output,
+                concurrency=args.concurrency,
+                batch_size=args.batch_size,
             )
+        else:
+            await import_to_database(
+                sources,
+                refresh=args.refresh,
+                concurrency=args.concurrency,
+                batch_size=args.batch_size,
+            )
+
+    await database.shutdown()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(parse_args()))
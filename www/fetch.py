@@ -1,12 +1,13 @@
 """This module contains functions for fetching data from the repository."""
 
+from collections.abc import AsyncIterator
 from typing import Any, Literal
 
 from httpx import AsyncClient, Response
 
-from app.core.database.models import Network
+from app.crud.network import NetworkRange
 
-from .parse import parse_country, parse_download_url, parse_network
+from .parse import parse_country, parse_download_url, parse_network_range
 
 
 async def fetch_download_urls(
@@ -39,31 +40,35 @@ async def fetch_download_urls(
     return list(filter(None, map(parse_download_url, json)))
 
 
-async def fetch_networks(
+async def fetch_network_ranges(
     *,
     download_url: str,
     async_client: AsyncClient,
-) -> list[Network]:
-    """Fetch list of networks from a download URL.
+) -> AsyncIterator[NetworkRange]:
+    """Stream network ranges from a download URL line by line.
 
     Args:
-        download_url: The download URL to fetch networks from.
+        download_url: The download URL to fetch network ranges from.
         async_client: The async HTTP client to use.
 
-    Returns:
-        A list of networks.
+    Yields:
+        The network ranges that were parsed successfully.
+
+    Raises:
+        HTTPStatusError: If the download failed.
     """
-    response: Response = await async_client.get(download_url)
-
-    return list(
-        filter(
-            None,
-            [
-                parse_network(line, country=parse_country(download_url))
-                for line in response.text.splitlines()
-            ],
-        ),
-    )
+    country: str = parse_country(download_url)
+
+    async with async_client.stream("GET", download_url) as response:
+        response.raise_for_status()
+
+        async for line in response.aiter_lines():
+            network_range: NetworkRange | None = parse_network_range(
+                line,
+                country=country,
+            )
+            if network_range is not None:
+                yield network_range
 
 
-__all__ = ["fetch_download_urls", "fetch_networks"]
+__all__ = ["fetch_download_urls", "fetch_network_ranges"]
@@ -1,6 +1,9 @@
 """Module for parsing data from the Github API responses."""
 
-from app.core.database.models import Network
+from ipaddress import IPv4Network, IPv6Network, ip_network
+
+from app.core.settings.data import Country
+from app.crud.network import NetworkRange
 
 
 def parse_country(download_url: str, /) -> str:
@@ -34,26 +37,35 @@ def parse_download_url(content: object, /) -> str | None:
     return content["download_url"]
 
 
-def parse_network(line: str, /, *, country: str) -> Network | None:
-    """Parse a ` Network ` from a string.
+def parse_network_range(
+    line: str,
+    /,
+    *,
+    country: str,
+) -> NetworkRange | None:
+    """Parse a ` NetworkRange ` from a line in CIDR notation.
 
     Args:
-        line: The string to parse the ` Network ` from.
-        country: The country code of the ` Network `.
+        line: The string to parse the ` NetworkRange ` from.
+        country: The country code of the ` NetworkRange `.
 
     Returns:
-        The ` Network ` if parsed successfully, otherwise ` None `.
+        The ` NetworkRange ` if parsed successfully, otherwise ` None `.
     """
-    try:
-        address, mask = line.split("/")
-        return Network(
-            address=address,
-            mask=int(mask),
-            country=country,
-        )
+    if not Country.validate_length(country) or not country.isalpha():
+        return None
 
+    try:
+        network: IPv4Network | IPv6Network = ip_network(line.strip())
     except ValueError:
         return None
 
+    return NetworkRange(
+        start_address=int(network.network_address),
+        end_address=int(network.broadcast_address),
+        country=country,
+        version=network.version,
+    )
+
 
-__all__ = ["parse_country", "parse_download_url", "parse_network"]
+__all__ = ["parse_country", "parse_download_url", "parse_network_range"]
@@ -0,0 +1,89 @@
+"""This module contains the streaming import pipeline."""
+
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+
+from app.crud.network import NetworkRange
+
+type Write = Callable[[list[NetworkRange]], Awaitable[None]]
+"""Callback that persists a batch of network ranges."""
+
+
+async def run_pipeline(
+    sources: Iterable[AsyncIterable[NetworkRange]],
+    /,
+    *,
+    write: Write,
+    concurrency: int,
+    batch_size: int,
+) -> int:
+    """Stream network ranges from many sources into batched writes.
+
+    At most ` concurrency ` sources are read at once. Sources are read into a
+    bounded queue drained by a single writer, so memory use does not grow
+    with the size of the dataset. The first error of a source or a write
+    cancels the rest of the pipeline and is raised in an ` ExceptionGroup `.
+
+    Args:
+        sources: The sources of network ranges, consumed lazily.
+        write: The callback that persists a batch of network ranges.
+        concurrency: The maximum number of sources read at once.
+        batch_size: The maximum number of network ranges per write.
+
+    Returns:
+        The number of network ranges written.
+    """
+    queue: asyncio.Queue[NetworkRange | None] = asyncio.Queue(
+        maxsize=batch_size * 2,
+    )
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    async def read(source: AsyncIterable[NetworkRange]) -> None:
+        async with semaphore:
+            async for network_range in source:
+                await queue.put(network_range)
+
+    async def read_all() -> None:
+        async with asyncio.TaskGroup() as task_group:
+            for source in sources:
+                task_group.create_task(read(source))
+
+        await queue.put(None)
+
+    async with asyncio.TaskGroup() as task_group:
+        task_group.create_task(read_all())
+        count: int = await _write_all(
+            queue,
+            write=write,
+            batch_size=batch_size,
+        )
+
+    return count
+
+
+async def _write_all(
+    queue: asyncio.Queue[NetworkRange | None],
+    /,
+    *,
+    write: Write,
+    batch_size: int,
+) -> int:
+    count: int = 0
+    batch: list[NetworkRange] = []
+
+    while (network_range := await queue.get()) is not None:
+        batch.append(network_range)
+
+        if len(batch) >= batch_size:
+            await write(batch)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        await write(batch)
+        count += len(batch)
+
+    return count
+
+
+__all__ = ["run_pipeline"]
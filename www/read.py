@@ -0,0 +1,65 @@
+"""This module contains functions for reading data from a local directory."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Literal, TextIO
+
+from app.crud.network import NetworkRange
+
+from .parse import parse_country, parse_network_range
+
+_READ_SIZE_HINT: int = 1 << 16
+
+
+def list_network_files(
+    *,
+    directory: Literal["ipv4", "ipv6"],
+    source: Path,
+) -> list[Path]:
+    """List the IP block list files of a local copy of the repository.
+
+    The files are expected in the same layout as in the repository, e.g.
+    ` ipv4/es.cidr `.
+
+    Args:
+        directory: The directory to list files from.
+        source: The root of the local copy.
+
+    Returns:
+        A sorted list of IP block list files.
+    """
+    return sorted((source / directory).glob("*.cidr"))
+
+
+async def read_network_ranges(path: Path, /) -> AsyncIterator[NetworkRange]:
+    """Stream network ranges from a local IP block list file.
+
+    The file is read in chunks off the event loop.
+
+    Args:
+        path: The IP block list file.
+
+    Yields:
+        The network ranges that were parsed successfully.
+    """
+    country: str = parse_country(path.name)
+
+    file: TextIO = await asyncio.to_thread(path.open, encoding="utf-8")
+    try:
+        while lines := await asyncio.to_thread(
+            file.readlines,
+            _READ_SIZE_HINT,
+        ):
+            for line in lines:
+                network_range: NetworkRange | None = parse_network_range(
+                    line,
+                    country=country,
+                )
+                if network_range is not None:
+                    yield network_range
+    finally:
+        await asyncio.to_thread(file.close)
+
+
+__all__ = ["list_network_files", "read_network_ranges"]